@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+# Never persist session secrets into a capture directory
+_REDACTED_HEADERS = {"cookie", "set-cookie", "authorization"}
+
+
+@dataclass
+class CapturedResponse:
+    """Response replayed from disk; quacks like httpx/curl_cffi responses."""
+
+    status_code: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    json_data: Any = None
+
+    def json(self) -> Any:
+        if self.json_data is not None:
+            return self.json_data
+        return json.loads(self.text)
+
+
+def _capture_key(url: str) -> str:
+    """Host-independent key, so captures replay against any base URL."""
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def _clean_headers(headers) -> dict[str, str]:
+    return {
+        k.lower(): v for k, v in dict(headers or {}).items()
+        if k.lower() not in _REDACTED_HEADERS
+    }
+
+
+class TrafficRecorder:
+    """Save every exchange as a numbered JSON file in *directory*."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._seq = len(list(self.directory.glob("*.json")))
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        request_headers,
+        response,
+        elapsed: float,
+    ) -> None:
+        entry = {
+            "method": method.upper(),
+            "url": url,
+            "request": {"headers": _clean_headers(request_headers)},
+            "response": {
+                "status_code": response.status_code,
+                "headers": _clean_headers(response.headers),
+                "body": response.text,
+            },
+            "elapsed": round(elapsed, 6),
+            "recordedAt": time.time(),
+        }
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        path = self.directory / f"{seq:05d}-{method.lower()}.json"
+        path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+
+
+class TrafficReplayer:
+    """Serve recorded exchanges back, matched by method and URL path/query.
+
+    Repeated requests for the same URL get the recorded responses in order,
+    sticking to the last one.  When nothing was recorded for a URL the
+    legacy fixture convention (``<method>_<path>.json`` holding
+    ``{"status_code", "body"}``) is tried, and finally a 404 is returned.
+    """
+
+    def __init__(self, directory: str | Path, realtime: bool = False):
+        self.directory = Path(directory)
+        self.realtime = realtime
+        self._lock = threading.Lock()
+        self._exact: dict[tuple[str, str], list[CapturedResponse]] = {}
+        self._by_path: dict[tuple[str, str], list[CapturedResponse]] = {}
+        self._cursor: dict[tuple[str, tuple[str, str]], int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, ValueError):
+                continue
+            if not isinstance(entry, dict) or "url" not in entry:
+                continue  # legacy fixture, resolved lazily by name
+            resp = entry.get("response", {})
+            captured = CapturedResponse(
+                status_code=resp.get("status_code", 200),
+                text=resp.get("body", ""),
+                headers=resp.get("headers", {}),
+                elapsed=entry.get("elapsed", 0.0),
+            )
+            method = entry.get("method", "GET").upper()
+            key = _capture_key(entry["url"])
+            self._exact.setdefault((method, key), []).append(captured)
+            self._by_path.setdefault((method, key.split("?")[0]), []).append(captured)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._exact.values())
+
+    def lookup(self, method: str, url: str) -> CapturedResponse:
+        method = method.upper()
+        key = _capture_key(url)
+        for name, index, k in (
+            ("exact", self._exact, (method, key)),
+            ("path", self._by_path, (method, key.split("?")[0])),
+        ):
+            responses = index.get(k)
+            if responses:
+                # Exact and by-path keys coincide for query-less URLs; each
+                # index keeps its own position in its own list.
+                with self._lock:
+                    i = self._cursor.get((name, k), 0)
+                    self._cursor[name, k] = i + 1
+                resp = responses[min(i, len(responses) - 1)]
+                if self.realtime and resp.elapsed:
+                    time.sleep(resp.elapsed)
+                return resp
+        return self._lookup_fixture(method, key.split("?")[0])
+
+    def _lookup_fixture(self, method: str, path: str) -> CapturedResponse:
+        filename = f"{method.lower()}_{path.strip('/').replace('/', '_')}.json"
+        fixture_file = self.directory / filename
+        if not fixture_file.exists():
+            return CapturedResponse(status_code=404, text="Not Found")
+        with open(fixture_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return CapturedResponse(
+            status_code=data.get("status_code", 200),
+            text=json.dumps(data.get("body", {}), ensure_ascii=False),
+            json_data=data.get("body"),
+        )
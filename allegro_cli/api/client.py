@@ -2,22 +2,36 @@ from __future__ import annotations
 
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
 from urllib.parse import urlencode
 
 import httpx
+from curl_cffi import CurlError
 from curl_cffi.requests import Session as CffiSession
 
+from allegro_cli.api.capture import CapturedResponse, TrafficRecorder, TrafficReplayer
 from allegro_cli.api.models import (
     AllegroCliError,
     AuthenticationError,
     OfferNotFoundError,
     RateLimitError,
     ScraperError,
+    CartChange,
     CartError,
     Offer,
+    OfferBatch,
 )
 from allegro_cli.config import Config
 
+if TYPE_CHECKING:
+    from allegro_cli.cache import OfferCache
+    from allegro_cli.local_store import LocalStore
+    from allegro_cli.state import StateStore
+
+# Items per changeQuantityCommand request in bulk cart updates
+CART_CHUNK_SIZE = 25
+
 _COMMON_HEADERS = {
     "origin": "https://allegro.pl",
     "referer": "https://allegro.pl/",
@@ -35,10 +49,76 @@ _COMMON_HEADERS = {
 }
 
 
+def _cart_item_ids(cart) -> dict[str, str]:
+    """Offer ID -> cart item UUID for every item in a cart snapshot."""
+    ids: dict[str, str] = {}
+    cart_data = cart.get("cart") if isinstance(cart, dict) else None
+    groups = cart_data.get("groups") if isinstance(cart_data, dict) else None
+    for group in groups if isinstance(groups, list) else []:
+        items = group.get("items") if isinstance(group, dict) else None
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict) or not item.get("id"):
+                continue
+            offers = item.get("offers")
+            for offer in offers if isinstance(offers, list) else []:
+                if isinstance(offer, dict) and offer.get("id"):
+                    ids[str(offer["id"])] = item["id"]
+    return ids
+
+
+def _cart_state(resp) -> dict | None:
+    """The cart snapshot carried by a mutation response, if it has one."""
+    if resp.status_code == 204 or not resp.text:
+        return None
+    try:
+        data = resp.json()
+    except ValueError:
+        return None
+    if isinstance(data, dict) and isinstance(data.get("cart"), dict):
+        return data
+    return None
+
+
+# Network failures below the HTTP layer (resets, timeouts, DNS): worth a
+# retry in long-running loops, unlike AuthenticationError
+TRANSPORT_ERRORS = (httpx.TransportError, CurlError)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package (``allegro-cli[http2]``)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class AllegroClient:
-    def __init__(self, config: Config, verbose: bool = False):
+    def __init__(
+        self,
+        config: Config,
+        verbose: bool = False,
+        record_dir: str | None = None,
+        replay_dir: str | None = None,
+        replay_realtime: bool = False,
+        offer_cache: OfferCache | None = None,
+        local_store: LocalStore | None = None,
+        state_store: StateStore | None = None,
+    ):
         self._config = config
+        self._offer_cache = offer_cache
+        self._local_store = local_store
+        self._state_store = state_store
+        # Body hash of the latest response per edge GET path
+        self._body_hashes: dict[str, str] = {}
         self._verbose = verbose
+        self._scrape_base = config.scrapeBaseUrl.rstrip("/")
+
+        # Traffic capture: record real exchanges, or serve them back offline
+        self._recorder = TrafficRecorder(record_dir) if record_dir else None
+        self._replayer = (
+            TrafficReplayer(replay_dir, realtime=replay_realtime) if replay_dir else None
+        )
 
         # Edge client for cart/packages — only when cookies are present
         self._edge: httpx.Client | None = None
@@ -48,6 +128,7 @@ class AllegroClient:
                 base_url=config.edgeBaseUrl,
                 headers={**_COMMON_HEADERS, "cookie": config.cookies},
                 timeout=30.0,
+                http2=_http2_available(),
             )
             # curl_cffi session — impersonates Chrome TLS fingerprint to pass Cloudflare
             self._web = CffiSession(impersonate="chrome")
@@ -70,25 +151,129 @@ class AllegroClient:
         location: str | None = None,
         pay: bool = False,
         filters: list[str] | None = None,
+        pages: int = 1,
     ) -> list[Offer]:
-        if not self._config.cookies:
+        return list(self.iter_search(
+            phrase,
+            page=page,
+            category=category,
+            sort=sort,
+            price_min=price_min,
+            price_max=price_max,
+            seller=seller,
+            condition=condition,
+            smart=smart,
+            delivery_time=delivery_time,
+            location=location,
+            pay=pay,
+            filters=filters,
+            pages=pages,
+        ))
+
+    def iter_search(self, phrase: str, **kwargs) -> Iterator[Offer]:
+        """Yield offers page by page, starting at *page*, for up to *pages* pages.
+
+        Offers from a page are yielded as soon as that page is parsed, so
+        consumers can start work after the first fetch.  Takes the same
+        arguments as ``iter_search_pages``.
+        """
+        for offers in self.iter_search_pages(phrase, **kwargs):
+            yield from offers
+
+    def iter_search_pages(self, phrase: str, **kwargs) -> Iterator[list[Offer]]:
+        """Yield the offers of each results page, starting at *page*, for up
+        to *pages* pages.  Stops early when a page has no offers; a consumer
+        that stops iterating fetches no further pages.  Takes the same
+        arguments as ``scrape_search``.
+        """
+        from allegro_cli.scraper import parse_search_results
+
+        for html in self._search_pages(phrase, **kwargs):
+            offers = parse_search_results(html)
+            if not offers:
+                return
+            self._remember_offers(offers)
+            yield offers
+
+    def search_batch(self, phrase: str, **kwargs) -> OfferBatch:
+        """All offers of a (multi-page) search as one ``OfferBatch``.
+
+        Each page is parsed straight into the batch's columns, so no ``Offer``
+        is kept per result.  Takes the same arguments as ``scrape_search``.
+        """
+        from allegro_cli.scraper import parse_search_results_into
+
+        batch = OfferBatch()
+        for html in self._search_pages(phrase, **kwargs):
+            start = len(batch)
+            if not parse_search_results_into(html, batch):
+                break
+            if self._offer_cache or self._local_store:
+                self._remember_offers([batch[i] for i in range(start, len(batch))])
+        return batch
+
+    def _search_pages(
+        self,
+        phrase: str,
+        page: int = 1,
+        category: str | None = None,
+        sort: str | None = None,
+        price_min: str | None = None,
+        price_max: str | None = None,
+        seller: str | None = None,
+        condition: list[str] | None = None,
+        smart: bool = False,
+        delivery_time: str | None = None,
+        location: str | None = None,
+        pay: bool = False,
+        filters: list[str] | None = None,
+        pages: int = 1,
+    ) -> Iterator[str]:
+        """HTML of each results page, fetched only when the consumer asks for it."""
+        if not self._config.cookies and self._replayer is None:
             raise AuthenticationError(
                 "No cookies configured. Scrape requires browser cookies.\n"
                 "Run: allegro login"
             )
 
-        from allegro_cli.scraper import parse_search_results
+        for p in range(page, page + pages):
+            yield self._fetch_page(self._search_url(
+                phrase, p, category, sort, price_min, price_max, seller,
+                condition, smart, delivery_time, location, pay, filters,
+            ))
+
+    def _remember_offers(self, offers: list[Offer]) -> None:
+        if self._offer_cache:
+            self._offer_cache.remember_sellers(offers)
+        if self._local_store:
+            self._local_store.upsert_offers(offers)
 
+    def _search_url(
+        self,
+        phrase: str,
+        page: int,
+        category: str | None,
+        sort: str | None,
+        price_min: str | None,
+        price_max: str | None,
+        seller: str | None,
+        condition: list[str] | None,
+        smart: bool,
+        delivery_time: str | None,
+        location: str | None,
+        pay: bool,
+        filters: list[str] | None,
+    ) -> str:
         if seller:
-            base_url = f"https://allegro.pl/uzytkownik/{seller}"
+            base_url = f"{self._scrape_base}/uzytkownik/{seller}"
         elif category:
             cat_match = re.search(r"(\d+)$", category)
             if cat_match:
-                base_url = f"https://allegro.pl/kategoria/-{cat_match.group(1)}"
+                base_url = f"{self._scrape_base}/kategoria/-{cat_match.group(1)}"
             else:
-                base_url = f"https://allegro.pl/kategoria/{category}"
+                base_url = f"{self._scrape_base}/kategoria/{category}"
         else:
-            base_url = "https://allegro.pl/listing"
+            base_url = f"{self._scrape_base}/listing"
 
         # Use a list of tuples to support multiple values for the same key (e.g. stan=nowe&stan=used)
         params: list[tuple[str, str]] = [("string", phrase)]
@@ -117,44 +302,131 @@ class AllegroClient:
                     k, v = f.split("=", 1)
                     params.append((k, v))
 
-        full_url = base_url + "?" + urlencode(params)
-
-        html = self._fetch_page(full_url)
-        return parse_search_results(html)
+        return base_url + "?" + urlencode(params)
 
     def scrape_offer(self, offer_id: str) -> Offer:
-        """Fetch and parse a single offer page by ID."""
-        if not self._config.cookies:
-            raise AuthenticationError(
-                "No cookies configured. Scrape requires browser cookies.\n"
-                "Run: allegro login"
-            )
+        """Fetch and parse a single offer page by ID.
+
+        With an offer cache, a cached offer is returned without any request
+        while its price and parameters are within their TTLs.  Not when
+        recording: a capture must contain the page.
+        """
+        cache = self._offer_cache
+        entry = cache.get(offer_id) if cache else None
+        now = time.time()
+        if entry and not self._recorder and cache.is_fresh(entry, now):
+            self._log(f"Offer {offer_id} from cache")
+            return entry.offer
+
         from allegro_cli.scraper import (
             extract_lazy_contexts,
             parse_offer_page,
         )
-        url = f"https://allegro.pl/oferta/-{offer_id}"
-        try:
-            html = self._fetch_page(url)
-        except AllegroCliError as e:
-            if e.code == "NotFoundException":
-                raise OfferNotFoundError(offer_id)
-            raise e
-            
+        url, html = self._fetch_offer_html(offer_id)
+
+        digest = None
+        params_fresh = bool(entry) and cache.params_fresh(entry, now)
+        if cache:
+            from allegro_cli.cache import content_hash
+            digest = content_hash(html)
+            if entry and entry.contentHash == digest and params_fresh:
+                # Same page as last time: the parsed offer is still valid
+                cache.touch(offer_id, now)
+                return entry.offer
+
         offer = parse_offer_page(html, offer_id=offer_id)
         if not offer:
             raise OfferNotFoundError(offer_id)
- 
+
+        params_at = now
         # If we only got a few params, try lazy loading the rest
         if len(offer.parameters) < 15:
-            contexts = extract_lazy_contexts(html)
-            if contexts:
-                lazy_params = self._fetch_lazy_parameters(url, contexts)
-                for k, v in lazy_params.items():
+            if params_fresh:
+                for k, v in entry.offer.parameters.items():
                     offer.parameters.setdefault(k, v)
- 
+                params_at = entry.paramsAt
+            else:
+                contexts = extract_lazy_contexts(html)
+                if contexts:
+                    lazy_params = self._fetch_lazy_parameters(url, contexts)
+                    for k, v in lazy_params.items():
+                        offer.parameters.setdefault(k, v)
+
+        if cache:
+            cache.put(offer_id, offer, digest, price_at=now, params_at=params_at)
+            cache.remember_sellers([offer])
+        if self._local_store:
+            self._local_store.upsert_offers([offer])
         return offer
 
+    def check_price(self, offer_id: str) -> dict[str, str]:
+        """Current ``amount``, ``currency`` and ``availability`` of an offer.
+
+        Lighter than ``scrape_offer``: the values come from the page's meta
+        tags, with no DOM parse and no lazy parameter requests.  Only a page
+        without the price meta tag is parsed in full.
+        """
+        from allegro_cli.scraper import extract_price, extract_seller_id, parse_offer_page
+
+        _, html = self._fetch_offer_html(offer_id)
+        price = extract_price(html)
+        if not price["amount"]:
+            price["amount"] = parse_offer_page(html, offer_id).sellingMode.price.amount
+        price["currency"] = price["currency"] or "PLN"
+        if self._offer_cache:
+            seller_id = extract_seller_id(html)
+            if seller_id:
+                self._offer_cache.remember_seller(offer_id, seller_id)
+        return price
+
+    def resolve_seller(self, offer_id: str) -> tuple[str, str | None]:
+        """Return ``(seller_id, category_id)`` for an offer as cheaply as possible.
+
+        Answered from the offer-seller index when the offer was seen in an
+        earlier search or lookup; otherwise the offer page is fetched and only
+        the seller ID is read from it (no DOM parse, no lazy requests).
+        """
+        cache = self._offer_cache
+        if cache:
+            known = cache.seller_of(offer_id)
+            if known:
+                self._log(f"Seller of {offer_id} from index")
+                return known
+
+        from allegro_cli.scraper import extract_seller_id
+        _, html = self._fetch_offer_html(offer_id)
+        seller_id = extract_seller_id(html)
+        if not seller_id:
+            raise ScraperError(f"Could not find seller of offer {offer_id}", path="sellerId")
+        if cache:
+            cache.remember_seller(offer_id, seller_id)
+        return seller_id, None
+
+    def resolve_sellers(
+        self, offer_ids: list[str], workers: int = 8,
+    ) -> dict[str, tuple[str, str | None]]:
+        """``resolve_seller`` for many offers; index misses are fetched concurrently."""
+        unique = list(dict.fromkeys(offer_ids))
+        if len(unique) <= 1:
+            return {oid: self.resolve_seller(oid) for oid in unique}
+        # curl_cffi keeps one curl handle per thread, so the session can be shared
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(self.resolve_seller, unique)))
+
+    def _fetch_offer_html(self, offer_id: str) -> tuple[str, str]:
+        if not self._config.cookies and self._replayer is None:
+            raise AuthenticationError(
+                "No cookies configured. Scrape requires browser cookies.\n"
+                "Run: allegro login"
+            )
+        url = f"{self._scrape_base}/oferta/-{offer_id}"
+        try:
+            return url, self._fetch_page(url)
+        except AllegroCliError as e:
+            if e.code == "NotFoundException":
+                raise OfferNotFoundError(offer_id)
+            raise e
+
     def _fetch_lazy_parameters(
         self, offer_url: str, contexts: list[dict],
     ) -> dict[str, str]:
@@ -167,7 +439,7 @@ class AllegroClient:
             lazy_url = f"{offer_url}?lazyContext={ctx['value']}"
             self._log(f"GET {lazy_url} (lazy params)")
             try:
-                resp = self._web.get(
+                resp = self._web_get(
                     lazy_url,
                     headers={
                         "Accept": "application/vnd.opbox-web.subtree+json",
@@ -191,10 +463,10 @@ class AllegroClient:
 
     def _fetch_page(self, url: str) -> str:
         # Try direct curl_cffi first
-        if self._web:
+        if self._web or self._replayer is not None:
             self._log(f"GET {url} (direct)")
             t0 = time.monotonic()
-            resp = self._web.get(url, timeout=30)
+            resp = self._web_get(url, timeout=30)
             elapsed = time.monotonic() - t0
             self._log(f"Response: {resp.status_code} ({elapsed:.1f}s)")
  
@@ -210,6 +482,9 @@ class AllegroClient:
                     userMessage="Access denied by Allegro's anti-bot system. Please refresh your cookies using 'allegro login'.",
                 )
  
+            if resp.status_code == 429:
+                raise RateLimitError(message="Too many requests (429)")
+ 
             if resp.status_code == 404:
                 # We don't know the ID here, but the caller can wrap this
                 raise AllegroCliError(
@@ -230,6 +505,16 @@ class AllegroClient:
             userMessage="Internal error: Web client is not available.",
         )
 
+    def _web_get(self, url: str, headers: dict | None = None, timeout: float = 30):
+        """Single GET through curl_cffi, subject to record/replay."""
+        if self._replayer is not None:
+            return self._replayer.lookup("GET", url)
+        t0 = time.monotonic()
+        resp = self._web.get(url, headers=headers, timeout=timeout)
+        if self._recorder:
+            self._recorder.record("GET", url, headers, resp, time.monotonic() - t0)
+        return resp
+
     # --- Cart (edge.allegro.pl, cookie auth) ---
 
     def _require_edge(self) -> httpx.Client:
@@ -240,12 +525,61 @@ class AllegroClient:
             )
         return self._edge
 
-    def get_cart(self) -> dict:
+    def get_cart(self, since: str | None = None) -> dict | None:
+        """Fetch the cart.
+
+        With *since* (a ``body_hash`` from an earlier call), returns None
+        without parsing when the cart has not changed.
+        """
         resp = self._request(
             "GET", "/carts",
             accept="application/vnd.allegro.internal.v6+json",
         )
-        return resp.json()
+        if since is not None and since == self.body_hash("/carts"):
+            return None
+        cart = resp.json()
+        self._remember_cart(cart)
+        return cart
+
+    @property
+    def offer_cache(self) -> OfferCache | None:
+        return self._offer_cache
+
+    @property
+    def state(self) -> StateStore | None:
+        """Snapshots, watch history and saved searches, opened on first use.
+
+        None while replaying a recording, so a replay never rewrites them.
+        """
+        if self._state_store is None and self._replayer is None:
+            from allegro_cli.state import StateStore
+            self._state_store = StateStore()
+        return self._state_store
+
+    def body_hash(self, path: str) -> str | None:
+        """Hash of the latest body received for an edge GET *path*."""
+        return self._body_hashes.get(path)
+
+    def _remember_cart(self, cart: dict) -> None:
+        if self._offer_cache:
+            self._offer_cache.save_cart_items(_cart_item_ids(cart))
+
+    def resolve_cart_items(self, offer_ids: list[str], refresh: bool = False) -> dict[str, str]:
+        """Map offer IDs to cart item UUIDs.
+
+        Uses the map saved from the last cart snapshot and fetches the cart
+        only when an offer is missing from it (or *refresh* is set).
+        """
+        known = {} if refresh or not self._offer_cache else self._offer_cache.cart_item_ids(offer_ids)
+        if len(known) < len(set(offer_ids)):
+            known = _cart_item_ids(self.get_cart())
+        missing = [oid for oid in offer_ids if oid not in known]
+        if missing:
+            raise CartError(
+                f"Offer {', '.join(missing)} not found in cart",
+                code="CartItemNotFoundException",
+            )
+        return {oid: known[oid] for oid in offer_ids}
 
     def change_cart_quantity(
         self,
@@ -254,33 +588,50 @@ class AllegroClient:
         seller_id: str,
         nav_category_id: str | None = None,
     ) -> None:
-        body = {
-            "items": [
-                {
-                    "itemId": item_id,
-                    "delta": delta,
-                    "sellerId": seller_id,
-                    **({"navCategoryId": nav_category_id} if nav_category_id else {}),
-                    "navTree": "navigation-pl",
-                }
-            ]
-        }
-        self._request(
-            "POST",
-            "/carts/changeQuantityCommand",
-            json=body,
-            accept="application/vnd.allegro.public.v5+json",
-            content_type="application/vnd.allegro.public.v5+json",
-        )
+        self.change_cart_quantities([
+            CartChange(itemId=item_id, delta=delta, sellerId=seller_id, navCategoryId=nav_category_id),
+        ])
+
+    def change_cart_quantities(
+        self, changes: list[CartChange], chunk_size: int = CART_CHUNK_SIZE,
+    ) -> dict | None:
+        """Apply many quantity changes, *chunk_size* items per request.
+
+        Returns the cart snapshot from the last response when the API
+        includes one, so callers can skip a ``get_cart`` round trip.
+        """
+        state = None
+        for start in range(0, len(changes), chunk_size):
+            chunk = changes[start:start + chunk_size]
+            resp = self._request(
+                "POST",
+                "/carts/changeQuantityCommand",
+                json={"items": [c.to_dict() for c in chunk]},
+                accept="application/vnd.allegro.public.v5+json",
+                content_type="application/vnd.allegro.public.v5+json",
+            )
+            state = _cart_state(resp)
+        if state is not None:
+            self._remember_cart(state)
+        return state
 
     def remove_cart_item(self, item_id: str) -> None:
         """Completely remove an item from the cart using its unique item ID."""
-        self._request(
+        self.remove_cart_items([item_id])
+
+    def remove_cart_items(self, item_ids: list[str]) -> dict | None:
+        """Remove several items in one DELETE; returns the cart state if sent back."""
+        resp = self._request(
             "DELETE",
-            f"/cart/items?ids={item_id}",
+            f"/cart/items?ids={','.join(item_ids)}",
             accept="application/vnd.allegro.internal.v1+json",
         )
-
+        state = _cart_state(resp)
+        if state is not None:
+            self._remember_cart(state)
+        elif self._offer_cache:
+            self._offer_cache.forget_cart_items(item_ids)
+        return state
 
     # --- Packages / delivery ---
 
@@ -291,12 +642,28 @@ class AllegroClient:
         )
         return resp.json()
 
-    def get_packages_list(self) -> list[dict]:
-        """Fetch the detailed list of current packages."""
+    def get_packages(self) -> tuple[dict, list[dict]]:
+        """Packages summary and list, requested concurrently.
+
+        httpx clients are thread-safe, so both requests share the connection
+        pool (and one connection when HTTP/2 is negotiated).
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            summary = pool.submit(self.get_packages_summary)
+            packages = pool.submit(self.get_packages_list)
+            return summary.result(), packages.result()
+
+    def get_packages_list(self, since: str | None = None) -> list[dict] | None:
+        """Fetch the detailed list of current packages.
+
+        *since* works as in ``get_cart``.
+        """
         resp = self._request(
             "GET", "/packages",
             accept="application/vnd.allegro.internal.v1+json",
         )
+        if since is not None and since == self.body_hash("/packages"):
+            return None
         data = resp.json()
         return data.get("packages", [])
 
@@ -310,12 +677,23 @@ class AllegroClient:
         content_type: str | None = None,
         **kwargs,
     ) -> httpx.Response:
-        edge = self._require_edge()
         headers = {"accept": accept}
         if content_type:
             headers["content-type"] = content_type
- 
-        resp = edge.request(method, path, headers=headers, **kwargs)
+
+        validators = None
+        if method == "GET" and self._offer_cache:
+            validators = self._offer_cache.validators(path)
+            if validators and validators.etag:
+                headers["if-none-match"] = validators.etag
+            if validators and validators.lastModified:
+                headers["if-modified-since"] = validators.lastModified
+
+        resp = self._edge_send(method, path, headers, **kwargs)
+        if resp.status_code == 304 and validators:
+            # Not modified: serve the body we stored with the validators
+            self._body_hashes[path] = validators.bodyHash
+            return CapturedResponse(status_code=200, text=validators.body)
         if self._verbose:
             print(f"DEBUG: {method} {path} -> {resp.status_code}")
             print(f"DEBUG Response: {resp.text}")
@@ -326,6 +704,8 @@ class AllegroClient:
                 message="Forbidden (403)",
                 userMessage="Access denied. Your session cookies may have expired.",
             )
+        if resp.status_code == 429:
+            raise RateLimitError(message="Too many requests (429)")
         if resp.status_code >= 400 and resp.status_code != 204:
             # Check if it's a cart-related endpoint
             if "/cart" in path or "/carts" in path:
@@ -338,6 +718,37 @@ class AllegroClient:
                 code="ApiException",
                 userMessage=f"Allegro API error ({resp.status_code}).",
             )
+        if method == "GET" and resp.status_code == 200:
+            self._keep_validators(path, resp, validators)
+        return resp
+
+    def _keep_validators(self, path: str, resp, previous) -> None:
+        from allegro_cli.cache import Validators, content_hash
+
+        digest = content_hash(resp.text)
+        self._body_hashes[path] = digest
+        if not self._offer_cache:
+            return
+        current = Validators(
+            etag=resp.headers.get("etag"),
+            lastModified=resp.headers.get("last-modified"),
+            bodyHash=digest,
+            body=resp.text,
+        )
+        if current != previous:
+            self._offer_cache.save_validators(path, current)
+
+    def _edge_send(self, method: str, path: str, headers: dict, **kwargs):
+        """Single edge API request through httpx, subject to record/replay."""
+        if self._replayer is not None:
+            return self._replayer.lookup(method, path)
+        edge = self._require_edge()
+        t0 = time.monotonic()
+        resp = edge.request(method, path, headers=headers, **kwargs)
+        if self._recorder:
+            self._recorder.record(
+                method, str(resp.request.url), headers, resp, time.monotonic() - t0,
+            )
         return resp
 
     def _log(self, msg: str) -> None:
@@ -1,53 +1,100 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
 
 
 # --- Data models (Allegro REST API conventions) ---
 
-@dataclass
+def price_minor(amount: str) -> int | None:
+    """``"12.50"`` -> ``1250`` (grosze); None when *amount* is not a number."""
+    # Scraped amounts are plain "1234.56"; skip Decimal for those
+    whole, _, frac = amount.partition(".")
+    if whole.isdigit() and len(frac) <= 2 and (not frac or frac.isdigit()):
+        return int(whole) * 100 + int(frac.ljust(2, "0"))
+    try:
+        return int((Decimal(amount) * 100).to_integral_value())
+    except (InvalidOperation, ValueError):
+        return None
+
+
+@dataclass(slots=True)
 class Price:
     amount: str
     currency: str = "PLN"
+    # Parsed once from amount; the string stays the output format
+    amountMinor: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.amountMinor is None and self.amount:
+            self.amountMinor = price_minor(self.amount)
 
+    def to_dict(self) -> dict:
+        return {"amount": self.amount, "currency": self.currency, "amountMinor": self.amountMinor}
 
-@dataclass
+
+@dataclass(slots=True)
 class Seller:
     id: str
     name: str
 
+    def to_dict(self) -> dict:
+        return {"id": self.id, "name": self.name}
+
 
-@dataclass
+@dataclass(slots=True)
 class Category:
     id: str
     name: str | None = None
 
+    def to_dict(self) -> dict:
+        return {"id": self.id, "name": self.name}
+
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     url: str
 
+    def to_dict(self) -> dict:
+        return {"url": self.url}
 
-@dataclass
+
+@dataclass(slots=True)
 class SellingMode:
     format: str  # BUY_NOW, AUCTION, ADVERTISEMENT
     price: Price
     popularity: int | None = None
 
+    def to_dict(self) -> dict:
+        return {
+            "format": self.format,
+            "price": self.price.to_dict(),
+            "popularity": self.popularity,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryInfo:
     lowestPrice: Price | None = None
     availableForFree: bool = False
 
+    def to_dict(self) -> dict:
+        return {
+            "lowestPrice": self.lowestPrice.to_dict() if self.lowestPrice else None,
+            "availableForFree": self.availableForFree,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class Stock:
     unit: str = "UNIT"
     available: int = 0
 
+    def to_dict(self) -> dict:
+        return {"unit": self.unit, "available": self.available}
 
-@dataclass
+
+@dataclass(slots=True)
 class Offer:
     id: str
     name: str
@@ -59,6 +106,189 @@ class Offer:
     stock: Stock | None = None
     parameters: dict[str, str] = field(default_factory=dict)
 
+    def to_dict(self) -> dict:
+        """Same result as ``dataclasses.asdict`` without its generic deep copy."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "seller": self.seller.to_dict(),
+            "sellingMode": self.sellingMode.to_dict(),
+            "category": self.category.to_dict(),
+            "images": [img.to_dict() for img in self.images],
+            "delivery": self.delivery.to_dict() if self.delivery else None,
+            "stock": self.stock.to_dict() if self.stock else None,
+            "parameters": dict(self.parameters),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Offer:
+        """Rebuild an Offer from ``to_dict()`` output."""
+        mode = data["sellingMode"]
+        delivery = data.get("delivery")
+        stock = data.get("stock")
+        lowest = delivery.get("lowestPrice") if delivery else None
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            seller=Seller(**data["seller"]),
+            sellingMode=SellingMode(
+                format=mode["format"],
+                price=Price(**mode["price"]),
+                popularity=mode.get("popularity"),
+            ),
+            category=Category(**data["category"]),
+            images=[Image(**img) for img in data.get("images", [])],
+            delivery=DeliveryInfo(
+                lowestPrice=Price(**lowest) if lowest else None,
+                availableForFree=delivery.get("availableForFree", False),
+            ) if delivery else None,
+            stock=Stock(**stock) if stock else None,
+            parameters=dict(data.get("parameters", {})),
+        )
+
+
+@dataclass(slots=True)
+class CartChange:
+    """One entry of a ``changeQuantityCommand`` request."""
+
+    itemId: str
+    delta: int = 1
+    sellerId: str = ""
+    navCategoryId: str | None = None
+
+    def to_dict(self) -> dict:
+        item = {"itemId": self.itemId, "delta": self.delta, "sellerId": self.sellerId}
+        if self.navCategoryId:
+            item["navCategoryId"] = self.navCategoryId
+        item["navTree"] = "navigation-pl"
+        return item
+
+
+class OfferBatch:
+    """Columnar container for large result sets: one list per field.
+
+    Holds the fields search results actually carry (no delivery/stock), so
+    100k offers cost a handful of lists instead of 100k object graphs.
+    Iterating materialises ``Offer`` objects on demand.
+    """
+
+    __slots__ = (
+        "ids", "names", "seller_ids", "seller_names", "formats",
+        "price_amounts", "price_minors", "currencies", "category_ids", "category_names",
+        "images", "parameters",
+    )
+
+    # Dotted column name -> attribute holding that column
+    COLUMNS = {
+        "id": "ids",
+        "name": "names",
+        "seller.id": "seller_ids",
+        "seller.name": "seller_names",
+        "sellingMode.format": "formats",
+        "sellingMode.price.amount": "price_amounts",
+        "sellingMode.price.amountMinor": "price_minors",
+        "sellingMode.price.currency": "currencies",
+        "category.id": "category_ids",
+        "category.name": "category_names",
+    }
+
+    def __init__(self, offers=()):
+        for name in self.__slots__:
+            setattr(self, name, [])
+        self.extend(offers)
+
+    def add(
+        self,
+        id: str,
+        name: str,
+        price: Price,
+        seller_id: str = "",
+        seller_name: str = "",
+        format: str = "BUY_NOW",
+        category_id: str = "",
+        category_name: str | None = None,
+        image_urls: tuple[str, ...] = (),
+        parameters: dict[str, str] | None = None,
+    ) -> None:
+        """Append one row from its fields, without building an ``Offer``."""
+        self.ids.append(id)
+        self.names.append(name)
+        self.seller_ids.append(seller_id)
+        self.seller_names.append(seller_name)
+        self.formats.append(format)
+        self.price_amounts.append(price.amount)
+        self.price_minors.append(price.amountMinor)
+        self.currencies.append(price.currency)
+        self.category_ids.append(category_id)
+        self.category_names.append(category_name)
+        self.images.append(tuple(image_urls))
+        # Most listing offers have no parameters; share one empty dict
+        self.parameters.append(parameters or _NO_PARAMETERS)
+
+    def append(self, offer: Offer) -> None:
+        self.add(
+            offer.id, offer.name, offer.sellingMode.price,
+            seller_id=offer.seller.id,
+            seller_name=offer.seller.name,
+            format=offer.sellingMode.format,
+            category_id=offer.category.id,
+            category_name=offer.category.name,
+            image_urls=tuple(img.url for img in offer.images),
+            parameters=offer.parameters,
+        )
+
+    def extend(self, offers) -> None:
+        for offer in offers:
+            self.append(offer)
+
+    @property
+    def image_urls(self) -> list[str]:
+        """First image of each offer, ``""`` when it has none."""
+        return [urls[0] if urls else "" for urls in self.images]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> Offer:
+        return Offer(
+            id=self.ids[i],
+            name=self.names[i],
+            seller=Seller(id=self.seller_ids[i], name=self.seller_names[i]),
+            sellingMode=SellingMode(
+                format=self.formats[i],
+                price=Price(
+                    amount=self.price_amounts[i],
+                    currency=self.currencies[i],
+                    amountMinor=self.price_minors[i],
+                ),
+            ),
+            category=Category(id=self.category_ids[i], name=self.category_names[i]),
+            images=[Image(url=url) for url in self.images[i]],
+            parameters=dict(self.parameters[i]),
+        )
+
+    def __iter__(self):
+        for i in range(len(self.ids)):
+            yield self[i]
+
+    def column(self, key: str) -> list:
+        """Values of a dotted column, e.g. ``sellingMode.price.amount``.
+
+        Raises KeyError for columns the batch does not store.
+        """
+        attr = self.COLUMNS.get(key)
+        if attr:
+            return getattr(self, attr)
+        if key == "parameters":
+            return self.parameters
+        if key.startswith("parameters."):
+            name = key[len("parameters."):]
+            return [p.get(name, "") for p in self.parameters]
+        raise KeyError(key)
+
+
+_NO_PARAMETERS: dict[str, str] = {}
+
 
 # --- Exceptions ---
 
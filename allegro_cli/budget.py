@@ -0,0 +1,282 @@
+"""Fit structured output into an agent's context budget.
+
+``--max-tokens`` / ``--max-bytes`` shrink a list of records until its
+compact JSON encoding fits.  Cuts are made in order of least value to the
+reader:
+
+1. parameters outside ``--param-keys`` (when given),
+2. the remaining parameters, rarest across records first,
+3. titles, trimmed in steps down to ``_MIN_TITLE`` characters,
+4. whole records from the end of the list (results keep Allegro's ranking).
+
+Everything that was cut is listed in the ``budget`` report that is written
+next to the records, so the agent knows to ask again with a narrower query.
+Tokens are estimated as UTF-8 bytes / ``BYTES_PER_TOKEN``; that is close
+enough for Polish text and needs no tokenizer.
+"""
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from allegro_cli.api.models import AllegroCliError
+
+BYTES_PER_TOKEN = 4
+
+BUDGET_FORMATS = ("json", "msgpack", "ndjson")
+
+_TITLE_STEPS = (120, 80, 60, 40)
+_MIN_TITLE = _TITLE_STEPS[-1]
+
+# Room left for the envelope and the report itself
+_RESERVE_BYTES = 320
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _size(obj: Any) -> int:
+    return len(_dumps(obj).encode("utf-8"))
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text.encode("utf-8")) // BYTES_PER_TOKEN)
+
+
+def budget_bytes(args) -> int | None:
+    """Byte budget from ``--max-bytes`` / ``--max-tokens``; the tighter wins."""
+    limits = []
+    if getattr(args, "max_bytes", None):
+        limits.append(args.max_bytes)
+    if getattr(args, "max_tokens", None):
+        limits.append(args.max_tokens * BYTES_PER_TOKEN)
+    return min(limits) if limits else None
+
+
+def is_active(args) -> bool:
+    return budget_bytes(args) is not None or getattr(args, "tabular", False)
+
+
+def check_format(args) -> None:
+    if is_active(args) and args.format not in BUDGET_FORMATS:
+        raise AllegroCliError(
+            message=f"--max-tokens/--max-bytes/--tabular do not support --format {args.format}",
+            code="UnsupportedFormatException",
+            userMessage="Budgeted and tabular output need --format json, msgpack or ndjson.",
+        )
+
+
+def trim_title(title: str, limit: int) -> str:
+    """Cut *title* to at most *limit* characters, on a word boundary if possible."""
+    if len(title) <= limit:
+        return title
+    cut = title[:limit - 1]
+    space = cut.rfind(" ")
+    if space > limit // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,;-") + "…"
+
+
+def tabulate(records: list[dict]) -> dict:
+    """Encode records as ``{"columns": [...], "rows": [[...], ...]}``.
+
+    Keys are stated once; a record missing a column gets ``null``.
+    """
+    columns: dict[str, None] = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key, None)
+    keys = list(columns)
+    return {"columns": keys, "rows": [[r.get(k) for k in keys] for r in records]}
+
+
+@dataclass
+class BudgetReport:
+    budgetBytes: int | None
+    bytes: int = 0
+    estimatedTokens: int = 0
+    itemsTotal: int = 0
+    itemsKept: int = 0
+    titlesTrimmed: int = 0
+    parametersDropped: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "budgetBytes": self.budgetBytes,
+            "bytes": self.bytes,
+            "estimatedTokens": self.estimatedTokens,
+            "itemsTotal": self.itemsTotal,
+            "itemsKept": self.itemsKept,
+            "itemsDropped": self.itemsTotal - self.itemsKept,
+            "titlesTrimmed": self.titlesTrimmed,
+            "parametersDropped": self.parametersDropped,
+        }
+
+
+class _Fitter:
+    """Tracks per-record encoded sizes so each cut re-measures one record."""
+
+    def __init__(self, records: list[dict], limit: int, tabular: bool):
+        self.records = records
+        self.limit = limit
+        self.tabular = tabular
+        self.columns = tabulate(records)["columns"] if tabular else None
+        self.sizes = [self._measure(r) for r in records]
+
+    def _measure(self, record: dict) -> int:
+        if self.tabular:
+            return _size([record.get(k) for k in self.columns])
+        return _size(record)
+
+    def update(self, i: int) -> None:
+        self.sizes[i] = self._measure(self.records[i])
+
+    def total(self) -> int:
+        header = _size(self.columns) if self.tabular else 0
+        return header + sum(self.sizes) + len(self.sizes)
+
+    def fits(self) -> bool:
+        return self.total() <= self.limit
+
+
+def _drop_parameter(fitter: _Fitter, key: str) -> None:
+    for i, record in enumerate(fitter.records):
+        params = record.get("parameters")
+        if isinstance(params, dict) and key in params:
+            del params[key]
+            fitter.update(i)
+
+
+def _parameter_ranking(records: list[dict]) -> list[str]:
+    """Parameter keys, the first one being the cheapest loss."""
+    frequency: Counter[str] = Counter()
+    weight: Counter[str] = Counter()
+    for record in records:
+        params = record.get("parameters")
+        if isinstance(params, dict):
+            for key, value in params.items():
+                frequency[key] += 1
+                weight[key] += len(key) + len(str(value))
+    return sorted(frequency, key=lambda k: (frequency[k], -weight[k]))
+
+
+def fit_records(
+    records: list[dict],
+    max_bytes: int | None,
+    keep_params: list[str] | None = None,
+    tabular: bool = False,
+    min_items: int = 1,
+    reserve: int = _RESERVE_BYTES,
+) -> tuple[list[dict], BudgetReport]:
+    """Return copies of *records* shrunk to fit *max_bytes*, and the report.
+
+    *reserve* bytes of the budget are kept free for whatever wraps the
+    records (envelope keys, the report).
+    """
+    records = [
+        {**r, "parameters": dict(r["parameters"])} if isinstance(r.get("parameters"), dict) else dict(r)
+        for r in records
+    ]
+    report = BudgetReport(budgetBytes=max_bytes, itemsTotal=len(records))
+    dropped: list[str] = []
+
+    if keep_params is not None:
+        keep = set(keep_params)
+        for record in records:
+            params = record.get("parameters")
+            if isinstance(params, dict):
+                for key in [k for k in params if k not in keep]:
+                    del params[key]
+                    if key not in dropped:
+                        dropped.append(key)
+
+    if max_bytes is not None:
+        fitter = _Fitter(records, max_bytes - reserve, tabular)
+
+        for key in _parameter_ranking(records):
+            if fitter.fits():
+                break
+            _drop_parameter(fitter, key)
+            dropped.append(key)
+
+        trimmed: set[int] = set()
+        for limit in _TITLE_STEPS:
+            if fitter.fits():
+                break
+            for i, record in enumerate(records):
+                name = record.get("name")
+                if isinstance(name, str) and len(name) > limit:
+                    record["name"] = trim_title(name, limit)
+                    trimmed.add(i)
+                    fitter.update(i)
+
+        while not fitter.fits() and len(records) > min_items:
+            records.pop()
+            fitter.sizes.pop()
+        report.titlesTrimmed = len([i for i in trimmed if i < len(records)])
+
+    report.itemsKept = len(records)
+    report.parametersDropped = dropped
+    return records, report
+
+
+def shape(
+    records: list[dict],
+    args,
+    key: str = "items",
+    extra: dict | None = None,
+) -> tuple[dict, BudgetReport]:
+    """Fit *records* to the CLI budget and build the output envelope.
+
+    The envelope is ``{**extra, key: records-or-table, "budget": report}``.
+    """
+    keep = getattr(args, "param_keys", None)
+    keep_params = [k.strip() for k in keep.split(",") if k.strip()] if keep else None
+    tabular = getattr(args, "tabular", False)
+    limit = budget_bytes(args)
+
+    reserve = _RESERVE_BYTES + (_size(extra) if extra else 0)
+    while True:
+        kept, report = fit_records(records, limit, keep_params, tabular, reserve=reserve)
+        envelope = dict(extra or {})
+        envelope[key] = tabulate(kept) if tabular else kept
+        # The report states the envelope's own size; settle it in two passes
+        for _ in range(2):
+            envelope["budget"] = report.to_dict()
+            report.bytes = _size(envelope)
+            report.estimatedTokens = -(-report.bytes // BYTES_PER_TOKEN)
+        envelope["budget"] = report.to_dict()
+        # A long parametersDropped list can outgrow the reserve; refit with more room
+        if limit is None or report.bytes <= limit or report.itemsKept <= 1:
+            return envelope, report
+        reserve += report.bytes - limit
+
+
+def output_budgeted(
+    records: list[dict],
+    args,
+    key: str = "items",
+    extra: dict | None = None,
+    file=None,
+) -> None:
+    """Write budget-fitted *records* in ``args.format`` (json, msgpack or ndjson)."""
+    from allegro_cli.output import output_document, output_ndjson
+
+    envelope, _ = shape(records, args, key=key, extra=extra)
+    if args.format != "ndjson":
+        output_document(envelope, args.format, file)
+        return
+    # NDJSON: optional extra/columns header, one line per record, report last
+    body = envelope.pop(key)
+    report = envelope.pop("budget")
+    lines: list[Any] = [envelope] if envelope else []
+    if isinstance(body, dict):
+        lines.append({"columns": body["columns"]})
+        lines.extend(body["rows"])
+    else:
+        lines.extend(body)
+    lines.append({"budget": report})
+    output_ndjson(lines, file)
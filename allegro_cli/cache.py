@@ -0,0 +1,245 @@
+"""On-disk cache of parsed offers, keyed by offer ID.
+
+Each row stores the ``Offer`` as compact JSON together with a hash of the
+page it was parsed from and two fetch clocks:
+
+- ``priceAt`` -- when price and availability were last confirmed
+  (short TTL, prices change during the day),
+- ``paramsAt`` -- when everything else (parameters, seller, category) was
+  last confirmed (long TTL, those rarely change).
+
+``AllegroClient.scrape_offer`` returns an entry without any request when
+both clocks are fresh.  Otherwise the page is
+fetched again; if its hash is unchanged the cached offer is reused without
+re-parsing, and fresh parameters spare the lazy opbox requests.
+
+A second table maps offer IDs to seller (and category) IDs; it is filled
+from every search and offer lookup and backs ``AllegroClient.resolve_seller``.
+A third one holds the offer -> cart item UUID map of the last cart snapshot,
+so ``cart remove`` need not fetch the cart first.  Edge API GETs keep their
+validators (ETag / Last-Modified and a body hash) for conditional requests.
+
+Everything here can be fetched again, so ``--no-cache`` simply goes without
+it; state that cannot (saved searches, watch history) lives in
+``allegro_cli.state``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from allegro_cli import config as config_module
+from allegro_cli.api.models import Offer
+
+DEFAULT_PRICE_TTL = 15 * 60
+DEFAULT_PARAMS_TTL = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS offers (
+    offer_id     TEXT PRIMARY KEY,
+    data         TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    price_at     REAL NOT NULL,
+    params_at    REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS offer_sellers (
+    offer_id    TEXT PRIMARY KEY,
+    seller_id   TEXT NOT NULL,
+    category_id TEXT
+);
+CREATE TABLE IF NOT EXISTS cart_items (
+    offer_id TEXT PRIMARY KEY,
+    item_id  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS http_validators (
+    path          TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    body_hash     TEXT NOT NULL,
+    body          TEXT NOT NULL
+);
+"""
+
+
+def default_cache_path() -> Path:
+    # Resolved per call so a relocated CONFIG_DIR (e.g. in tests) is honored
+    return config_module.CONFIG_DIR / "offers.sqlite"
+
+
+def content_hash(html: str) -> str:
+    return hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class Validators:
+    etag: str | None
+    lastModified: str | None
+    bodyHash: str
+    body: str
+
+
+@dataclass
+class CachedOffer:
+    offer: Offer
+    contentHash: str
+    priceAt: float
+    paramsAt: float
+
+
+class OfferCache:
+    """SQLite-backed store of parsed offers with per-field TTLs."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        price_ttl: float = DEFAULT_PRICE_TTL,
+        params_ttl: float = DEFAULT_PARAMS_TTL,
+    ):
+        self.path = Path(path) if path else default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.price_ttl = price_ttl
+        self.params_ttl = params_ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    @classmethod
+    def from_config(cls, config) -> OfferCache:
+        return cls(
+            price_ttl=config.offerPriceTtl,
+            params_ttl=config.offerParamsTtl,
+        )
+
+    def get(self, offer_id: str) -> CachedOffer | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, content_hash, price_at, params_at FROM offers WHERE offer_id = ?",
+                (offer_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        data, digest, price_at, params_at = row
+        return CachedOffer(Offer.from_dict(json.loads(data)), digest, price_at, params_at)
+
+    def put(
+        self,
+        offer_id: str,
+        offer: Offer,
+        digest: str,
+        price_at: float | None = None,
+        params_at: float | None = None,
+    ) -> None:
+        now = time.time()
+        data = json.dumps(offer.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO offers VALUES (?, ?, ?, ?, ?)",
+                (offer_id, data, digest, price_at or now, params_at or now),
+            )
+            self._db.commit()
+
+    def touch(self, offer_id: str, price_at: float) -> None:
+        """Mark the price as re-confirmed (the page did not change)."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE offers SET price_at = ? WHERE offer_id = ?", (price_at, offer_id),
+            )
+            self._db.commit()
+
+    def is_fresh(self, entry: CachedOffer, now: float | None = None) -> bool:
+        """Whether both the price and the parameters are within their TTLs."""
+        now = time.time() if now is None else now
+        return now - entry.priceAt <= self.price_ttl and self.params_fresh(entry, now)
+
+    def params_fresh(self, entry: CachedOffer, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return now - entry.paramsAt <= self.params_ttl
+
+    # --- Offer -> seller index ---
+    # An offer never changes seller, so entries do not expire.  Search
+    # results fill it for free, which lets ``cart add`` skip the offer page.
+
+    def remember_sellers(self, offers) -> None:
+        self._remember([
+            (o.id, o.seller.id, o.category.id or None)
+            for o in offers if o.id and o.seller.id
+        ])
+
+    def remember_seller(self, offer_id: str, seller_id: str, category_id: str | None = None) -> None:
+        self._remember([(offer_id, seller_id, category_id or None)])
+
+    def _remember(self, rows: list[tuple[str, str, str | None]]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            self._db.executemany(
+                "INSERT INTO offer_sellers VALUES (?, ?, ?) ON CONFLICT(offer_id) DO UPDATE "
+                "SET seller_id = excluded.seller_id, "
+                "category_id = COALESCE(excluded.category_id, category_id)",
+                rows,
+            )
+            self._db.commit()
+
+    def seller_of(self, offer_id: str) -> tuple[str, str | None] | None:
+        """``(seller_id, category_id)`` for *offer_id*, if it has been seen."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT seller_id, category_id FROM offer_sellers WHERE offer_id = ?",
+                (offer_id,),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    # --- Offer -> cart item UUID map of the last cart snapshot ---
+
+    def save_cart_items(self, mapping: dict[str, str]) -> None:
+        """Replace the map with the one from a fresh cart snapshot."""
+        with self._lock:
+            self._db.execute("DELETE FROM cart_items")
+            self._db.executemany("INSERT INTO cart_items VALUES (?, ?)", mapping.items())
+            self._db.commit()
+
+    def cart_item_ids(self, offer_ids: list[str]) -> dict[str, str]:
+        if not offer_ids:
+            return {}
+        marks = ",".join("?" * len(offer_ids))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT offer_id, item_id FROM cart_items WHERE offer_id IN ({marks})",
+                offer_ids,
+            ).fetchall()
+        return dict(rows)
+
+    def forget_cart_items(self, item_ids: list[str]) -> None:
+        with self._lock:
+            self._db.executemany(
+                "DELETE FROM cart_items WHERE item_id = ?", [(i,) for i in item_ids],
+            )
+            self._db.commit()
+
+    # --- Conditional GET validators ---
+
+    def validators(self, path: str) -> Validators | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, body_hash, body FROM http_validators WHERE path = ?",
+                (path,),
+            ).fetchone()
+        return Validators(*row) if row else None
+
+    def save_validators(self, path: str, validators: Validators) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO http_validators VALUES (?, ?, ?, ?, ?)",
+                (path, validators.etag, validators.lastModified, validators.bodyHash, validators.body),
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import dataclasses
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.api.models import AllegroCliError
+from allegro_cli.config import Config
+from allegro_cli.output import DOCUMENT_FORMATS, output_document
+
+
+class _TimedClient(AllegroClient):
+    """AllegroClient that accounts wall and CPU time spent in HTTP calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.net_wall = 0.0
+        self.net_cpu = 0.0
+
+    def _timed(self, fn, *args, **kwargs):
+        w0, c0 = time.perf_counter(), time.thread_time()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.net_wall += time.perf_counter() - w0
+            self.net_cpu += time.thread_time() - c0
+
+    def _web_get(self, url, headers=None, timeout=30):
+        return self._timed(super()._web_get, url, headers=headers, timeout=timeout)
+
+    def _edge_send(self, method, path, headers, **kwargs):
+        return self._timed(super()._edge_send, method, path, headers, **kwargs)
+
+
+@dataclasses.dataclass
+class _WorkerResult:
+    latencies: dict[str, list[float]]
+    errors: dict[str, int]
+    cpu_total: float = 0.0
+    cpu_network: float = 0.0
+    wall_network: float = 0.0
+
+
+def _peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _percentiles(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+    if len(values) == 1:
+        q = [values[0]] * 99
+    else:
+        q = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "p50_ms": round(q[49] * 1000, 2),
+        "p95_ms": round(q[94] * 1000, 2),
+        "p99_ms": round(q[98] * 1000, 2),
+    }
+
+
+def _worker(
+    seed: int,
+    make_client,
+    phrases: list[str],
+    offer_ids: list[str],
+    search_ratio: float,
+    deadline: float,
+    budget: list[int],
+    budget_lock: threading.Lock,
+) -> _WorkerResult:
+    rng = random.Random(seed)
+    client = make_client()
+    result = _WorkerResult(latencies={"search": [], "offer": []}, errors={})
+    cpu0 = time.thread_time()
+
+    while time.monotonic() < deadline:
+        with budget_lock:
+            if budget[0] == 0:
+                break
+            budget[0] -= 1
+        op = "search" if rng.random() < search_ratio else "offer"
+        t0 = time.perf_counter()
+        try:
+            if op == "search":
+                client.scrape_search(rng.choice(phrases))
+            else:
+                client.scrape_offer(rng.choice(offer_ids))
+        except Exception as exc:
+            # Transport errors (curl/httpx) are failures too, not a reason to stop
+            code = exc.code if isinstance(exc, AllegroCliError) else type(exc).__name__
+            result.errors[code] = result.errors.get(code, 0) + 1
+            continue
+        result.latencies[op].append(time.perf_counter() - t0)
+
+    result.cpu_total = time.thread_time() - cpu0
+    result.cpu_network = client.net_cpu
+    result.wall_network = client.net_wall
+    return result
+
+
+def handle_bench(args, config: Config) -> int:
+    server = None
+    client_kwargs: dict = {}
+    if args.replay:
+        client_kwargs = {"replay_dir": args.replay, "replay_realtime": args.replay_realtime}
+        target = f"replay:{args.replay}"
+    elif args.standin or args.target:
+        if args.standin:
+            try:
+                from benchmarks.standin import StandinOptions, StandinServer
+            except ImportError:
+                raise AllegroCliError(
+                    message="benchmarks.standin is not importable",
+                    code="BenchConfigException",
+                    userMessage="--standin needs a source checkout (run from the repository root); "
+                                "use --replay DIR or --target URL otherwise.",
+                )
+            server = StandinServer(args.standin, StandinOptions(latency=args.latency))
+            url = server.start()
+        else:
+            url = args.target.rstrip("/")
+        config = dataclasses.replace(
+            config,
+            cookies=config.cookies or "bench=1",
+            edgeBaseUrl=url,
+            scrapeBaseUrl=url,
+        )
+        target = url
+    else:
+        raise AllegroCliError(
+            message="No benchmark target given",
+            code="BenchConfigException",
+            userMessage="Pass --replay DIR, --standin FIXTURES or --target URL; "
+                        "benchmarking against allegro.pl itself is not supported.",
+        )
+
+    def make_client() -> _TimedClient:
+        return _TimedClient(config, verbose=args.verbose, **client_kwargs)
+
+    phrases = args.phrase or ["laptop"]
+    offer_ids = args.offer_id or ["12345678"]
+    budget = [args.requests if args.requests else -1]
+    budget_lock = threading.Lock()
+
+    try:
+        t0 = time.perf_counter()
+        deadline = time.monotonic() + args.duration
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = [
+                pool.submit(
+                    _worker, i, make_client, phrases, offer_ids,
+                    args.search_ratio, deadline, budget, budget_lock,
+                )
+                for i in range(args.concurrency)
+            ]
+            results = [f.result() for f in futures]
+        wall = time.perf_counter() - t0
+    finally:
+        if server:
+            server.stop()
+
+    searches = [x for r in results for x in r.latencies["search"]]
+    offers = [x for r in results for x in r.latencies["offer"]]
+    errors: dict[str, int] = {}
+    for r in results:
+        for code, n in r.errors.items():
+            errors[code] = errors.get(code, 0) + n
+    cpu_total = sum(r.cpu_total for r in results)
+    cpu_network = sum(r.cpu_network for r in results)
+
+    report = {
+        "target": target,
+        "concurrency": args.concurrency,
+        "durationSeconds": round(wall, 3),
+        "requests": len(searches) + len(offers),
+        "throughputPerSecond": round((len(searches) + len(offers)) / wall, 2) if wall else 0.0,
+        "search": {"count": len(searches), **_percentiles(searches)},
+        "offer": {"count": len(offers), **_percentiles(offers)},
+        "all": _percentiles(searches + offers),
+        "errors": errors,
+        "cpu": {
+            "networkSeconds": round(cpu_network, 3),
+            "parseSeconds": round(cpu_total - cpu_network, 3),
+            "networkWallSeconds": round(sum(r.wall_network for r in results), 3),
+        },
+        "peakRssMiB": _peak_rss_mib(),
+    }
+
+    if args.format in DOCUMENT_FORMATS:
+        output_document(report, args.format)
+        return 0
+
+    print(f"Target:            {report['target']}")
+    print(f"Concurrency:       {report['concurrency']}")
+    print(f"Duration:          {report['durationSeconds']} s")
+    print(f"Requests:          {report['requests']} "
+          f"(search {len(searches)}, offer {len(offers)})")
+    print(f"Throughput:        {report['throughputPerSecond']} req/s")
+    for label in ("search", "offer", "all"):
+        p = report[label]
+        print(f"Latency {label:<7}    p50 {p['p50_ms']} ms | "
+              f"p95 {p['p95_ms']} ms | p99 {p['p99_ms']} ms")
+    print(f"CPU network:       {report['cpu']['networkSeconds']} s")
+    print(f"CPU parsing/other: {report['cpu']['parseSeconds']} s")
+    print(f"Peak RSS:          {report['peakRssMiB']} MiB")
+    if errors:
+        print("Errors:            " + ", ".join(f"{k}={v}" for k, v in errors.items()))
+    return 0
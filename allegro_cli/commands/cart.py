@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import csv
+import json
+
+from allegro_cli import budget, delta
 from allegro_cli.api.client import AllegroClient
-from allegro_cli.output import output_json, output_text, output_tsv
+from allegro_cli.api.models import CartChange, CartError
+from allegro_cli.output import (
+    DOCUMENT_FORMATS, output_document, output_ndjson, output_text, output_tsv,
+)
 
 _CART_COLUMNS = [
     "selected",
@@ -93,13 +100,22 @@ def _flatten_cart_items(cart: dict) -> list[dict]:
     return rows
 
 
-def _output_cart(cart: dict, fmt: str) -> None:
-    if fmt == "json":
-        output_json(cart)
+def _output_cart(cart: dict, args) -> None:
+    fmt = args.format
+    if budget.is_active(args):
+        prices = cart.get("cart", {}).get("prices") if isinstance(cart, dict) else None
+        extra = {"total": prices} if prices else None
+        budget.output_budgeted(_flatten_cart_items(cart), args, key="items", extra=extra)
+        return
+
+    if fmt in DOCUMENT_FORMATS:
+        output_document(cart, fmt)
         return
 
     rows = _flatten_cart_items(cart)
-    if fmt == "tsv":
+    if fmt == "ndjson":
+        output_ndjson(rows)
+    elif fmt == "tsv":
         output_tsv(rows, _CART_COLUMNS)
     else:
         output_text(rows, _CART_COLUMNS)
@@ -114,95 +130,154 @@ def _output_cart(cart: dict, fmt: str) -> None:
             print(f"\nTotal: {total_amount} {total_currency}")
 
 
-def handle_cart_list(args, client: AllegroClient) -> int:
-    cart = client.get_cart()
-    _output_cart(cart, args.format)
+def _cart_changes(args, client: AllegroClient) -> int:
+    events = delta.poll(
+        delta.require_state(client), "cart",
+        fetch=lambda since: (client.get_cart(since=since), client.body_hash("/carts")),
+        to_rows=_flatten_cart_items,
+        diff=lambda old, new: delta.diff_rows(old, new, key="offer_id"),
+    )
+    if events:
+        delta.output_changes(events, args.format, key="offer_id")
     return 0
 
 
-def handle_cart_add(args, client: AllegroClient) -> int:
-    seller_id = args.seller_id
-    category_id = getattr(args, "category", None)
-
-    if not seller_id:
-        # If seller_id is missing, fetch offer details to find it
-        offer = client.scrape_offer(args.offer_id)
-        seller_id = offer.seller.id
-        if not category_id:
-            category_id = offer.category.id
-
-    client.change_cart_quantity(
-        item_id=args.offer_id,
-        delta=args.quantity,
-        seller_id=seller_id,
-        nav_category_id=category_id,
-    )
+def handle_cart_list(args, client: AllegroClient) -> int:
+    if getattr(args, "changes_only", False):
+        return _cart_changes(args, client)
     cart = client.get_cart()
-    _output_cart(cart, args.format)
+    _output_cart(cart, args)
     return 0
 
 
-def handle_cart_remove(args, client: AllegroClient) -> int:
-    seller_id = args.seller_id
-    if not seller_id:
-        # Try to find seller_id in the cart
-        cart = client.get_cart()
-def handle_cart_remove(args, client: AllegroClient) -> int:
-    # 1. Find the unique item_id (UUID) for the given offer_id in the cart
-    item_id_to_remove = None
-    
+# Accepted column / key names in `cart add --from` files
+_FILE_KEYS = {
+    "offer": ("offer_id", "offerId", "offer", "id"),
+    "seller": ("seller_id", "sellerId", "seller"),
+    "quantity": ("quantity", "qty"),
+    "category": ("category_id", "categoryId", "category"),
+}
+
+
+def _pick(row: dict, field: str) -> str:
+    for key in _FILE_KEYS[field]:
+        value = row.get(key)
+        if value not in (None, ""):
+            return str(value).strip()
+    return ""
+
+
+def _read_cart_file(path: str) -> list[dict]:
+    """Rows of a JSON (list of objects) or CSV (with header) `--from` file."""
     try:
-        cart = client.get_cart()
-    except Exception:
-        print("Error: Could not fetch cart.")
-        return 1
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.lower().endswith(".json"):
+                rows = json.load(f)
+            else:
+                rows = list(csv.DictReader(f))
+    except (OSError, ValueError) as exc:
+        raise CartError(f"Cannot read {path}: {exc}", code="CartFileException")
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise CartError(f"{path} must hold a list of objects", code="CartFileException")
+    return rows
 
-    if not isinstance(cart, dict):
-        print(f"Error: Expected dict from get_cart, got {type(cart)}")
-        return 1
 
-    cart_data = cart.get("cart")
-    if not isinstance(cart_data, dict):
-        print("Error: Cart data missing or invalid.")
-        return 1
-        
-    groups = cart_data.get("groups", [])
-    if not isinstance(groups, list):
-        print("Error: Cart groups missing or invalid.")
-        return 1
-    
-    for group in groups:
-        if not isinstance(group, dict):
-            continue
-        items = group.get("items", [])
-        if not isinstance(items, list):
+def _cart_adds(args) -> list[CartChange]:
+    """Requested additions from positional IDs and `--from`, one per offer."""
+    rows = []
+    if args.offer_id:
+        offer_ids = args.offer_id.split(",")
+        if args.seller_id and len(offer_ids) > 1:
+            # One seller rarely owns every listed offer; --from has a column per row
+            raise CartError(
+                "A seller ID applies to a single offer; use --from FILE for per-offer sellers",
+                code="InvalidArgumentException",
+            )
+        for offer_id in offer_ids:
+            rows.append({
+                "offer_id": offer_id, "seller_id": args.seller_id,
+                "quantity": args.quantity, "category_id": getattr(args, "category", None),
+            })
+    if getattr(args, "from_file", None):
+        rows.extend(_read_cart_file(args.from_file))
+
+    changes: dict[str, CartChange] = {}
+    for row in rows:
+        offer_id = _pick(row, "offer")
+        if not offer_id:
             continue
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            offers = item.get("offers", [])
-            if not isinstance(offers, list):
-                continue
-            for offer in offers:
-                if isinstance(offer, dict) and offer.get("id") == args.offer_id:
-                    item_id_to_remove = item.get("id")
-                    break
-            if item_id_to_remove:
-                break
-        if item_id_to_remove:
-            break
-
-    if not item_id_to_remove:
-        print(f"Error: Offer {args.offer_id} not found in cart.")
-        return 1
-
-    # 2. Use the new DELETE endpoint
-    try:
-        client.remove_cart_item(item_id_to_remove)
-    except Exception as e:
-        print(f"Error removing item: {e}")
-        return 1
-    
-    cart = client.get_cart()
-    _output_cart(cart, args.format)
+        quantity = _pick(row, "quantity") or "1"
+        if not quantity.isdigit() or int(quantity) < 1:
+            raise CartError(
+                f"Invalid quantity {quantity!r} for offer {offer_id} (must be at least 1)",
+                code="CartFileException",
+            )
+        change = changes.get(offer_id)
+        if change is None:
+            changes[offer_id] = CartChange(
+                itemId=offer_id, delta=int(quantity),
+                sellerId=_pick(row, "seller"), navCategoryId=_pick(row, "category") or None,
+            )
+        else:
+            # Same offer listed twice: one item with the summed quantity
+            change.delta += int(quantity)
+            change.sellerId = change.sellerId or _pick(row, "seller")
+    if not changes:
+        raise CartError("No offers to add: pass OFFER_ID[,OFFER_ID...] or --from FILE")
+    return list(changes.values())
+
+
+def _finish(args, client: AllegroClient, state: dict | None, summary: dict) -> int:
+    """Print the cart after a change, without refetching it when possible."""
+    if getattr(args, "no_refresh", False):
+        if args.format in DOCUMENT_FORMATS:
+            output_document(summary, args.format)
+        elif args.format == "ndjson":
+            output_ndjson([summary])
+        else:
+            print(summary["message"])
+        return 0
+    # Mutation responses that carry the cart spare a GET /carts
+    _output_cart(state if state is not None else client.get_cart(), args)
     return 0
+
+
+def handle_cart_add(args, client: AllegroClient) -> int:
+    changes = _cart_adds(args)
+
+    # Index lookups, or minimal page fetches that only read the seller ID
+    missing = [c.itemId for c in changes if not c.sellerId]
+    if missing:
+        resolved = client.resolve_sellers(missing)
+        for change in changes:
+            if not change.sellerId:
+                change.sellerId, category = resolved[change.itemId]
+                change.navCategoryId = change.navCategoryId or category
+
+    state = client.change_cart_quantities(changes)
+    return _finish(args, client, state, {
+        "status": "ok",
+        "message": f"Added {len(changes)} offer(s) to cart",
+        "added": [c.to_dict() for c in changes],
+    })
+
+
+def handle_cart_remove(args, client: AllegroClient) -> int:
+    offer_ids = list(dict.fromkeys(i.strip() for i in args.offer_id.split(",") if i.strip()))
+
+    # Item UUIDs come from the last cart snapshot; the cart is fetched only on a miss
+    item_ids = client.resolve_cart_items(offer_ids)
+    try:
+        state = client.remove_cart_items(list(item_ids.values()))
+    except CartError as exc:
+        if exc.code != "CartApiException":
+            raise
+        # The saved snapshot may be stale: retry once with a fresh one
+        item_ids = client.resolve_cart_items(offer_ids, refresh=True)
+        state = client.remove_cart_items(list(item_ids.values()))
+
+    return _finish(args, client, state, {
+        "status": "ok",
+        "message": f"Removed {len(item_ids)} offer(s) from cart",
+        "removed": item_ids,
+    })
@@ -3,7 +3,7 @@ from __future__ import annotations
 import dataclasses
 
 from allegro_cli.config import load_config, save_config
-from allegro_cli.output import output_json
+from allegro_cli.output import DOCUMENT_FORMATS, output_document, output_json, output_ndjson
 
 
 def _mask_secret(value: str | None) -> str | None:
@@ -17,8 +17,10 @@ def handle_config_show(args) -> int:
     data = dataclasses.asdict(config)
     data["cookies"] = _mask_secret(data.get("cookies"))
 
-    if args.format == "json":
-        output_json(data)
+    if args.format in DOCUMENT_FORMATS:
+        output_document(data, args.format)
+    elif args.format == "ndjson":
+        output_ndjson([data])
     else:
         for key, val in data.items():
             print(f"{key}: {val}")
@@ -31,10 +33,18 @@ def handle_config_set(args) -> int:
         config.cookies = args.cookies
     if args.edge_base_url is not None:
         config.edgeBaseUrl = args.edge_base_url
+    if getattr(args, "scrape_base_url", None) is not None:
+        config.scrapeBaseUrl = args.scrape_base_url
     if args.output_format is not None:
         config.outputFormat = args.output_format
     if getattr(args, "flaresolverr_url", None) is not None:
         config.flareSolverrUrl = args.flaresolverr_url
+    if getattr(args, "offer_price_ttl", None) is not None:
+        config.offerPriceTtl = args.offer_price_ttl
+    if getattr(args, "offer_params_ttl", None) is not None:
+        config.offerParamsTtl = args.offer_params_ttl
+    if getattr(args, "local_store", None) is not None:
+        config.localStore = args.local_store == "on"
     save_config(config)
     output_json({"status": "ok", "message": "Configuration updated"})
     return 0
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from allegro_cli import budget
+from allegro_cli.api.models import AllegroCliError
+from allegro_cli.commands.search import _compact_offer, _export, _get_columns
+from allegro_cli.export import EXPORT_FORMATS
+from allegro_cli.local_store import LocalStore, parse_since
+from allegro_cli.output import (
+    DOCUMENT_FORMATS, output_document, output_ndjson, output_text, output_tsv,
+)
+
+
+def _param_filters(raw: list[str] | None) -> dict[str, str]:
+    params = {}
+    for item in raw or []:
+        key, sep, value = item.partition("=")
+        if not sep or not key.strip():
+            raise AllegroCliError(
+                message=f"Invalid --param: {item!r}",
+                code="InvalidArgumentException",
+                userMessage="--param takes 'key=value', e.g. --param 'Pojemność=1 kg'.",
+            )
+        params[key.strip()] = value.strip()
+    return params
+
+
+def handle_local_search(args) -> int:
+    store = LocalStore()
+    offers = store.search(
+        phrase=args.phrase,
+        price_min=args.price_min,
+        price_max=args.price_max,
+        params=_param_filters(args.param),
+        since=parse_since(args.since) if args.since else None,
+        limit=args.limit,
+    )
+    compact = getattr(args, "compact", False)
+
+    if args.format in EXPORT_FORMATS:
+        return _export(args, offers)
+    if budget.is_active(args):
+        budget.check_format(args)
+        records = [_compact_offer(o, parameters=True) if compact else o.to_dict() for o in offers]
+        budget.output_budgeted(records, args, key="offers")
+    elif args.format in DOCUMENT_FORMATS:
+        output_document([_compact_offer(o, parameters=True) for o in offers] if compact else offers, args.format)
+    elif args.format == "ndjson":
+        output_ndjson(_compact_offer(o, parameters=True) if compact else o for o in offers)
+    elif args.format == "tsv":
+        output_tsv(offers, columns=_get_columns(args))
+    else:
+        output_text(offers, columns=_get_columns(args))
+    return 0
+
+
+def handle_local_history(args) -> int:
+    rows = [
+        {"time": datetime.fromtimestamp(at, timezone.utc).isoformat(timespec="seconds"), "amount": amount}
+        for at, amount in LocalStore().price_history(args.offer_id)
+    ]
+    if args.format in DOCUMENT_FORMATS:
+        output_document({"offerId": args.offer_id, "history": rows}, args.format)
+    elif args.format == "ndjson":
+        output_ndjson(rows)
+    elif args.format == "tsv":
+        output_tsv(rows, ["time", "amount"])
+    else:
+        if not rows:
+            print(f"No prices recorded for {args.offer_id}.")
+        for row in rows:
+            print(f"{row['time']}  {row['amount']:>10}")
+    return 0
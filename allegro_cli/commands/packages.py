@@ -1,15 +1,55 @@
 from __future__ import annotations
 
-from allegro_cli.api.client import AllegroClient
-from allegro_cli.output import output_json, output_tsv
+import sys
+import time
+from datetime import datetime, timezone
+
+from allegro_cli import budget, delta
+from allegro_cli.api.client import TRANSPORT_ERRORS, AllegroClient
+from allegro_cli.api.models import AllegroCliError, AuthenticationError, RateLimitError
+from allegro_cli.output import DOCUMENT_FORMATS, output_document, output_ndjson, output_tsv
+
+
+def _compact_package(package: dict) -> dict:
+    """One flat row per parcel: what it is, who carries it and where it is."""
+    delivery = package.get("delivery", {})
+    return {
+        "name": package.get("content", {}).get("description", ""),
+        "carrier": delivery.get("carrierId", ""),
+        "waybill": delivery.get("waybill", ""),
+        "status": delivery.get("status", ""),
+        "title": delivery.get("description", {}).get("title", ""),
+    }
 
 
 def handle_packages_summary(args, client: AllegroClient) -> int:
-    summary = client.get_packages_summary()
-    packages = client.get_packages_list()
+    if getattr(args, "changes_only", False):
+        events = delta.poll(
+            delta.require_state(client), "packages",
+            fetch=lambda since: (client.get_packages_list(since=since), client.body_hash("/packages")),
+            to_rows=delta.package_rows,
+            diff=delta.package_transitions,
+        )
+        if events:
+            delta.output_changes(events, args.format, key="parcel")
+        return 0
 
-    if args.format == "json":
-        return output_json({"summary": summary, "packages": packages})
+    summary, packages = client.get_packages()
+
+    if budget.is_active(args):
+        budget.output_budgeted(
+            [_compact_package(p) for p in packages], args,
+            key="packages", extra={"summary": summary},
+        )
+    elif args.format in DOCUMENT_FORMATS and getattr(args, "compact", False):
+        output_document(
+            {"summary": summary, "packages": [_compact_package(p) for p in packages]},
+            args.format,
+        )
+    elif args.format in DOCUMENT_FORMATS:
+        return output_document({"summary": summary, "packages": packages}, args.format)
+    elif args.format == "ndjson":
+        output_ndjson(packages)
     elif args.format == "tsv":
         # Summary as first row
         rows = [{"total": str(summary.get("total", 0)),
@@ -51,3 +91,64 @@ def handle_packages_summary(args, client: AllegroClient) -> int:
                 print(f"   {subtitle}")
             print("-" * 60)
     return 0
+
+
+# Statuses worth polling at --min-interval: the parcel may arrive any minute
+_FAST_STATUSES = {"OUT_FOR_DELIVERY", "READY_FOR_PICKUP", "AVAILABLE_FOR_PICKUP"}
+_DONE_STATUSES = {"DELIVERED", "PICKED_UP", "RETURNED", "CANCELLED"}
+
+
+def _next_interval(args, rows: list[dict], changed: bool, current: float) -> float:
+    """Poll fast around deliveries, back off while nothing moves."""
+    statuses = {r["status"] for r in rows}
+    if changed or statuses & _FAST_STATUSES:
+        return args.min_interval
+    if statuses - _DONE_STATUSES:
+        return args.interval
+    return min(max(current, args.interval) * 2, args.max_interval)
+
+
+def handle_packages_watch(args, client: AllegroClient) -> int:
+    """Poll packages with one open session and emit NDJSON change events.
+
+    Each round asks only for the small summary; the parcel list is fetched
+    when its total or pickup count moved, or at least every --max-interval
+    seconds so status changes within a route are not missed.  The first
+    round reports every current parcel as ``added``.  Failed polls are
+    retried with a growing pause; only an expired session ends the watch.
+    """
+    rows: list[dict] | None = None
+    counts = None
+    listed_at = 0.0
+    interval = args.interval
+    polls = 0
+    try:
+        while True:
+            changed = False
+            try:
+                summary = client.get_packages_summary()
+                current = (summary.get("total"), summary.get("parcelsForPickup"))
+                if rows is None or current != counts or time.monotonic() - listed_at >= args.max_interval:
+                    fresh = delta.package_rows(client.get_packages_list())
+                    listed_at = time.monotonic()
+                    events = delta.package_transitions(rows or [], fresh)
+                    stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+                    output_ndjson({"time": stamp, **e} for e in events)
+                    changed = bool(events) and rows is not None
+                    rows, counts = fresh, current
+                interval = _next_interval(args, rows, changed, interval)
+            except RateLimitError:
+                interval = args.max_interval
+            except AuthenticationError:
+                raise
+            except (AllegroCliError, *TRANSPORT_ERRORS) as e:
+                # 5xx or a dropped connection: retry, waiting longer each time
+                interval = min(max(interval, args.min_interval) * 2, args.max_interval)
+                code = e.code if isinstance(e, AllegroCliError) else type(e).__name__
+                print(f"packages watch: {code}, retrying in {interval:.0f}s", file=sys.stderr)
+            polls += 1
+            if args.polls and polls >= args.polls:
+                return 0
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 0
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+
+from allegro_cli import delta
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.commands.search import _compact_offer, _search_kwargs
+from allegro_cli.output import DOCUMENT_FORMATS, output_document, output_ndjson, output_tsv
+from allegro_cli.saved import SavedRunReport, require_saved, run_saved
+
+_RUN_COLUMNS = ["change", "id", "name", "price", "before", "seller"]
+
+
+def _describe(params: dict) -> str:
+    filters = [
+        f"{k}={v}" for k, v in params.items()
+        if k not in ("phrase", "page", "pages") and v not in (None, False, [])
+    ]
+    return params["phrase"] + (f" ({', '.join(filters)})" if filters else "")
+
+
+def handle_saved_add(args, client: AllegroClient) -> int:
+    state = delta.require_state(client, "saved searches")
+    params = _search_kwargs(args)
+    state.save_search(args.name, params)
+    if args.format in DOCUMENT_FORMATS:
+        output_document({"name": args.name, "search": params}, args.format)
+    else:
+        print(f"Saved {args.name}: {_describe(params)}")
+    return 0
+
+
+def handle_saved_list(args, client: AllegroClient) -> int:
+    searches = delta.require_state(client, "saved searches").saved_searches()
+    if args.format in DOCUMENT_FORMATS:
+        output_document(searches, args.format)
+    elif args.format == "ndjson":
+        output_ndjson({"name": name, "search": params} for name, params in searches.items())
+    else:
+        for name, params in searches.items():
+            print(f"{name}\t{_describe(params)}")
+    return 0
+
+
+def handle_saved_remove(args, client: AllegroClient) -> int:
+    state = delta.require_state(client, "saved searches")
+    require_saved(state, args.name)
+    state.delete_search(args.name)
+    return 0
+
+
+def handle_saved_run(args, client: AllegroClient) -> int:
+    state = delta.require_state(client, "saved searches")
+    compact = getattr(args, "compact", False)
+    report = SavedRunReport()
+    events = run_saved(client, state, args.name, pages=args.pages, report=report)
+
+    def record(change, offer, before) -> dict:
+        data = _compact_offer(offer) if compact else offer.to_dict()
+        return {"change": change, **({"before": before} if before else {}), **data}
+
+    if args.format == "ndjson":
+        output_ndjson(record(*e) for e in events)
+    elif args.format in DOCUMENT_FORMATS:
+        offers = [record(*e) for e in events]
+        output_document({"offers": offers, "run": report.to_dict()}, args.format)
+        return 0
+    elif args.format == "tsv":
+        rows = [
+            {"change": change, "id": offer.id, "name": offer.name,
+             "price": offer.sellingMode.price.amount, "before": before or "",
+             "seller": offer.seller.name}
+            for change, offer, before in events
+        ]
+        output_tsv(rows, _RUN_COLUMNS)
+    else:
+        for change, offer, before in events:
+            price = offer.sellingMode.price
+            moved = f" (was {before})" if before else ""
+            mark = "+" if change == "new" else "~"
+            print(f"{mark} {offer.id}  {price.amount} {price.currency}{moved}  {offer.name}")
+
+    stopped = ", stopped at already-seen offers" if report.stoppedEarly else ""
+    print(
+        f"{report.new} new, {report.changed} repriced of {report.scanned} scanned{stopped}",
+        file=sys.stderr,
+    )
+    return 0
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import dataclasses
-
+from allegro_cli import budget
 from allegro_cli.api.client import AllegroClient
+from allegro_cli.api.models import OfferBatch
+from allegro_cli.export import EXPORT_FORMATS
 from allegro_cli.main import _DEFAULT_COLUMNS
-from allegro_cli.output import output_json, output_text, output_tsv
+from allegro_cli.output import (
+    DOCUMENT_FORMATS, output_document, output_ndjson, output_text, output_tsv,
+)
+from allegro_cli.query import Query, compile_query
 
 
 def _get_columns(args) -> list[str]:
@@ -14,19 +18,22 @@ def _get_columns(args) -> list[str]:
     return _DEFAULT_COLUMNS.split(",")
 
 
-def _compact_offer(offer) -> dict:
+def _compact_offer(offer, parameters: bool = False) -> dict:
     """Strip Offer down to the absolute essentials for LLM token efficiency."""
-    return {
+    compact = {
         "id": offer.id,
         "name": offer.name,
         "price": offer.sellingMode.price.amount,
         "seller": offer.seller.name,
         "image": offer.images[0].url if offer.images else None,
     }
+    if parameters:
+        compact["parameters"] = offer.parameters
+    return compact
 
 
-def handle_search(args, client: AllegroClient) -> int:
-    offers = client.scrape_search(
+def _search_kwargs(args) -> dict:
+    return dict(
         phrase=args.phrase,
         page=getattr(args, "page", 1),
         category=getattr(args, "category", None),
@@ -40,33 +47,137 @@ def handle_search(args, client: AllegroClient) -> int:
         location=getattr(args, "location", None),
         pay=getattr(args, "pay", False),
         filters=getattr(args, "filter", None),
+        pages=getattr(args, "pages", None) or 1,
     )
 
-    if args.format == "json":
-        data = [dataclasses.asdict(o) for o in offers]
-        if getattr(args, "compact", False):
-            data = [_compact_offer(o) for o in offers]
-        output_json(data)
+
+def _export(args, offers) -> int:
+    """Stream offers into a csv/parquet/arrow writer."""
+    import sys
+
+    from allegro_cli.export import open_writer
+
+    raw = getattr(args, "param_keys", None)
+    param_keys = [k.strip() for k in raw.split(",") if k.strip()] if raw else None
+    with open_writer(args.format, getattr(args, "output", None), param_keys) as writer:
+        count = writer.write_all(offers)
+    if getattr(args, "output", None):
+        print(f"Wrote {count} offers to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _queried_offers(args, client: AllegroClient, query: Query):
+    """Offers matching ``--where``, streamed page by page unless ``--order-by``
+    needs the whole set first."""
+    pages = client.iter_search_pages(**_search_kwargs(args))
+    if query.order:
+        return query.apply([o for offers in pages for o in offers])
+    return (o for offers in pages for o in query.filter(offers))
+
+
+def _top_offers(args, client: AllegroClient, query: Query | None = None):
+    from allegro_cli.topk import DEFAULT_PAGE_CAP, top_k
+
+    kwargs = _search_kwargs(args)
+    kwargs["pages"] = args.pages or DEFAULT_PAGE_CAP
+    pages = client.iter_search_pages(**kwargs)
+    # Pages keep the listing order so top_k can still stop early; --order-by
+    # only reorders the winners
+    if query is not None:
+        pages = (query.filter(offers) for offers in pages)
+    offers, report = top_k(pages, args.top, sort=args.sort, page_cap=kwargs["pages"])
+    if query is not None and query.order:
+        offers = query.apply(offers)
+    return offers, report
+
+
+def _output_offers(args, offers, extra: dict | None = None) -> int:
+    """Write search results in ``args.format``; *extra* goes into the budget
+    envelope, every other format has the same shape with or without it."""
+    compact = getattr(args, "compact", False)
+
+    if args.format in EXPORT_FORMATS:
+        return _export(args, offers)
+    if budget.is_active(args):
+        records = [_compact_offer(o) if compact else o.to_dict() for o in offers]
+        budget.output_budgeted(records, args, key="offers", extra=extra)
+    elif args.format == "ndjson":
+        # Stream: each offer is written as soon as its page is parsed
+        output_ndjson(_compact_offer(o) if compact else o for o in offers)
+    elif args.format == "tsv":
+        batch = offers if isinstance(offers, OfferBatch) else OfferBatch(offers)
+        output_tsv(batch, columns=_get_columns(args))
+    elif args.format in DOCUMENT_FORMATS:
+        offers = list(offers)
+        output_document([_compact_offer(o) for o in offers] if compact else offers, args.format)
     else:
-        rows = [dataclasses.asdict(o) for o in offers]
-        columns = _get_columns(args)
-        if args.format == "tsv":
-            output_tsv(rows, columns=columns)
-        else:
-            output_text(rows, columns=columns)
+        # Large crawls are rendered incrementally as pages arrive
+        output_text(offers, columns=_get_columns(args))
     return 0
 
 
+def handle_search(args, client: AllegroClient) -> int:
+    # Parsed before any fetch so a bad expression costs no request
+    query = compile_query(getattr(args, "where", None), getattr(args, "order_by", None))
+
+    if getattr(args, "top", None):
+        import sys
+
+        offers, report = _top_offers(args, client, query)
+        _output_offers(args, offers, extra={"top": report.to_dict()})
+        # The budget envelope carries the report; every other format keeps
+        # the shape of a plain search and gets it on stderr
+        if not budget.is_active(args):
+            stopped = " (stopped early)" if report.stoppedEarly else ""
+            print(
+                f"Top {len(offers)} of {report.offersScanned} offers from "
+                f"{report.pagesFetched}/{report.pageCap} pages{stopped}",
+                file=sys.stderr,
+            )
+        return 0
+
+    if query is not None:
+        offers = _queried_offers(args, client, query)
+    elif budget.is_active(args) or args.format in DOCUMENT_FORMATS:
+        offers = client.scrape_search(**_search_kwargs(args))
+    elif args.format == "tsv":
+        # Columnar: pages are parsed straight into the batch, never into one
+        # object graph per offer
+        offers = client.search_batch(**_search_kwargs(args))
+    else:
+        offers = client.iter_search(**_search_kwargs(args))
+    return _output_offers(args, offers)
+
+
 def handle_offer(args, client: AllegroClient) -> int:
-    offer = client.scrape_offer(args.offer_id)
+    offer_ids = [args.offer_id, *(getattr(args, "more_offer_ids", None) or [])]
+
+    compact = getattr(args, "compact", False)
+
+    if args.format in EXPORT_FORMATS:
+        return _export(args, (client.scrape_offer(oid) for oid in offer_ids))
+
+    if budget.is_active(args):
+        offers = [client.scrape_offer(oid) for oid in offer_ids]
+        records = [_compact_offer(o, parameters=True) if compact else o.to_dict() for o in offers]
+        budget.output_budgeted(records, args, key="offers")
+        return 0
+
+    if args.format == "ndjson":
+        offers = (client.scrape_offer(oid) for oid in offer_ids)
+        output_ndjson(_compact_offer(o, parameters=True) if compact else o for o in offers)
+        return 0
+
+    offers = [client.scrape_offer(oid) for oid in offer_ids]
 
-    if args.format == "json":
-        output_json(offer)
+    if args.format in DOCUMENT_FORMATS:
+        if compact:
+            offers = [_compact_offer(o, parameters=True) for o in offers]
+        output_document(offers[0] if len(offers) == 1 else offers, args.format)
     else:
-        rows = [dataclasses.asdict(offer)]
         columns = _get_columns(args)
         if args.format == "tsv":
-            output_tsv(rows, columns=columns)
+            output_tsv(offers, columns=columns)
         else:
-            output_text(rows, columns=columns)
+            output_text(offers, columns=columns)
     return 0
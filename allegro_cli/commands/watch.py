@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+
+from allegro_cli import delta
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.output import DOCUMENT_FORMATS, output_document, output_ndjson, output_tsv
+from allegro_cli.watch import PriceWatch, history_rows, read_offer_ids
+
+
+def handle_watch_offers(args, client: AllegroClient) -> int:
+    state = delta.require_state(client, "watch offers")
+    offer_ids = read_offer_ids(args.file)
+    watch = PriceWatch(
+        client, state,
+        interval=args.interval,
+        rate=args.rate,
+        emit=lambda event: output_ndjson([event]),
+    )
+    try:
+        watch.run(offer_ids, rounds=args.rounds)
+    except KeyboardInterrupt:
+        pass
+    print(watch.summary(), file=sys.stderr)
+    return 0
+
+
+def handle_watch_history(args, client: AllegroClient) -> int:
+    state = delta.require_state(client, "watch history")
+    rows = history_rows(state, args.offer_id)
+    if args.format in DOCUMENT_FORMATS:
+        output_document({"offerId": args.offer_id, "history": rows}, args.format)
+    elif args.format == "ndjson":
+        output_ndjson(rows)
+    elif args.format == "tsv":
+        output_tsv(rows, ["time", "amount", "currency", "availability"])
+    else:
+        if not rows:
+            print(f"No price history for {args.offer_id}.")
+        for row in rows:
+            print(f"{row['time']}  {row['amount']:>10} {row['currency']}  {row['availability']}")
+    return 0
@@ -12,8 +12,14 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 class Config:
     cookies: str | None = None
     edgeBaseUrl: str = "https://edge.allegro.pl"
+    scrapeBaseUrl: str = "https://allegro.pl"
     outputFormat: str = "text"
     flareSolverrUrl: str | None = None
+    # Offer cache TTLs in seconds: prices go stale fast, parameters rarely change
+    offerPriceTtl: int = 15 * 60
+    offerParamsTtl: int = 7 * 24 * 3600
+    # Keep every parsed offer in local.sqlite for `allegro local search`
+    localStore: bool = False
 
 
 def ensure_dirs() -> None:
@@ -28,8 +34,12 @@ def load_config(path: Path | None = None) -> Config:
     return Config(
         cookies=data.get("cookies"),
         edgeBaseUrl=data.get("edgeBaseUrl", Config.edgeBaseUrl),
+        scrapeBaseUrl=data.get("scrapeBaseUrl", Config.scrapeBaseUrl),
         outputFormat=data.get("outputFormat", Config.outputFormat),
         flareSolverrUrl=data.get("flareSolverrUrl"),
+        offerPriceTtl=data.get("offerPriceTtl", Config.offerPriceTtl),
+        offerParamsTtl=data.get("offerParamsTtl", Config.offerParamsTtl),
+        localStore=data.get("localStore", Config.localStore),
     )
 
 
@@ -0,0 +1,142 @@
+"""Change detection for ``--changes-only`` polling of cart and packages.
+
+Each run compares the current rows with the state reported by the previous
+run (kept in the local state store) and emits only the difference:
+
+- cart lines: ``added`` / ``removed`` / ``changed`` (with the old values),
+- packages: ``added`` / ``removed`` and ``status`` transitions.
+
+When the edge API body hash matches the one the stored state came from,
+nothing is parsed or rendered at all.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from allegro_cli.api.models import AllegroCliError
+from allegro_cli.output import DOCUMENT_FORMATS, output_document, output_ndjson
+
+
+def require_state(client, feature: str = "--changes-only") -> Any:
+    state = client.state
+    if state is None:
+        raise AllegroCliError(
+            message=f"{feature} needs the local state store",
+            code="StateRequiredException",
+            userMessage=f"{feature} remembers earlier state locally; drop --replay.",
+        )
+    return state
+
+
+def diff_rows(old: list[dict], new: list[dict], key: str) -> list[dict]:
+    """Added, removed and changed rows between two snapshots keyed by *key*."""
+    before = {r[key]: r for r in old}
+    after = {r[key]: r for r in new}
+    events = []
+    for k, row in after.items():
+        prev = before.get(k)
+        if prev is None:
+            events.append({"change": "added", key: k, "row": row})
+        elif prev != row:
+            changed = {f: prev.get(f) for f in row if prev.get(f) != row.get(f)}
+            events.append({"change": "changed", key: k, "row": row, "before": changed})
+    for k, row in before.items():
+        if k not in after:
+            events.append({"change": "removed", key: k, "row": row})
+    return events
+
+
+def package_rows(packages: list[dict]) -> list[dict]:
+    """One row per parcel, keyed by ``parcel``: the waybill once there is one.
+
+    Parcels not yet shipped have no waybill; they are told apart by the
+    package ID, or else by their item and its position among same-named
+    unshipped parcels.
+    """
+    rows = []
+    unshipped: dict[str, int] = {}
+    for p in packages:
+        delivery = p.get("delivery", {})
+        waybill = delivery.get("waybill", "")
+        item = p.get("content", {}).get("description", "")
+        parcel = waybill or str(p.get("id") or "")
+        if not parcel:
+            n = unshipped[item] = unshipped.get(item, 0) + 1
+            parcel = f"{item}#{n}"
+        rows.append({
+            "parcel": parcel,
+            "waybill": waybill,
+            "item": item,
+            "carrier": delivery.get("carrierId", ""),
+            "status": delivery.get("status", ""),
+            "title": delivery.get("description", {}).get("title", ""),
+        })
+    return rows
+
+
+def package_transitions(old: list[dict], new: list[dict]) -> list[dict]:
+    """Like ``diff_rows`` on parcels, but a changed parcel is a status transition."""
+    # Snapshots saved before rows had a parcel key were keyed by waybill
+    old = [r if "parcel" in r else {"parcel": r.get("waybill", ""), **r} for r in old]
+    events = []
+    for event in diff_rows(old, new, key="parcel"):
+        if event["change"] == "changed" and "status" in event["before"]:
+            events.append({
+                "change": "status",
+                "parcel": event["parcel"],
+                "from": event["before"]["status"],
+                "to": event["row"]["status"],
+                "row": event["row"],
+            })
+        elif event["change"] != "changed":
+            events.append(event)
+    return events
+
+
+def poll(
+    state,
+    name: str,
+    fetch: Callable[[str | None], tuple[Any, str | None]],
+    to_rows: Callable[[Any], list[dict]],
+    diff: Callable[[list[dict], list[dict]], list[dict]],
+) -> list[dict] | None:
+    """One ``--changes-only`` poll against the snapshot stored as *name*.
+
+    *fetch* gets the body hash of the stored snapshot and returns
+    ``(data, body_hash)``, with data None when the body is unchanged; then
+    None is returned and nothing is parsed.  Otherwise the events since the
+    snapshot are returned and the snapshot is replaced.
+    """
+    previous = state.snapshot(name)
+    data, digest = fetch(previous[0] if previous else None)
+    if data is None:
+        return None
+    rows = to_rows(data)
+    events = diff(previous[1] if previous else [], rows)
+    state.save_snapshot(name, digest or "", rows)
+    return events
+
+
+def _describe(event: dict, key: str) -> str:
+    row = event["row"]
+    label = row.get("name") or row.get("item") or ""
+    match event["change"]:
+        case "added":
+            return f"+ {event[key]} {label}"
+        case "removed":
+            return f"- {event[key]} {label}"
+        case "status":
+            return f"~ {event[key]} {label}: {event['from']} -> {event['to']}"
+        case _:
+            diffs = ", ".join(f"{f} {old} -> {row.get(f)}" for f, old in event["before"].items())
+            return f"~ {event[key]} {label}: {diffs}"
+
+
+def output_changes(events: list[dict], fmt: str, key: str) -> None:
+    if fmt in DOCUMENT_FORMATS:
+        output_document(events, fmt)
+    elif fmt == "ndjson":
+        output_ndjson(events)
+    else:
+        for event in events:
+            print(_describe(event, key))
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from decimal import Decimal, InvalidOperation
+from typing import Iterable
+
+from allegro_cli.api.models import AllegroCliError, Offer, OfferBatch
+
+EXPORT_FORMATS = ("csv", "parquet", "arrow")
+
+# Offers buffered per Arrow record batch / Parquet row group / CSV write
+_BATCH_ROWS = 4096
+
+# Output column -> OfferBatch column, in schema order
+_COLUMNS = [
+    ("id", "id"),
+    ("name", "name"),
+    ("seller_id", "seller.id"),
+    ("seller_name", "seller.name"),
+    ("selling_format", "sellingMode.format"),
+    ("price_amount", "sellingMode.price.amount"),
+    ("price_currency", "sellingMode.price.currency"),
+    ("category_id", "category.id"),
+]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise AllegroCliError(
+            message="pyarrow is not installed",
+            code="MissingDependencyException",
+            userMessage="Parquet/Arrow export needs pyarrow: pip install 'allegro-cli[arrow]'",
+        )
+    return pyarrow
+
+
+def _decimal(amount: str) -> Decimal | None:
+    try:
+        return Decimal(amount).quantize(Decimal("0.01"))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+class OfferWriter(ABC):
+    """Consume offers one at a time and write them out in columnar batches.
+
+    At most ``batch_rows`` offers are held in memory, so a multi-page crawl
+    can be exported without collecting it first.  When *param_keys* is given
+    those parameters become their own ``param.<key>`` columns; otherwise all
+    parameters go into a single ``parameters`` column.
+    """
+
+    def __init__(self, param_keys: list[str] | None = None, batch_rows: int = _BATCH_ROWS):
+        self.param_keys = param_keys
+        self.batch_rows = batch_rows
+        self.count = 0
+        self._batch = OfferBatch()
+
+    @property
+    def column_names(self) -> list[str]:
+        names = [name for name, _ in _COLUMNS] + ["image_url"]
+        if self.param_keys is None:
+            return names + ["parameters"]
+        return names + [f"param.{k}" for k in self.param_keys]
+
+    def write(self, offer: Offer) -> None:
+        self._batch.append(offer)
+        self.count += 1
+        if len(self._batch) >= self.batch_rows:
+            self.flush()
+
+    def write_all(self, offers: Iterable[Offer]) -> int:
+        for offer in offers:
+            self.write(offer)
+        return self.count
+
+    def flush(self) -> None:
+        if len(self._batch):
+            self._write_batch(self._batch)
+            self._batch = OfferBatch()
+
+    def close(self) -> None:
+        self.flush()
+        self._close()
+
+    def __enter__(self) -> OfferWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @abstractmethod
+    def _write_batch(self, batch: OfferBatch) -> None:
+        """Write one batch of buffered offers."""
+
+    def _close(self) -> None:
+        pass
+
+
+class CsvOfferWriter(OfferWriter):
+    def __init__(
+        self,
+        file,
+        param_keys: list[str] | None = None,
+        batch_rows: int = _BATCH_ROWS,
+        close_file: bool = False,
+    ):
+        super().__init__(param_keys, batch_rows)
+        self._file = file
+        self._close_file = close_file
+        self._writer = csv.writer(file)
+        self._writer.writerow(self.column_names)
+
+    def _write_batch(self, batch: OfferBatch) -> None:
+        cols = [batch.column(key) for _, key in _COLUMNS] + [batch.image_urls]
+        if self.param_keys is None:
+            cols.append([
+                json.dumps(p, ensure_ascii=False) if p else "" for p in batch.parameters
+            ])
+        else:
+            cols.extend(batch.column(f"parameters.{k}") for k in self.param_keys)
+        self._writer.writerows(zip(*cols))
+        self._file.flush()
+
+    def _close(self) -> None:
+        if self._close_file:
+            self._file.close()
+
+
+class _ArrowWriterBase(OfferWriter):
+    def __init__(self, param_keys: list[str] | None = None, batch_rows: int = _BATCH_ROWS):
+        super().__init__(param_keys, batch_rows)
+        self._pa = _require_pyarrow()
+        self.schema = self._schema()
+
+    def _schema(self):
+        pa = self._pa
+        fields = [
+            pa.field(name, pa.decimal128(12, 2) if name == "price_amount" else pa.string())
+            for name, _ in _COLUMNS
+        ]
+        fields.append(pa.field("image_url", pa.string()))
+        if self.param_keys is None:
+            fields.append(pa.field("parameters", pa.map_(pa.string(), pa.string())))
+        else:
+            fields.extend(pa.field(f"param.{k}", pa.string()) for k in self.param_keys)
+        return pa.schema(fields)
+
+    def _record_batch(self, batch: OfferBatch):
+        pa = self._pa
+        arrays = []
+        for name, key in _COLUMNS:
+            values = batch.column(key)
+            if name == "price_amount":
+                arrays.append(pa.array([_decimal(v) for v in values], pa.decimal128(12, 2)))
+            else:
+                arrays.append(pa.array(values, pa.string()))
+        arrays.append(pa.array([u or None for u in batch.image_urls], pa.string()))
+        if self.param_keys is None:
+            arrays.append(pa.array(
+                [list(p.items()) for p in batch.parameters],
+                pa.map_(pa.string(), pa.string()),
+            ))
+        else:
+            for k in self.param_keys:
+                arrays.append(pa.array(
+                    [p.get(k) for p in batch.parameters], pa.string(),
+                ))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+class ArrowOfferWriter(_ArrowWriterBase):
+    """Arrow IPC file (``.arrow`` / Feather v2)."""
+
+    def __init__(self, path: str, param_keys: list[str] | None = None, batch_rows: int = _BATCH_ROWS):
+        super().__init__(param_keys, batch_rows)
+        self._sink = self._pa.OSFile(path, "wb")
+        self._writer = self._pa.ipc.new_file(self._sink, self.schema)
+
+    def _write_batch(self, batch: OfferBatch) -> None:
+        self._writer.write_batch(self._record_batch(batch))
+
+    def _close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+
+class ParquetOfferWriter(_ArrowWriterBase):
+    """Parquet file, one row group per batch."""
+
+    def __init__(self, path: str, param_keys: list[str] | None = None, batch_rows: int = _BATCH_ROWS):
+        super().__init__(param_keys, batch_rows)
+        self._writer = self._pa.parquet.ParquetWriter(path, self.schema)
+
+    def _write_batch(self, batch: OfferBatch) -> None:
+        self._writer.write_batch(self._record_batch(batch))
+
+    def _close(self) -> None:
+        self._writer.close()
+
+
+def open_writer(
+    fmt: str,
+    output: str | None = None,
+    param_keys: list[str] | None = None,
+) -> OfferWriter:
+    """Create the writer for an export *fmt*; CSV defaults to stdout."""
+    if fmt == "csv":
+        if output:
+            file = open(output, "w", encoding="utf-8", newline="")
+            return CsvOfferWriter(file, param_keys, close_file=True)
+        return CsvOfferWriter(sys.stdout, param_keys)
+    if not output:
+        raise AllegroCliError(
+            message=f"--format {fmt} requires --output FILE",
+            code="MissingOutputException",
+            userMessage=f"Binary {fmt} output must go to a file: add --output FILE.",
+        )
+    if fmt == "parquet":
+        return ParquetOfferWriter(output, param_keys)
+    if fmt == "arrow":
+        return ArrowOfferWriter(output, param_keys)
+    raise ValueError(f"Unknown export format: {fmt}")
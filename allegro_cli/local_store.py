@@ -0,0 +1,245 @@
+"""Opt-in local store of every offer the CLI has parsed, for offline queries.
+
+Enabled with ``allegro config set --local-store on``.  Each offer from a
+search page or an offer page is upserted into ``local.sqlite``:
+
+- ``offers`` -- the latest version of each offer, with the price in grosze
+  for range queries,
+- ``offer_params`` -- one row per parameter (search pages carry none, so
+  they never wipe parameters an offer page provided),
+- ``offer_prices`` -- a row whenever an offer is seen at a new price,
+- ``offers_fts`` -- an FTS5 index over names and parameter values, with
+  diacritics folded so ``kawa ziarnista`` also finds ``Kawa ziarnistą``
+  (and ``mlynek`` finds ``Młynek``; FTS5 keeps ``ł`` as its own letter).
+
+``allegro local search`` answers from these tables without any request.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+from allegro_cli import config as config_module
+from allegro_cli.api.models import AllegroCliError, Offer, price_minor
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS offers (
+    id          INTEGER PRIMARY KEY,
+    offer_id    TEXT NOT NULL UNIQUE,
+    name        TEXT NOT NULL,
+    amount      TEXT NOT NULL,
+    price_minor INTEGER,
+    currency    TEXT NOT NULL,
+    seller_id   TEXT NOT NULL,
+    seller_name TEXT NOT NULL,
+    category_id TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS offers_price ON offers (price_minor);
+CREATE INDEX IF NOT EXISTS offers_last_seen ON offers (last_seen);
+CREATE TABLE IF NOT EXISTS offer_params (
+    offer_id TEXT NOT NULL,
+    key      TEXT NOT NULL,
+    value    TEXT NOT NULL,
+    PRIMARY KEY (offer_id, key)
+);
+CREATE INDEX IF NOT EXISTS offer_params_kv ON offer_params (key, value COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS offer_prices (
+    offer_id TEXT NOT NULL,
+    at       REAL NOT NULL,
+    amount   TEXT NOT NULL,
+    PRIMARY KEY (offer_id, at)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS offers_fts USING fts5(
+    name, params, tokenize = "unicode61 remove_diacritics 2"
+);
+"""
+
+_DURATION_RE = re.compile(r"^(\d+(?:\.\d+)?)([mhd])$")
+_DURATION_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+# Not a combining-mark diacritic, so remove_diacritics leaves it alone
+_FOLD = str.maketrans("łŁ", "lL")
+
+
+def default_store_path() -> Path:
+    return config_module.CONFIG_DIR / "local.sqlite"
+
+
+def parse_since(text: str, now: float | None = None) -> float:
+    """Epoch seconds from a duration back from now (``30m``, ``24h``, ``7d``)
+    or an ISO date/time (``2026-10-18``, ``2026-10-18T12:00``)."""
+    now = time.time() if now is None else now
+    match = _DURATION_RE.match(text.strip())
+    if match:
+        return now - float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+    try:
+        return datetime.fromisoformat(text.strip()).timestamp()
+    except ValueError:
+        raise AllegroCliError(
+            message=f"Invalid --since value: {text!r}",
+            code="InvalidArgumentException",
+            userMessage="--since takes a duration (30m, 24h, 7d) or a date (2026-10-18).",
+        )
+
+
+def _fts_query(phrase: str) -> str:
+    """Every word must match, as a prefix (Polish inflects word endings)."""
+    words = re.findall(r"\w+", phrase.translate(_FOLD))
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def _params_text(params: dict[str, str]) -> str:
+    return " ".join(params.values()).translate(_FOLD)
+
+
+class LocalStore:
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else default_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        try:
+            self._db.executescript(_SCHEMA)
+        except sqlite3.OperationalError as e:
+            if "fts5" not in str(e):
+                raise
+            raise AllegroCliError(
+                message=f"SQLite without FTS5: {e}",
+                code="MissingDependencyException",
+                userMessage="The local store needs SQLite built with FTS5.",
+            )
+        self._db.commit()
+
+    def upsert_offers(self, offers: Iterable[Offer], seen_at: float | None = None) -> int:
+        """Insert or refresh *offers* in one transaction; returns how many."""
+        now = time.time() if seen_at is None else seen_at
+        count = 0
+        with self._lock:
+            db = self._db
+            for offer in offers:
+                if not offer.id:
+                    continue
+                data = offer.to_dict()
+                data.pop("parameters", None)
+                price = offer.sellingMode.price
+                db.execute(
+                    "INSERT INTO offers (offer_id, name, amount, price_minor, currency, seller_id, "
+                    "seller_name, category_id, data, first_seen, last_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(offer_id) DO UPDATE SET name = excluded.name, "
+                    "amount = excluded.amount, price_minor = excluded.price_minor, "
+                    "currency = excluded.currency, seller_id = excluded.seller_id, "
+                    "seller_name = excluded.seller_name, category_id = excluded.category_id, "
+                    "data = excluded.data, last_seen = excluded.last_seen",
+                    (offer.id, offer.name, price.amount, price.amountMinor, price.currency,
+                     offer.seller.id, offer.seller.name, offer.category.id,
+                     json.dumps(data, ensure_ascii=False, separators=(",", ":")), now, now),
+                )
+                rowid = db.execute("SELECT id FROM offers WHERE offer_id = ?", (offer.id,)).fetchone()[0]
+
+                last = db.execute(
+                    "SELECT amount FROM offer_prices WHERE offer_id = ? ORDER BY at DESC LIMIT 1",
+                    (offer.id,),
+                ).fetchone()
+                if last is None or last[0] != price.amount:
+                    db.execute(
+                        "INSERT OR REPLACE INTO offer_prices VALUES (?, ?, ?)",
+                        (offer.id, now, price.amount),
+                    )
+
+                if offer.parameters:
+                    params = offer.parameters
+                    db.execute("DELETE FROM offer_params WHERE offer_id = ?", (offer.id,))
+                    db.executemany(
+                        "INSERT INTO offer_params VALUES (?, ?, ?)",
+                        [(offer.id, k, v) for k, v in params.items()],
+                    )
+                else:
+                    params = dict(db.execute(
+                        "SELECT key, value FROM offer_params WHERE offer_id = ?", (offer.id,),
+                    ).fetchall())
+                db.execute("DELETE FROM offers_fts WHERE rowid = ?", (rowid,))
+                db.execute(
+                    "INSERT INTO offers_fts (rowid, name, params) VALUES (?, ?, ?)",
+                    (rowid, offer.name.translate(_FOLD), _params_text(params)),
+                )
+                count += 1
+            db.commit()
+        return count
+
+    def search(
+        self,
+        phrase: str | None = None,
+        price_min: str | None = None,
+        price_max: str | None = None,
+        params: dict[str, str] | None = None,
+        since: float | None = None,
+        limit: int = 50,
+    ) -> list[Offer]:
+        """Offers matching all given conditions; best text match first when
+        *phrase* is given, most recently seen first otherwise."""
+        sql = ["SELECT o.offer_id, o.data FROM offers o"]
+        where: list[str] = []
+        values: list = []
+        order = "o.last_seen DESC"
+        if phrase and _fts_query(phrase):
+            sql.append("JOIN offers_fts f ON f.rowid = o.id")
+            where.append("offers_fts MATCH ?")
+            values.append(_fts_query(phrase))
+            order = "f.rank"
+        for bound, op in ((price_min, ">="), (price_max, "<=")):
+            if bound is not None:
+                minor = price_minor(bound)
+                if minor is None:
+                    raise AllegroCliError(
+                        message=f"Invalid price: {bound!r}",
+                        code="InvalidArgumentException",
+                        userMessage="Price bounds must be numbers, e.g. 49.99.",
+                    )
+                where.append(f"o.price_minor {op} ?")
+                values.append(minor)
+        for key, value in (params or {}).items():
+            where.append(
+                "EXISTS (SELECT 1 FROM offer_params p WHERE p.offer_id = o.offer_id "
+                "AND p.key = ? AND p.value = ? COLLATE NOCASE)"
+            )
+            values.extend([key, value])
+        if since is not None:
+            where.append("o.last_seen >= ?")
+            values.append(since)
+        if where:
+            sql.append("WHERE " + " AND ".join(where))
+        sql.append(f"ORDER BY {order} LIMIT ?")
+        values.append(limit)
+
+        with self._lock:
+            rows = self._db.execute(" ".join(sql), values).fetchall()
+            offers = []
+            for offer_id, data in rows:
+                record = json.loads(data)
+                record["parameters"] = dict(self._db.execute(
+                    "SELECT key, value FROM offer_params WHERE offer_id = ?", (offer_id,),
+                ).fetchall())
+                offers.append(Offer.from_dict(record))
+        return offers
+
+    def price_history(self, offer_id: str) -> list[tuple[float, str]]:
+        """``(seen_at, amount)`` for every price the offer was seen at."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT at, amount FROM offer_prices WHERE offer_id = ? ORDER BY at",
+                (offer_id,),
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
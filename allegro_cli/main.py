@@ -5,9 +5,23 @@ import sys
 
 from allegro_cli.api.models import AllegroCliError, AuthenticationError
 from allegro_cli.config import ensure_dirs, load_config
+from allegro_cli.export import EXPORT_FORMATS
 from allegro_cli.output import make_error, output_error
 
 _DEFAULT_COLUMNS = "id,name,sellingMode.price.amount,seller.name"
+_FORMATS = ["text", "json", "msgpack", "tsv", "ndjson", "csv", "parquet", "arrow"]
+# Formats every command can print; exports only work for search and offer
+_DEFAULT_FORMATS = [f for f in _FORMATS if f not in EXPORT_FORMATS]
+
+
+def _positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected an integer >= 1, got {text!r}")
+    return value
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -17,9 +31,10 @@ def create_parser() -> argparse.ArgumentParser:
     common = argparse.ArgumentParser(add_help=False)
     common.add_argument(
         "--format",
-        choices=["text", "json", "tsv"],
+        choices=_FORMATS,
         default=None,
-        help="Output format (default: text)",
+        help="Output format (default: text; ndjson streams one object per line; "
+             "csv/parquet/arrow export search and offer results)",
     )
     common.add_argument(
         "--compact",
@@ -27,12 +42,61 @@ def create_parser() -> argparse.ArgumentParser:
         default=False,
         help="Optimized JSON output for LLMs (minimal fields)",
     )
+    common.add_argument(
+        "--max-tokens", dest="max_tokens", type=_positive_int, metavar="N", default=None,
+        help="Shrink json/msgpack/ndjson output to about N tokens and report what was cut",
+    )
+    common.add_argument(
+        "--max-bytes", dest="max_bytes", type=_positive_int, metavar="N", default=None,
+        help="Like --max-tokens, as a byte limit",
+    )
+    common.add_argument(
+        "--tabular", action="store_true", default=False,
+        help="Encode lists as {columns, rows} so keys are written once",
+    )
     common.add_argument(
         "-v", "--verbose",
         action="store_true",
         default=False,
         help="Show progress and debug info on stderr",
     )
+    common.add_argument(
+        "--no-cache", dest="no_cache", action="store_true", default=False,
+        help="Neither read nor write the parsed-offer cache",
+    )
+    common.add_argument(
+        "--record", metavar="DIR", default=None,
+        help="Save every HTTP request/response to DIR for later --replay",
+    )
+    common.add_argument(
+        "--replay", metavar="DIR", default=None,
+        help="Serve HTTP responses from a --record capture instead of the network",
+    )
+    common.add_argument(
+        "--replay-realtime", dest="replay_realtime",
+        action="store_true", default=False,
+        help="With --replay: wait as long as each recorded response took",
+    )
+    common.add_argument(
+        "--profile", metavar="DIR", default=None,
+        help="Profile the command with cProfile and write .pstats to DIR",
+    )
+    common.add_argument(
+        "--profile-memory", dest="profile_memory",
+        action="store_true", default=False,
+        help="With --profile: also trace allocations (tracemalloc)",
+    )
+    common.add_argument(
+        "--profile-top", dest="profile_top", type=int, default=20,
+        help="With --profile: number of hot functions/allocation sites to report (default: 20)",
+    )
+
+    # Only commands that list offers can export them to a file
+    export_output = argparse.ArgumentParser(add_help=False)
+    export_output.add_argument(
+        "-o", "--output", metavar="FILE", default=None,
+        help="Write csv/parquet/arrow exports to FILE (required for parquet/arrow)",
+    )
 
     parser = argparse.ArgumentParser(
         prog="allegro",
@@ -45,92 +109,304 @@ def create_parser() -> argparse.ArgumentParser:
 
     sub = parser.add_subparsers(dest="command", required=True)
 
-    # --- search (scrape-based, cookie auth) ---
-    sp_search = sub.add_parser(
-        "search", parents=[common],
-        help="Search offers (cookie auth, scrape)",
-    )
-    sp_search.add_argument("phrase", help="Search phrase")
-    sp_search.add_argument("--page", type=int, default=1, help="Page number (default: 1)")
-    sp_search.add_argument(
+    # Search filters, shared by search and saved searches
+    search_filters = argparse.ArgumentParser(add_help=False)
+    search_filters.add_argument(
         "--category", default=None,
         help="Category ID or slug (e.g. 491, laptopy-491)",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--sort", default=None,
         help="Sort: p (price asc), pd (price desc), m (relevance), n (newest)",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--price-min", dest="price_min", default=None,
         help="Minimum price in PLN",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--price-max", dest="price_max", default=None,
         help="Maximum price in PLN",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--seller", default=None,
         help="Seller login (searches on seller's page, e.g. Muvepl)",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--condition", nargs="+", choices=["new", "used"], default=None,
         help="Item condition: new or used (can be multiple)",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--smart", action="store_true", default=False,
         help="Filter for Allegro Smart offers",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--delivery-time", choices=["one_day", "two_day", "three_day"], default=None,
         help="Delivery time filter",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--location", default=None,
         help="Shipping location (e.g. polska)",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--pay", action="store_true", default=False,
         help="Filter for Allegro Pay",
     )
-    sp_search.add_argument(
+    search_filters.add_argument(
         "--filter", action="append", default=None,
         help="Additional filters in 'key=value' format (e.g. --filter 'wielkosc-pamieci-ram=16 GB')",
     )
+
+    # --- search (scrape-based, cookie auth) ---
+    sp_search = sub.add_parser(
+        "search", parents=[common, export_output, search_filters],
+        help="Search offers (cookie auth, scrape)",
+    )
+    sp_search.add_argument("phrase", help="Search phrase")
+    sp_search.add_argument("--page", type=int, default=1, help="Page number (default: 1)")
+    sp_search.add_argument(
+        "--pages", type=_positive_int, default=None,
+        help="Number of consecutive pages to fetch, starting at --page "
+             "(default: 1, or up to 5 with --top)",
+    )
+    sp_search.add_argument(
+        "--top", type=_positive_int, default=None, metavar="K",
+        help="Only the K cheapest offers (K dearest with --sort pd) across pages; "
+             "with --sort p/pd stops fetching once no better offer can follow, "
+             "otherwise scans up to --pages (default: 5) pages",
+    )
+    sp_search.add_argument(
+        "--where", action="append", default=None, metavar="COND",
+        help="Keep only fetched offers matching COND, e.g. 'price<=100', 'seller=abc', "
+             "'param.Marka=Dell', 'name~ssd|nvme' (repeatable, all must match)",
+    )
+    sp_search.add_argument(
+        "--order-by", dest="order_by", default=None, metavar="FIELDS",
+        help="Sort fetched offers by comma-separated fields, '-' for descending "
+             "(e.g. --order-by=-price, --order-by seller,price)",
+    )
     sp_search.add_argument(
         "--columns", default=None,
         help=f"Comma-separated columns (default: {_DEFAULT_COLUMNS})",
     )
+    sp_search.add_argument(
+        "--param-keys", dest="param_keys", default=None,
+        help="Comma-separated parameters to keep with --max-tokens/--max-bytes/--tabular "
+             "(csv/parquet/arrow: exported as their own columns)",
+    )
 
     # --- offer ---
     sp_offer = sub.add_parser(
-        "offer", parents=[common],
+        "offer", parents=[common, export_output],
         help="Get offer details by ID",
     )
     sp_offer.add_argument("offer_id", help="Offer ID")
+    sp_offer.add_argument(
+        "more_offer_ids", nargs="*", metavar="OFFER_ID",
+        help="Additional offer IDs for a batch lookup",
+    )
     sp_offer.add_argument(
         "--columns", default=None,
         help=f"Comma-separated columns (default: {_DEFAULT_COLUMNS})",
     )
+    sp_offer.add_argument(
+        "--param-keys", dest="param_keys", default=None,
+        help="Comma-separated parameters to keep with --max-tokens/--max-bytes/--tabular "
+             "(csv/parquet/arrow: exported as their own columns)",
+    )
 
     # --- cart ---
     sp_cart = sub.add_parser("cart", parents=[common], help="Manage shopping cart")
     cart_sub = sp_cart.add_subparsers(dest="cart_action", required=True)
 
-    cart_sub.add_parser("list", parents=[common], help="List cart contents")
+    sp_list = cart_sub.add_parser("list", parents=[common], help="List cart contents")
+    sp_list.add_argument(
+        "--changes-only", dest="changes_only", action="store_true", default=False,
+        help="Print only lines added, removed or changed since the last --changes-only run",
+    )
 
     sp_add = cart_sub.add_parser("add", parents=[common], help="Add item to cart (increase quantity)")
-    sp_add.add_argument("offer_id", help="Offer ID")
+    sp_add.add_argument(
+        "offer_id", nargs="?", default=None,
+        help="Offer ID, or several comma-separated IDs",
+    )
     sp_add.add_argument("seller_id", nargs="?", default=None, help="Seller ID (optional, fetched if missing)")
-    sp_add.add_argument("--quantity", type=int, default=1, help="Quantity to add")
+    sp_add.add_argument("--quantity", type=_positive_int, default=1, help="Quantity to add")
     sp_add.add_argument("--category", help="Navigation category ID")
+    sp_add.add_argument(
+        "--from", dest="from_file", metavar="FILE", default=None,
+        help="CSV (with header) or JSON list of offer_id, seller_id, quantity to add in bulk",
+    )
+
+    sp_add.add_argument(
+        "--no-refresh", dest="no_refresh", action="store_true", default=False,
+        help="Do not fetch the cart afterwards; print only what was sent",
+    )
 
-    sp_remove = cart_sub.add_parser("remove", parents=[common], help="Remove item from cart (decrease quantity)")
-    sp_remove.add_argument("offer_id", help="Offer ID")
-    sp_remove.add_argument("seller_id", nargs="?", default=None, help="Seller ID (optional, fetched if missing)")
-    sp_remove.add_argument("--quantity", type=int, default=1, help="Quantity to remove")
+    sp_remove = cart_sub.add_parser("remove", parents=[common], help="Remove items from cart")
+    sp_remove.add_argument("offer_id", help="Offer ID, or several comma-separated IDs")
+    sp_remove.add_argument(
+        "--no-refresh", dest="no_refresh", action="store_true", default=False,
+        help="Do not fetch the cart afterwards; print only what was removed",
+    )
 
     # --- packages ---
-    sub.add_parser("packages", parents=[common], help="Show packages/delivery summary")
+    sp_packages = sub.add_parser("packages", parents=[common], help="Show packages/delivery summary")
+    sp_packages.add_argument(
+        "--changes-only", dest="changes_only", action="store_true", default=False,
+        help="Print only parcels added, removed or changing status since the last --changes-only run",
+    )
+    packages_sub = sp_packages.add_subparsers(dest="packages_action")
+    sp_watch = packages_sub.add_parser(
+        "watch", parents=[common],
+        help="Keep polling and print NDJSON events for parcel status changes",
+    )
+    sp_watch.add_argument(
+        "--interval", type=float, default=300.0,
+        help="Seconds between polls while parcels are in transit (default: 300)",
+    )
+    sp_watch.add_argument(
+        "--min-interval", dest="min_interval", type=float, default=60.0,
+        help="Seconds between polls while a parcel is out for delivery or awaits pickup (default: 60)",
+    )
+    sp_watch.add_argument(
+        "--max-interval", dest="max_interval", type=float, default=1800.0,
+        help="Longest pause when nothing is moving (default: 1800)",
+    )
+    sp_watch.add_argument(
+        "--polls", type=int, default=0,
+        help="Stop after this many polls (default: run until interrupted)",
+    )
+
+    # --- watch ---
+    sp_watch_cmd = sub.add_parser("watch", parents=[common], help="Track offer prices over time")
+    watch_sub = sp_watch_cmd.add_subparsers(dest="watch_action", required=True)
+
+    sp_watch_offers = watch_sub.add_parser(
+        "offers", parents=[common],
+        help="Re-check offers on a schedule; print NDJSON events when price or availability changes",
+    )
+    sp_watch_offers.add_argument("file", help="File with offer IDs (one per line, CSV or JSON list)")
+    sp_watch_offers.add_argument(
+        "--interval", type=float, default=3600.0,
+        help="Seconds in which every offer is checked once (default: 3600)",
+    )
+    sp_watch_offers.add_argument(
+        "--rate", type=float, default=20.0,
+        help="Global limit in requests per minute (default: 20)",
+    )
+    sp_watch_offers.add_argument(
+        "--rounds", type=int, default=0,
+        help="Stop after checking every offer this many times (default: run until interrupted)",
+    )
+
+    sp_watch_history = watch_sub.add_parser(
+        "history", parents=[common], help="Show the recorded price history of an offer",
+    )
+    sp_watch_history.add_argument("offer_id", help="Offer ID")
+
+    # --- saved searches ---
+    sp_saved = sub.add_parser(
+        "saved", parents=[common],
+        help="Saved searches that report only new or repriced offers",
+    )
+    saved_sub = sp_saved.add_subparsers(dest="saved_action", required=True)
+
+    sp_saved_add = saved_sub.add_parser(
+        "add", parents=[common, search_filters],
+        help="Save a search phrase and filters under a name",
+    )
+    sp_saved_add.add_argument("name", help="Name of the saved search")
+    sp_saved_add.add_argument("phrase", help="Search phrase")
+    sp_saved_add.add_argument(
+        "--pages", type=_positive_int, default=1,
+        help="Pages to scan per run (default: 1)",
+    )
+
+    sp_saved_run = saved_sub.add_parser(
+        "run", parents=[common],
+        help="Run a saved search; print offers not seen before or with a changed price",
+    )
+    sp_saved_run.add_argument("name", help="Name of the saved search")
+    sp_saved_run.add_argument(
+        "--pages", type=_positive_int, default=None,
+        help="Override the number of pages to scan",
+    )
+
+    saved_sub.add_parser("list", parents=[common], help="List saved searches")
+
+    sp_saved_remove = saved_sub.add_parser("remove", parents=[common], help="Delete a saved search")
+    sp_saved_remove.add_argument("name", help="Name of the saved search")
+
+    # --- local store ---
+    sp_local = sub.add_parser(
+        "local", parents=[common],
+        help="Query offers kept by the local store, without network access",
+    )
+    local_sub = sp_local.add_subparsers(dest="local_action", required=True)
+
+    sp_local_search = local_sub.add_parser(
+        "search", parents=[common, export_output], help="Search offers seen earlier",
+    )
+    sp_local_search.add_argument(
+        "phrase", nargs="?", default=None,
+        help="Words to match in offer names and parameter values",
+    )
+    sp_local_search.add_argument("--price-min", dest="price_min", default=None, help="Minimum price in PLN")
+    sp_local_search.add_argument("--price-max", dest="price_max", default=None, help="Maximum price in PLN")
+    sp_local_search.add_argument(
+        "--param", action="append", default=None,
+        help="Required parameter in 'key=value' format (repeatable)",
+    )
+    sp_local_search.add_argument(
+        "--since", default=None,
+        help="Only offers seen since a duration ago (30m, 24h, 7d) or a date (2026-10-18)",
+    )
+    sp_local_search.add_argument("--limit", type=int, default=50, help="Maximum results (default: 50)")
+    sp_local_search.add_argument(
+        "--columns", default=None,
+        help=f"Comma-separated columns (default: {_DEFAULT_COLUMNS})",
+    )
+
+    sp_local_history = local_sub.add_parser(
+        "history", parents=[common], help="Prices an offer was seen at",
+    )
+    sp_local_history.add_argument("offer_id", help="Offer ID")
+
+    # --- bench ---
+    sp_bench = sub.add_parser(
+        "bench", parents=[common],
+        help="Measure search/offer throughput against --replay captures or a stand-in",
+    )
+    sp_bench.add_argument(
+        "--standin", metavar="FIXTURES", default=None,
+        help="Start an in-process stand-in server serving FIXTURES",
+    )
+    sp_bench.add_argument(
+        "--target", metavar="URL", default=None,
+        help="Base URL of an already running stand-in server",
+    )
+    sp_bench.add_argument(
+        "--latency", type=float, default=0.0,
+        help="With --standin: added server latency in seconds",
+    )
+    sp_bench.add_argument(
+        "--phrase", action="append", default=None,
+        help="Search phrase to use (repeatable, default: laptop)",
+    )
+    sp_bench.add_argument(
+        "--offer-id", dest="offer_id", action="append", default=None,
+        help="Offer ID to look up (repeatable, default: 12345678)",
+    )
+    sp_bench.add_argument(
+        "--search-ratio", dest="search_ratio", type=float, default=0.5,
+        help="Fraction of operations that are searches (default: 0.5)",
+    )
+    sp_bench.add_argument("--concurrency", type=int, default=4, help="Worker threads (default: 4)")
+    sp_bench.add_argument("--duration", type=float, default=10.0, help="Seconds to run (default: 10)")
+    sp_bench.add_argument(
+        "--requests", type=int, default=None,
+        help="Stop after this many operations (default: run for --duration)",
+    )
 
     # --- login ---
     sub.add_parser("login", parents=[common], help="Import browser cookies (paste from Chrome DevTools)")
@@ -144,66 +420,180 @@ def create_parser() -> argparse.ArgumentParser:
     sp_set = config_sub.add_parser("set", parents=[common], help="Update configuration")
     sp_set.add_argument("--cookies", help="Browser cookie string from Chrome DevTools")
     sp_set.add_argument("--edge-base-url", dest="edge_base_url")
-    sp_set.add_argument("--output-format", dest="output_format", choices=["text", "json", "tsv"])
+    sp_set.add_argument(
+        "--scrape-base-url", dest="scrape_base_url",
+        help="Base URL for scraped pages (default: https://allegro.pl)",
+    )
+    sp_set.add_argument("--output-format", dest="output_format", choices=_DEFAULT_FORMATS)
     sp_set.add_argument(
         "--flaresolverr-url", dest="flaresolverr_url",
         help="FlareSolverr URL (e.g. http://localhost:8191/v1)",
     )
+    sp_set.add_argument(
+        "--offer-price-ttl", dest="offer_price_ttl", type=int, metavar="SECONDS",
+        help="How long a cached offer's price is trusted (default: 900)",
+    )
+    sp_set.add_argument(
+        "--offer-params-ttl", dest="offer_params_ttl", type=int, metavar="SECONDS",
+        help="How long cached parameters and seller are trusted (default: 604800)",
+    )
+    sp_set.add_argument(
+        "--local-store", dest="local_store", choices=["on", "off"],
+        help="Keep every parsed offer in a local database for 'allegro local search'",
+    )
 
     return parser
 
 
+def _dispatch(args, config) -> int:
+    if args.command == "login":
+        from allegro_cli.commands.login import handle_login
+        return handle_login(args)
+
+    if args.command == "config":
+        from allegro_cli.commands.config_cmd import (
+            handle_config_set,
+            handle_config_show,
+        )
+        match args.config_action:
+            case "show":
+                return handle_config_show(args)
+            case "set":
+                return handle_config_set(args)
+
+    if args.command == "bench":
+        from allegro_cli.commands.bench import handle_bench
+        return handle_bench(args, config)
+
+    if args.command == "local":
+        from allegro_cli.commands.local import handle_local_history, handle_local_search
+        match args.local_action:
+            case "search":
+                return handle_local_search(args)
+            case "history":
+                return handle_local_history(args)
+
+    if args.format in EXPORT_FORMATS and args.command not in ("search", "offer"):
+        raise AllegroCliError(
+            message=f"--format {args.format} is only supported for search and offer",
+            code="UnsupportedFormatException",
+        )
+
+    if args.command in ("search", "offer", "cart", "packages"):
+        from allegro_cli.budget import check_format
+        check_format(args)
+
+    # Commands that need the API client
+    from allegro_cli.api.client import AllegroClient
+    offer_cache = None
+    if not args.no_cache and not args.replay:
+        from allegro_cli.cache import OfferCache
+        offer_cache = OfferCache.from_config(config)
+    local_store = None
+    if config.localStore and not args.replay:
+        from allegro_cli.local_store import LocalStore
+        local_store = LocalStore()
+    client = AllegroClient(
+        config,
+        verbose=args.verbose,
+        record_dir=args.record,
+        replay_dir=args.replay,
+        replay_realtime=args.replay_realtime,
+        offer_cache=offer_cache,
+        local_store=local_store,
+    )
+
+    match args.command:
+        case "search":
+            from allegro_cli.commands.search import handle_search
+            return handle_search(args, client)
+        case "offer":
+            from allegro_cli.commands.search import handle_offer
+            return handle_offer(args, client)
+        case "cart":
+            from allegro_cli.commands.cart import (
+                handle_cart_list,
+                handle_cart_add,
+                handle_cart_remove,
+            )
+            match args.cart_action:
+                case "list":
+                    return handle_cart_list(args, client)
+                case "add":
+                    return handle_cart_add(args, client)
+                case "remove":
+                    return handle_cart_remove(args, client)
+        case "packages":
+            from allegro_cli.commands.packages import (
+                handle_packages_summary,
+                handle_packages_watch,
+            )
+            if getattr(args, "packages_action", None) == "watch":
+                return handle_packages_watch(args, client)
+            return handle_packages_summary(args, client)
+        case "saved":
+            from allegro_cli.commands.saved import (
+                handle_saved_add,
+                handle_saved_list,
+                handle_saved_remove,
+                handle_saved_run,
+            )
+            match args.saved_action:
+                case "add":
+                    return handle_saved_add(args, client)
+                case "run":
+                    return handle_saved_run(args, client)
+                case "list":
+                    return handle_saved_list(args, client)
+                case "remove":
+                    return handle_saved_remove(args, client)
+        case "watch":
+            from allegro_cli.commands.watch import handle_watch_history, handle_watch_offers
+            match args.watch_action:
+                case "offers":
+                    return handle_watch_offers(args, client)
+                case "history":
+                    return handle_watch_history(args, client)
+
+    return 0
+
+
+def _check_output(args) -> None:
+    if getattr(args, "output", None) and args.format not in EXPORT_FORMATS:
+        raise AllegroCliError(
+            message=f"--output is not supported with --format {args.format}",
+            code="InvalidArgumentException",
+            userMessage="--output only applies to csv/parquet/arrow exports; "
+                        "redirect stdout for other formats.",
+        )
+
+
 def main() -> int:
     ensure_dirs()
     parser = create_parser()
     args = parser.parse_args()
 
     config = load_config()
-    args.format = args.format or config.outputFormat or "text"
+    # Budgeted output is meant for agents: default to JSON rather than a table
+    budgeted = (
+        getattr(args, "max_tokens", None)
+        or getattr(args, "max_bytes", None)
+        or getattr(args, "tabular", False)
+    )
+    args.format = args.format or ("json" if budgeted else config.outputFormat) or "text"
 
     try:
-        if args.command == "login":
-            from allegro_cli.commands.login import handle_login
-            return handle_login(args)
-
-        if args.command == "config":
-            from allegro_cli.commands.config_cmd import (
-                handle_config_set,
-                handle_config_show,
-            )
-            match args.config_action:
-                case "show":
-                    return handle_config_show(args)
-                case "set":
-                    return handle_config_set(args)
-
-        # Commands that need the API client
-        from allegro_cli.api.client import AllegroClient
-        client = AllegroClient(config, verbose=args.verbose)
-
-        match args.command:
-            case "search":
-                from allegro_cli.commands.search import handle_search
-                return handle_search(args, client)
-            case "offer":
-                from allegro_cli.commands.search import handle_offer
-                return handle_offer(args, client)
-            case "cart":
-                from allegro_cli.commands.cart import (
-                    handle_cart_list,
-                    handle_cart_add,
-                    handle_cart_remove,
-                )
-                match args.cart_action:
-                    case "list":
-                        return handle_cart_list(args, client)
-                    case "add":
-                        return handle_cart_add(args, client)
-                    case "remove":
-                        return handle_cart_remove(args, client)
-            case "packages":
-                from allegro_cli.commands.packages import handle_packages_summary
-                return handle_packages_summary(args, client)
+        _check_output(args)
+        if args.profile:
+            from allegro_cli.profiling import profile_session
+            with profile_session(
+                args.profile,
+                label=f"allegro-{args.command}",
+                memory=args.profile_memory,
+                top=args.profile_top,
+            ):
+                return _dispatch(args, config)
+        return _dispatch(args, config)
 
     except AuthenticationError as exc:
         output_error([make_error(
@@ -230,8 +620,6 @@ def main() -> int:
         )])
         return 1
 
-    return 0
-
 
 def cli() -> None:
     sys.exit(main())
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 import dataclasses
+import itertools
 import json
 import sys
-from typing import Any
+from typing import Any, Callable, Iterable
 
+from allegro_cli.api.models import AllegroCliError, OfferBatch
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
 console = Console()
 
+# Formats that write the whole result as a single structured document
+DOCUMENT_FORMATS = ("json", "msgpack")
+
 
 def _to_serializable(obj: Any) -> Any:
+    # Models provide hand-written to_dict(); asdict() is the generic fallback
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None and not isinstance(obj, type):
+        return to_dict()
     if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
         return dataclasses.asdict(obj)
+    if isinstance(obj, list):
+        return [_to_serializable(o) for o in obj]
     return obj
 
 
@@ -24,6 +35,56 @@ def output_json(data: Any, file=None) -> None:
     print(file=file)
 
 
+def output_ndjson(items: Iterable[Any], file=None) -> None:
+    """Write one compact JSON object per line, flushing after each.
+
+    *items* may be a generator; every object is written as soon as it is
+    produced so pipelines (``jq``, agents) can start before the command ends.
+    """
+    file = file or sys.stdout
+    for item in items:
+        file.write(json.dumps(_to_serializable(item), ensure_ascii=False, separators=(",", ":")))
+        file.write("\n")
+        file.flush()
+
+
+def _require_msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise AllegroCliError(
+            message="msgpack is not installed",
+            code="MissingDependencyException",
+            userMessage="MessagePack output needs msgpack: pip install 'allegro-cli[msgpack]'",
+        )
+    return msgpack
+
+
+def output_msgpack(data: Any, file=None) -> None:
+    """Write *data* as a single MessagePack document.
+
+    The object layout is exactly what ``output_json`` would print, so
+    ``decode_msgpack`` on the output equals ``json.loads`` on the JSON.
+    """
+    msgpack = _require_msgpack()
+    file = file or sys.stdout.buffer
+    file.write(msgpack.packb(_to_serializable(data), use_bin_type=True))
+    file.flush()
+
+
+def decode_msgpack(payload: bytes) -> Any:
+    """Decode ``--format msgpack`` output back into plain dicts and lists."""
+    return _require_msgpack().unpackb(payload, raw=False)
+
+
+def output_document(data: Any, fmt: str, file=None) -> None:
+    """Write *data* as one document in a structured format (json or msgpack)."""
+    if fmt == "msgpack":
+        output_msgpack(data, file)
+    else:
+        output_json(data, file)
+
+
 def output_error(errors: list[dict], file=None) -> None:
     file = file or sys.stderr
     # For agent compatibility, we keep JSON output for errors
@@ -47,40 +108,181 @@ def make_error(
     }
 
 
-def _get_nested(d: dict, key: str) -> str:
-    parts = key.split(".")
-    val: Any = d
-    for p in parts:
-        if isinstance(val, dict):
-            val = val.get(p, "")
-        else:
-            return ""
+# Rows written per file.write() call by the buffered TSV writer
+_TSV_CHUNK_ROWS = 2000
+
+
+def _format_cell(val: Any) -> str:
     if val is None:
         return ""
+    if isinstance(val, str):
+        return val
     if isinstance(val, dict):
         return json.dumps(val, ensure_ascii=False)
+    if hasattr(val, "to_dict"):
+        return json.dumps(val.to_dict(), ensure_ascii=False)
+    if isinstance(val, list):
+        return str(_to_serializable(val))
     return str(val)
 
 
-def output_text(rows: list[dict], columns: list[str], file=None) -> None:
-    if not rows:
-        console.print("[yellow](no results)[/yellow]")
+def _compile_accessor(key: str) -> Callable[[Any], str]:
+    """Build a getter for a dotted column that works on dicts and models.
+
+    The key is split once; each call then only walks the parts.  Walking
+    into anything that is neither a dict nor a model yields ``""``.
+    """
+    parts = tuple(key.split("."))
+
+    def get(row: Any) -> str:
+        val = row
+        for p in parts:
+            if isinstance(val, dict):
+                val = val.get(p, "")
+            elif hasattr(val, "to_dict"):
+                val = getattr(val, p, "")
+            else:
+                return ""
+        return _format_cell(val)
+
+    if len(parts) == 1:
+        (name,) = parts
+
+        def get_top(row: Any) -> str:
+            if isinstance(row, dict):
+                return _format_cell(row.get(name, ""))
+            return get(row)
+        return get_top
+    return get
+
+
+def compile_columns(columns: list[str]) -> Callable[[Any], list[str]]:
+    """Compile ``--columns`` once into a row -> cells function."""
+    accessors = [_compile_accessor(col) for col in columns]
+    return lambda row: [get(row) for get in accessors]
+
+
+# Result sets up to this size keep the rich table look; bigger ones (or
+# piped output past the lower limit) stream through the plain writer.
+_RICH_MAX_ROWS = 500
+_RICH_MAX_ROWS_PIPED = 100
+# Rows sampled to size plain-writer columns, and the per-column cap
+_TEXT_SAMPLE_ROWS = 200
+_TEXT_MAX_COL_WIDTH = 60
+
+
+def output_text(
+    rows: Iterable[Any],
+    columns: list[str],
+    file=None,
+    mode: str | None = None,
+) -> None:
+    """Render rows as a table.
+
+    Small results get a rich table.  Large ones are written incrementally by
+    a fixed-width writer sized from the first rows, so output starts after
+    the first page instead of after the whole crawl.  *mode* forces
+    ``"rich"`` or ``"plain"``; by default it is picked from the row count
+    and whether the output is a terminal.
+    """
+    out = Console(file=file) if file else console
+    cells = compile_columns(columns)
+
+    limit = _RICH_MAX_ROWS if out.is_terminal else _RICH_MAX_ROWS_PIPED
+    if mode == "rich":
+        limit = None
+    elif mode == "plain":
+        limit = 0
+
+    it = iter(rows)
+    head = list(itertools.islice(it, limit + 1 if limit is not None else None))
+    if not head:
+        out.print("[yellow](no results)[/yellow]")
         return
 
-    table = Table(show_header=True, header_style="bold magenta")
-    for col in columns:
-        table.add_column(col)
+    if limit is None or len(head) <= limit:
+        table = Table(show_header=True, header_style="bold magenta")
+        for col in columns:
+            table.add_column(col)
+        for row in head:
+            table.add_row(*cells(row))
+        out.print(table)
+        return
 
-    for row in rows:
-        table.add_row(*[_get_nested(row, col) for col in columns])
+    head.extend(itertools.islice(it, max(_TEXT_SAMPLE_ROWS - len(head), 0)))
+    _write_plain(head, it, columns, cells, file or sys.stdout)
 
-    console.print(table)
 
+def _clean_cell(text: str) -> str:
+    if "\n" in text or "\t" in text or "\r" in text:
+        return text.replace("\r", " ").replace("\n", " ").replace("\t", " ")
+    return text
 
-def output_tsv(rows: list[dict], columns: list[str], file=None) -> None:
+
+def _write_plain(head: list, rest, columns: list[str], cells, file) -> None:
+    head_cells = [[_clean_cell(c) for c in cells(row)] for row in head]
+    widths = [
+        min(max([len(col)] + [len(r[i]) for r in head_cells]), _TEXT_MAX_COL_WIDTH)
+        for i, col in enumerate(columns)
+    ]
+
+    def fmt(values: list[str]) -> str:
+        parts = []
+        for v, w in zip(values, widths):
+            if len(v) > w:
+                v = v[:w - 1] + "…"
+            parts.append(v.ljust(w))
+        return "  ".join(parts).rstrip() + "\n"
+
+    file.write(fmt(columns))
+    file.write("  ".join("-" * w for w in widths) + "\n")
+    chunk = [fmt(r) for r in head_cells]
+    file.write("".join(chunk))
+    file.flush()
+    chunk.clear()
+    for row in rest:
+        chunk.append(fmt([_clean_cell(c) for c in cells(row)]))
+        if len(chunk) >= _TSV_CHUNK_ROWS:
+            file.write("".join(chunk))
+            file.flush()
+            chunk.clear()
+    file.write("".join(chunk))
+    file.flush()
+
+
+def _batch_columns(batch: OfferBatch, columns: list[str]) -> list[list[str]]:
+    result = []
+    for col in columns:
+        try:
+            values = batch.column(col)
+        except KeyError:
+            # Not stored column-wise: fall back to per-offer lookup
+            get = _compile_accessor(col)
+            result.append([get(o) for o in batch])
+            continue
+        result.append([_format_cell(v) for v in values])
+    return result
+
+
+def output_tsv(rows: Iterable[Any] | OfferBatch, columns: list[str], file=None) -> None:
+    """Write rows (dicts, models or an OfferBatch) as TSV in large chunks."""
     file = file or sys.stdout
-    if not rows:
-        return
-    print("\t".join(columns), file=file)
-    for row in rows:
-        print("\t".join(_get_nested(row, col) for col in columns), file=file)
+    if isinstance(rows, OfferBatch):
+        if not rows:
+            return
+        lines: Iterable[list[str]] = zip(*_batch_columns(rows, columns))
+    else:
+        it = iter(rows)
+        first = next(it, None)
+        if first is None:
+            return
+        cells = compile_columns(columns)
+        lines = map(cells, itertools.chain((first,), it))
+
+    chunk = ["\t".join(columns) + "\n"]
+    for line in lines:
+        chunk.append("\t".join(line) + "\n")
+        if len(chunk) >= _TSV_CHUNK_ROWS:
+            file.write("".join(chunk))
+            chunk.clear()
+    file.write("".join(chunk))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def profile_session(
+    out_dir: str | Path,
+    label: str = "allegro",
+    memory: bool = False,
+    top: int = 20,
+    file=None,
+) -> Iterator[None]:
+    """Profile the wrapped block with cProfile (and optionally tracemalloc).
+
+    Writes ``<label>-<timestamp>.pstats`` to *out_dir* and, when *memory* is
+    set, a ``-alloc.txt`` report with the top allocation sites.  The hottest
+    functions are printed to stderr so slow runs can be diagnosed without
+    loading the dump.
+    """
+    file = file or sys.stderr
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    stem = f"{label}-{time.strftime('%Y%m%d-%H%M%S')}"
+
+    if memory:
+        tracemalloc.start(25)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot() if memory else None
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        pstats_path = out / f"{stem}.pstats"
+        profiler.dump_stats(str(pstats_path))
+
+        buf = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buf)
+        stats.sort_stats("cumulative").print_stats(top)
+        print(f"Profile written to {pstats_path}", file=file)
+        print(buf.getvalue(), file=file)
+
+        if snapshot is not None:
+            alloc_path = out / f"{stem}-alloc.txt"
+            alloc_path.write_text(
+                _format_allocations(snapshot, peak, top), encoding="utf-8",
+            )
+            print(f"Allocation report written to {alloc_path}", file=file)
+
+
+def _format_allocations(snapshot: tracemalloc.Snapshot, peak: int, top: int) -> str:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    stats = snapshot.statistics("lineno")
+    lines = [
+        f"Peak traced memory: {peak / 1024:.1f} KiB",
+        f"Top {top} allocation sites:",
+    ]
+    for i, stat in enumerate(stats[:top], 1):
+        frame = stat.traceback[0]
+        lines.append(
+            f"{i:>3}. {frame.filename}:{frame.lineno}: "
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        )
+    return "\n".join(lines) + "\n"
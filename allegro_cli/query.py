@@ -0,0 +1,147 @@
+"""Client-side ``--where`` / ``--order-by`` over fetched offers.
+
+Filters Allegro's listing does not support (seller name, parameter values,
+regexes on titles) run locally on whatever the search fetched.  Expressions
+are parsed once into a ``Query``; applying it loads each referenced column
+from an ``OfferBatch`` once and evaluates every clause as a pass over that
+column, so the cost is per column, not per offer and clause.
+
+Clause syntax: ``FIELD OP VALUE`` with OP one of ``= != < <= > >= ~``
+(``~`` is a case-insensitive regex search; ``=`` / ``!=`` ignore case).
+Fields: ``price`` (compared numerically), ``name``, ``id``, ``seller``,
+``seller.id``, ``category``, ``format``, ``currency``, ``param.<Name>``,
+or any ``OfferBatch`` column.  ``--order-by`` takes comma-separated fields,
+``-`` in front for descending; missing values sort last.
+"""
+from __future__ import annotations
+
+import operator
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from allegro_cli.api.models import AllegroCliError, Offer, OfferBatch, price_minor
+
+_FIELDS = {
+    "price": "sellingMode.price.amountMinor",
+    "name": "name",
+    "id": "id",
+    "seller": "seller.name",
+    "seller.id": "seller.id",
+    "category": "category.id",
+    "format": "sellingMode.format",
+    "currency": "sellingMode.price.currency",
+}
+_NUMERIC = {"sellingMode.price.amountMinor"}
+
+_CLAUSE_RE = re.compile(r"^\s*(.+?)\s*(<=|>=|!=|=|<|>|~)\s*(.*?)\s*$")
+
+_ORDERING = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def _invalid(message: str) -> AllegroCliError:
+    return AllegroCliError(
+        message=message,
+        code="InvalidQueryException",
+        userMessage=f"{message}. Use e.g. --where 'price<=100' --where 'param.Marka=Dell' --order-by -price",
+    )
+
+
+def _column(name: str) -> str:
+    name = name.strip()
+    if name in _FIELDS:
+        return _FIELDS[name]
+    if name.startswith("param."):
+        return "parameters." + name[len("param."):]
+    if name in OfferBatch.COLUMNS or name.startswith("parameters."):
+        return name
+    raise _invalid(f"Unknown field {name!r}")
+
+
+@dataclass
+class Clause:
+    column: str
+    op: str
+    test: Callable[[Any], bool]
+
+    @classmethod
+    def parse(cls, text: str) -> Clause:
+        match = _CLAUSE_RE.match(text)
+        if not match:
+            raise _invalid(f"Cannot parse condition {text!r}")
+        name, op, raw = match.groups()
+        column = _column(name)
+
+        if column in _NUMERIC:
+            if op == "~":
+                raise _invalid(f"{name} is numeric; ~ needs a text field")
+            bound = price_minor(raw.replace(" ", "").replace(",", "."))
+            if bound is None:
+                raise _invalid(f"{raw!r} is not a price")
+            compare = _ORDERING.get(op) or (operator.eq if op == "=" else operator.ne)
+            return cls(column, op, lambda v: v is not None and compare(v, bound))
+
+        if op == "~":
+            try:
+                pattern = re.compile(raw, re.IGNORECASE)
+            except re.error as e:
+                raise _invalid(f"Bad regex {raw!r}: {e}")
+            return cls(column, op, lambda v: bool(v) and pattern.search(v) is not None)
+        if op in _ORDERING:
+            raise _invalid(f"{op} only works on price; use = or ~ for {name}")
+        wanted = raw.casefold()
+        if op == "=":
+            return cls(column, op, lambda v: bool(v) and v.casefold() == wanted)
+        return cls(column, op, lambda v: not v or v.casefold() != wanted)
+
+
+@dataclass
+class Query:
+    where: list[Clause] = field(default_factory=list)
+    order: list[tuple[str, bool]] = field(default_factory=list)  # (column, descending)
+
+    def indices(self, batch: OfferBatch) -> list[int]:
+        """Positions of matching rows, in ``--order-by`` order."""
+        columns: dict[str, list] = {}
+
+        def col(name: str) -> list:
+            if name not in columns:
+                columns[name] = batch.column(name)
+            return columns[name]
+
+        keep = [True] * len(batch)
+        for clause in self.where:
+            test = clause.test
+            keep = [k and test(v) for k, v in zip(keep, col(clause.column))]
+        rows = [i for i, k in enumerate(keep) if k]
+
+        # Stable sorts from the last key to the first
+        for name, descending in reversed(self.order):
+            values = col(name)
+            if name not in _NUMERIC:
+                values = [v.casefold() if isinstance(v, str) else v for v in values]
+            present = [i for i in rows if values[i] not in (None, "")]
+            present.sort(key=values.__getitem__, reverse=descending)
+            rows = present + [i for i in rows if values[i] in (None, "")]
+        return rows
+
+    def apply(self, offers: list[Offer]) -> list[Offer]:
+        offers = list(offers)
+        return [offers[i] for i in self.indices(OfferBatch(offers))]
+
+    def filter(self, offers: list[Offer]) -> list[Offer]:
+        """Offers matching ``--where``, in their original order."""
+        return Query(where=self.where).apply(offers)
+
+
+def compile_query(where: list[str] | None = None, order_by: str | None = None) -> Query | None:
+    """Parse ``--where`` clauses (ANDed) and an ``--order-by`` list; None if both are empty."""
+    if not where and not order_by:
+        return None
+    query = Query(where=[Clause.parse(w) for w in where or []])
+    for name in (order_by or "").split(","):
+        name = name.strip()
+        if name:
+            descending = name.startswith("-")
+            query.order.append((_column(name.lstrip("-+")), descending))
+    return query
@@ -0,0 +1,100 @@
+"""Saved searches that report only what is new since their last run.
+
+A saved search stores the keyword arguments of ``AllegroClient.iter_search``
+under a name.  Each run compares the offers found with the prices recorded
+for that search and yields an event for offers it has never reported and
+for offers whose price moved; everything else is skipped.
+
+When the search is sorted by newest (``sort="n"``) the listing is in
+chronological order, so a run of already-seen offers means the rest is old
+too: iteration stops there and no further pages are fetched.  A short run is
+tolerated because promoted offers can sit above the new ones.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+
+from allegro_cli.api.models import AllegroCliError, Offer
+from allegro_cli.state import StateStore
+
+# Consecutive already-seen offers that end a newest-first run
+SEEN_RUN_STOP = 5
+
+
+def require_saved(state: StateStore, name: str) -> dict:
+    params = state.saved_search(name)
+    if params is None:
+        raise AllegroCliError(
+            message=f"No saved search named {name!r}",
+            code="SavedSearchNotFoundException",
+            userMessage=f"Unknown saved search {name!r}; see: allegro saved list",
+        )
+    return params
+
+
+@dataclass
+class SavedRunReport:
+    scanned: int = 0
+    new: int = 0
+    changed: int = 0
+    stoppedEarly: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "scanned": self.scanned,
+            "new": self.new,
+            "changed": self.changed,
+            "stoppedEarly": self.stoppedEarly,
+        }
+
+
+def run_saved(
+    client,
+    state: StateStore,
+    name: str,
+    pages: int | None = None,
+    report: SavedRunReport | None = None,
+) -> Iterator[tuple[str, Offer, str | None]]:
+    """Yield ``(change, offer, previous_price)`` for new and repriced offers.
+
+    *change* is ``"new"`` or ``"price"``.  Offers are marked as seen when
+    the generator finishes or the consumer closes it, so an interrupted run
+    re-reports nothing it has already yielded.  A run that fails (e.g. a
+    429 on a later page) marks nothing: a consumer that buffers events has
+    printed none of them, and reporting an offer twice beats never.
+    """
+    params = require_saved(state, name)
+    if pages:
+        params["pages"] = pages
+    report = report if report is not None else SavedRunReport()
+    newest = params.get("sort") == "n"
+    seen: dict[str, str] = {}
+    seen_run = 0
+    completed = False
+    try:
+        for offer in client.iter_search(**params):
+            if offer.id in seen:
+                continue
+            report.scanned += 1
+            amount = offer.sellingMode.price.amount
+            previous = state.seen_price(name, offer.id)
+            seen[offer.id] = amount
+            if previous is None:
+                report.new += 1
+                yield "new", offer, None
+            elif previous != amount:
+                report.changed += 1
+                yield "price", offer, previous
+
+            seen_run = seen_run + 1 if previous is not None else 0
+            if newest and seen_run >= SEEN_RUN_STOP:
+                report.stoppedEarly = True
+                break
+        completed = True
+    except GeneratorExit:
+        completed = True
+        raise
+    finally:
+        if completed:
+            state.mark_seen(name, seen)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+import sys
 
 from bs4 import BeautifulSoup, Tag
 
@@ -9,12 +10,30 @@ from allegro_cli.api.models import (
     Category,
     Image,
     Offer,
+    OfferBatch,
     Price,
     Seller,
     SellingMode,
 )
 
 
+# Parameter names, short values ("Nowy", "Tak") and prices repeat across
+# thousands of offers; interning keeps one copy of each distinct string.
+_INTERN_MAX_LEN = 32
+
+
+def _key(name) -> str:
+    return sys.intern(str(name))
+
+
+def _intern(text: str) -> str:
+    return sys.intern(text) if len(text) <= _INTERN_MAX_LEN else text
+
+
+def _price(amount: str) -> Price:
+    return Price(amount=_intern(amount), currency="PLN")
+
+
 def _extract_offer_id(url: str) -> str | None:
     if not url:
         return None
@@ -118,8 +137,8 @@ def _is_real_offer(article: Tag, offer_id: str | None, title: str) -> bool:
     return False
 
 
-def _try_extract_json_offers(html: str) -> list[Offer] | None:
-    """Try to extract offers from embedded JSON (e.g. __NEXT_DATA__)."""
+def _next_data_items(html: str) -> list | None:
+    """Offer items from the page's embedded JSON (e.g. __NEXT_DATA__)."""
     match = re.search(
         r'<script\s+id="__NEXT_DATA__"\s+type="application/json">(.*?)</script>',
         html,
@@ -142,8 +161,11 @@ def _try_extract_json_offers(html: str) -> list[Offer] | None:
         items = state.get("listing", {}).get("items")
     if not items or not isinstance(items, list):
         return None
+    return items
 
-    offers: list[Offer] = []
+
+def _item_fields(items: list):
+    """``(id, name, amount, seller_id, seller_name, image_urls)`` per usable item."""
     for item in items:
         try:
             offer_id = str(item.get("id", ""))
@@ -162,11 +184,11 @@ def _try_extract_json_offers(html: str) -> list[Offer] | None:
 
             # Image
             images_raw = item.get("images", []) or item.get("photos", [])
-            images = []
+            image_urls = []
             for img in images_raw:
                 url = img.get("url", "") if isinstance(img, dict) else str(img)
                 if url:
-                    images.append(Image(url=url))
+                    image_urls.append(url)
 
             # Seller
             seller_data = item.get("seller", {})
@@ -175,26 +197,52 @@ def _try_extract_json_offers(html: str) -> list[Offer] | None:
             if isinstance(seller_data, dict):
                 seller_id = str(seller_data.get("id", ""))
                 seller_name = seller_data.get("login", seller_data.get("name", ""))
-
-            offers.append(
-                Offer(
-                    id=offer_id,
-                    name=name,
-                    seller=Seller(id=seller_id, name=seller_name),
-                    sellingMode=SellingMode(
-                        format="BUY_NOW",
-                        price=Price(amount=amount, currency="PLN"),
-                    ),
-                    category=Category(id=""),
-                    images=images,
-                )
-            )
         except Exception:
             continue
+        yield offer_id, name, amount, seller_id, seller_name, image_urls
+
+
+def _try_extract_json_offers(html: str) -> list[Offer] | None:
+    """Try to extract offers from embedded JSON (e.g. __NEXT_DATA__)."""
+    items = _next_data_items(html)
+    if not items:
+        return None
 
+    offers = [
+        Offer(
+            id=offer_id,
+            name=name,
+            seller=Seller(id=seller_id, name=seller_name),
+            sellingMode=SellingMode(format="BUY_NOW", price=_price(amount)),
+            category=Category(id=""),
+            images=[Image(url=url) for url in image_urls],
+        )
+        for offer_id, name, amount, seller_id, seller_name, image_urls in _item_fields(items)
+    ]
     return offers if offers else None
 
 
+def parse_search_results_into(html: str, batch: OfferBatch) -> int:
+    """Parse a listing page straight into a columnar batch; return the count.
+
+    Embedded-JSON items go into the batch field by field, with no ``Offer``
+    in between; pages that need the HTML fallback are parsed as usual.
+    """
+    items = _next_data_items(html)
+    count = 0
+    for offer_id, name, amount, seller_id, seller_name, image_urls in _item_fields(items or []):
+        batch.add(
+            offer_id, name, _price(amount),
+            seller_id=seller_id, seller_name=seller_name, image_urls=image_urls,
+        )
+        count += 1
+    if count:
+        return count
+    offers = parse_search_results(html)
+    batch.extend(offers)
+    return len(offers)
+
+
 def parse_search_results(html: str) -> list[Offer]:
     # Try structured JSON first (more reliable when available)
     json_offers = _try_extract_json_offers(html)
@@ -227,7 +275,7 @@ def parse_search_results(html: str) -> list[Offer]:
                     seller=Seller(id="", name=""),
                     sellingMode=SellingMode(
                         format="BUY_NOW",
-                        price=Price(amount=price_amount, currency="PLN"),
+                        price=_price(price_amount),
                     ),
                     category=Category(id=""),
                     images=[Image(url=image_url)] if image_url else [],
@@ -268,7 +316,7 @@ def _extract_parameters_from_serialized_json(soup: BeautifulSoup) -> dict[str, s
                 if isinstance(value, dict):
                     value = value.get("name", "")
                 if name and value:
-                    result.setdefault(name, str(value))
+                    result.setdefault(_key(name), _intern(str(value)))
             for param in group.get("multiValueParams", []):
                 name = param.get("name", "")
                 values = param.get("values", [])
@@ -283,7 +331,7 @@ def _extract_parameters_from_serialized_json(soup: BeautifulSoup) -> dict[str, s
                 else:
                     value = str(values)
                 if name and value:
-                    result.setdefault(name, value)
+                    result.setdefault(_key(name), _intern(value))
     return result
 
 
@@ -322,7 +370,7 @@ def _extract_parameters_from_json(html: str) -> dict[str, str]:
         if isinstance(value, list):
             value = ", ".join(str(v) for v in value)
         if name:
-            result[name] = str(value)
+            result[_key(name)] = _intern(str(value))
     return result
 
 
@@ -367,7 +415,7 @@ def _extract_params_from_table(table: Tag) -> dict[str, str]:
             key = cells[0].get_text(strip=True)
             val = _extract_param_value(cells[1])
             if key and val:
-                result.setdefault(key, val)
+                result.setdefault(_key(key), _intern(val))
     return result
 
 
@@ -410,7 +458,7 @@ def _extract_parameters_from_html(soup: BeautifulSoup) -> dict[str, str]:
                 key = dt.get_text(strip=True)
                 val = dd.get_text(strip=True)
                 if key:
-                    result[key] = val
+                    result[_key(key)] = _intern(val)
             return result
 
     return {}
@@ -430,7 +478,7 @@ def _walk_for_params(data, result: dict[str, str]) -> None:
                     if isinstance(value, dict):
                         value = value.get("name", "")
                     if name and value:
-                        result.setdefault(name, str(value))
+                        result.setdefault(_key(name), _intern(str(value)))
                 for param in group.get("multiValueParams", []):
                     name = param.get("name", "")
                     values = param.get("values", [])
@@ -445,7 +493,7 @@ def _walk_for_params(data, result: dict[str, str]) -> None:
                     else:
                         value = str(values)
                     if name and value:
-                        result.setdefault(name, value)
+                        result.setdefault(_key(name), _intern(value))
         for v in data.values():
             _walk_for_params(v, result)
     elif isinstance(data, list):
@@ -497,6 +545,49 @@ def parse_opbox_parameters(data) -> dict[str, str]:
     return result
 
 
+_SELLER_ID_RES = (
+    re.compile(r'"sellerId":"(\d+)"'),
+    re.compile(r'"seller":\{"id":"(\d+)"'),
+)
+
+
+def extract_seller_id(html: str) -> str:
+    """Seller ID from an offer page's embedded JSON, without parsing the DOM."""
+    for pattern in _SELLER_ID_RES:
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def _meta_re(prop: str) -> re.Pattern:
+    # Either attribute order: property before content, or after it
+    return re.compile(
+        rf'<meta[^>]*?property="{re.escape(prop)}"[^>]*?content="([^"]*)"'
+        rf'|<meta[^>]*?content="([^"]*)"[^>]*?property="{re.escape(prop)}"'
+    )
+
+
+_PRICE_META_RES = {
+    "amount": _meta_re("product:price:amount"),
+    "currency": _meta_re("product:price:currency"),
+    "availability": _meta_re("product:availability"),
+}
+
+
+def extract_price(html: str) -> dict[str, str]:
+    """``amount``, ``currency`` and ``availability`` from an offer page's meta tags.
+
+    A regex over the raw page, for price checks that need nothing else; the
+    values are empty strings when a tag is missing.
+    """
+    result = {}
+    for key, pattern in _PRICE_META_RES.items():
+        match = pattern.search(html)
+        result[key] = (match.group(1) or match.group(2)) if match else ""
+    return result
+
+
 def parse_offer_page(html: str, offer_id: str = "") -> Offer:
     """Parse a single offer page into an Offer."""
     soup = BeautifulSoup(html, "lxml")
@@ -546,15 +637,8 @@ def parse_offer_page(html: str, offer_id: str = "") -> Offer:
         image_url = og_image["content"]
 
     # Seller ID from embedded JSON
-    seller_id = ""
+    seller_id = extract_seller_id(html)
     seller_name = ""
-    seller_match = re.search(r'"sellerId":"(\d+)"', html)
-    if seller_match:
-        seller_id = seller_match.group(1)
-    if not seller_id:
-        seller_match2 = re.search(r'"seller":\{"id":"(\d+)"', html)
-        if seller_match2:
-            seller_id = seller_match2.group(1)
 
     # Parameters — try serialized JSON (most reliable), then __NEXT_DATA__, then HTML
     parameters = _extract_parameters_from_serialized_json(soup)
@@ -569,7 +653,7 @@ def parse_offer_page(html: str, offer_id: str = "") -> Offer:
         seller=Seller(id=seller_id, name=seller_name),
         sellingMode=SellingMode(
             format="BUY_NOW",
-            price=Price(amount=price_amount, currency="PLN"),
+            price=_price(price_amount),
         ),
         category=Category(id=""),
         images=[Image(url=image_url)] if image_url else [],
@@ -0,0 +1,170 @@
+"""Local state the CLI keeps between runs, in ``state.sqlite``.
+
+Unlike the offer cache this is user data that cannot be fetched again, so
+``--no-cache`` leaves it alone:
+
+- ``snapshots`` -- the last state ``--changes-only`` reported per command,
+- ``price_history`` -- a row whenever ``watch offers`` sees a price or the
+  availability of an offer change,
+- ``saved_searches`` / ``seen_offers`` -- the filters of each saved search
+  and the price each offer had when that search last reported it.
+
+``AllegroClient.state`` opens the store on first use.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from allegro_cli import config as config_module
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    name      TEXT PRIMARY KEY,
+    body_hash TEXT NOT NULL,
+    data      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS price_history (
+    offer_id     TEXT NOT NULL,
+    at           REAL NOT NULL,
+    amount       TEXT NOT NULL,
+    currency     TEXT NOT NULL,
+    availability TEXT NOT NULL,
+    PRIMARY KEY (offer_id, at)
+);
+CREATE TABLE IF NOT EXISTS saved_searches (
+    name   TEXT PRIMARY KEY,
+    params TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen_offers (
+    search   TEXT NOT NULL,
+    offer_id TEXT NOT NULL,
+    amount   TEXT NOT NULL,
+    PRIMARY KEY (search, offer_id)
+);
+"""
+
+
+def default_state_path() -> Path:
+    return config_module.CONFIG_DIR / "state.sqlite"
+
+
+@dataclass
+class PricePoint:
+    amount: str
+    currency: str
+    availability: str
+    at: float
+
+
+class StateStore:
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else default_state_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    # --- Last state reported by --changes-only ---
+
+    def snapshot(self, name: str) -> tuple[str, object] | None:
+        """``(body_hash, data)`` of the last saved snapshot *name*."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body_hash, data FROM snapshots WHERE name = ?", (name,),
+            ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def save_snapshot(self, name: str, body_hash: str, data) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                (name, body_hash, json.dumps(data, ensure_ascii=False, separators=(",", ":"))),
+            )
+            self._db.commit()
+
+    # --- Price history (one row per observed change) ---
+
+    def last_price(self, offer_id: str) -> PricePoint | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT amount, currency, availability, at FROM price_history "
+                "WHERE offer_id = ? ORDER BY at DESC LIMIT 1",
+                (offer_id,),
+            ).fetchone()
+        return PricePoint(*row) if row else None
+
+    def record_price(self, offer_id: str, point: PricePoint) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO price_history VALUES (?, ?, ?, ?, ?)",
+                (offer_id, point.at, point.amount, point.currency, point.availability),
+            )
+            self._db.commit()
+
+    def price_history(self, offer_id: str) -> list[PricePoint]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT amount, currency, availability, at FROM price_history "
+                "WHERE offer_id = ? ORDER BY at",
+                (offer_id,),
+            ).fetchall()
+        return [PricePoint(*row) for row in rows]
+
+    # --- Saved searches and what each one has already reported ---
+
+    def save_search(self, name: str, params: dict) -> None:
+        """Store (or replace) search *name*; a replaced search starts unseen."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO saved_searches VALUES (?, ?)",
+                (name, json.dumps(params, ensure_ascii=False)),
+            )
+            self._db.execute("DELETE FROM seen_offers WHERE search = ?", (name,))
+            self._db.commit()
+
+    def saved_search(self, name: str) -> dict | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT params FROM saved_searches WHERE name = ?", (name,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def saved_searches(self) -> dict[str, dict]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT name, params FROM saved_searches ORDER BY name",
+            ).fetchall()
+        return {name: json.loads(params) for name, params in rows}
+
+    def delete_search(self, name: str) -> bool:
+        with self._lock:
+            cur = self._db.execute("DELETE FROM saved_searches WHERE name = ?", (name,))
+            self._db.execute("DELETE FROM seen_offers WHERE search = ?", (name,))
+            self._db.commit()
+        return cur.rowcount > 0
+
+    def seen_price(self, search: str, offer_id: str) -> str | None:
+        """Price of *offer_id* when *search* last reported it, or None if never."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT amount FROM seen_offers WHERE search = ? AND offer_id = ?",
+                (search, offer_id),
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_seen(self, search: str, prices: dict[str, str]) -> None:
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO seen_offers VALUES (?, ?, ?)",
+                [(search, offer_id, amount) for offer_id, amount in prices.items()],
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,90 @@
+"""Cheapest (or dearest) K offers across result pages, fetching as few as possible.
+
+Offers go through a bounded heap keyed on the price in grosze, so the
+string amounts never have to be compared.  Pages are fetched in order:
+
+- sorted by price (``p`` ascending, ``pd`` descending), the listing only
+  gets worse page by page, so fetching stops once K offers are kept and the
+  last offer of a page is no better than the worst one kept.  The last offer
+  is used because promoted offers at the top of a page break the order;
+- any other order gives no such guarantee, so up to ``page_cap`` pages are
+  scanned.
+
+With ``pd`` the K most expensive offers are kept, otherwise the K cheapest.
+"""
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from typing import Iterable
+
+from allegro_cli.api.models import Offer
+
+DEFAULT_PAGE_CAP = 5
+
+_SORTED = {"p": 1, "pd": -1}
+
+
+@dataclass
+class TopReport:
+    k: int
+    pageCap: int
+    pagesFetched: int = 0
+    offersScanned: int = 0
+    unpriced: int = 0
+    stoppedEarly: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "k": self.k,
+            "pageCap": self.pageCap,
+            "pagesFetched": self.pagesFetched,
+            "offersScanned": self.offersScanned,
+            "unpriced": self.unpriced,
+            "stoppedEarly": self.stoppedEarly,
+        }
+
+
+def top_k(
+    pages: Iterable[list[Offer]],
+    k: int,
+    sort: str | None = None,
+    page_cap: int = DEFAULT_PAGE_CAP,
+) -> tuple[list[Offer], TopReport]:
+    """Best *k* offers from *pages* (an iterator that fetches lazily), best first."""
+    direction = _SORTED.get(sort or "", 1)
+    report = TopReport(k=k, pageCap=page_cap)
+    # Heap root is the worst offer kept: keys are negated "goodness"
+    heap: list[tuple[int, int, Offer]] = []
+    seen: set[str] = set()
+
+    for offers in pages:
+        report.pagesFetched += 1
+        tail = None
+        for offer in offers:
+            minor = offer.sellingMode.price.amountMinor
+            if minor is None:
+                report.unpriced += 1
+                continue
+            tail = minor
+            if offer.id in seen:
+                continue
+            seen.add(offer.id)
+            report.offersScanned += 1
+            # Ties keep the offer ranked higher by the listing
+            entry = (-direction * minor, -report.offersScanned, offer)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        if sort in _SORTED and len(heap) == k and tail is not None:
+            worst = -direction * heap[0][0]
+            if direction * tail >= direction * worst:
+                report.stoppedEarly = report.pagesFetched < page_cap
+                break
+        if report.pagesFetched >= page_cap:
+            break
+
+    best = sorted(heap, reverse=True)
+    return [offer for _, _, offer in best], report
@@ -0,0 +1,156 @@
+"""Price watch: re-check many offers on a schedule and report what changed.
+
+Checks are spread evenly over ``interval`` seconds instead of being fired in
+a burst, and never closer together than the global ``rate`` (requests per
+minute) allows, so one watcher looks like a slow, steady visitor rather than
+a crawler.  A 403/429 doubles the spacing; successful checks bring it back.
+Other failures of a single check (5xx, parse or network errors) are counted
+and the offer is retried next round; only an expired session stops the watch.
+
+Each check reads only the price meta tags of the offer page
+(``AllegroClient.check_price``).  The first observation and every later
+change of price or availability are appended to the price history
+and reported as an event; unchanged checks produce no output.
+"""
+from __future__ import annotations
+
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from allegro_cli.api.client import TRANSPORT_ERRORS
+from allegro_cli.api.models import (
+    AllegroCliError, AuthenticationError, OfferNotFoundError, RateLimitError,
+)
+from allegro_cli.state import PricePoint, StateStore
+
+DEFAULT_INTERVAL = 3600.0
+DEFAULT_RATE = 20.0  # requests per minute
+
+_MAX_BACKOFF = 32
+_NOT_FOUND = "not found"
+
+
+def read_offer_ids(path: str) -> list[str]:
+    """Offer IDs from *path*: a JSON list, or text with IDs separated by
+    whitespace/commas (``#`` comments and an ``offer_id`` header are skipped)."""
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+        items = json.loads(text) if text.lstrip().startswith("[") else None
+    except (OSError, ValueError) as e:
+        raise AllegroCliError(
+            message=f"Cannot read {path}: {e}",
+            code="WatchFileException",
+            userMessage=f"Could not read watch list {path}.",
+        )
+    if items is not None:
+        ids = [
+            str(i.get("offerId") or i.get("offer_id") or i.get("id") or "") if isinstance(i, dict) else str(i)
+            for i in items
+        ]
+    else:
+        ids = []
+        for line in text.splitlines():
+            line = line.split("#", 1)[0]
+            ids.extend(t for t in line.replace(",", " ").split() if t.isdigit())
+    return list(dict.fromkeys(i for i in ids if i))
+
+
+def _stamp(at: float) -> str:
+    return datetime.fromtimestamp(at, timezone.utc).isoformat(timespec="seconds")
+
+
+class PriceWatch:
+    def __init__(
+        self,
+        client,
+        state: StateStore,
+        interval: float = DEFAULT_INTERVAL,
+        rate: float = DEFAULT_RATE,
+        jitter: float = 0.2,
+        emit: Callable[[dict], None] | None = None,
+    ):
+        self.client = client
+        self.state = state
+        self.interval = interval
+        self.rate = rate
+        self.jitter = jitter
+        self.emit = emit or (lambda event: None)
+        self.checks = 0
+        self.rate_limited = 0
+        self.failed: dict[str, int] = {}  # error code -> checks that failed with it
+        self._backoff = 1
+
+    def spacing(self, count: int) -> float:
+        """Seconds between two checks when *count* offers share the interval."""
+        return max(self.interval / max(count, 1), 60.0 / self.rate)
+
+    def check(self, offer_id: str) -> dict | None:
+        """Check one offer; return (and emit) an event if it changed."""
+        try:
+            price = self.client.check_price(offer_id)
+        except OfferNotFoundError:
+            price = {"amount": "", "currency": "", "availability": _NOT_FOUND}
+        self.checks += 1
+        now = time.time()
+        point = PricePoint(price["amount"], price["currency"], price["availability"], now)
+        previous = self.state.last_price(offer_id)
+        if previous and (previous.amount, previous.availability) == (point.amount, point.availability):
+            return None
+        self.state.record_price(offer_id, point)
+
+        row = {"amount": point.amount, "currency": point.currency, "availability": point.availability}
+        event = {"time": _stamp(now), "offer_id": offer_id, "change": "added", "row": row}
+        if previous:
+            before = {"amount": previous.amount, "currency": previous.currency,
+                      "availability": previous.availability}
+            event["change"] = "changed"
+            event["before"] = {k: v for k, v in before.items() if v != row[k]}
+        self.emit(event)
+        return event
+
+    def run(self, offer_ids: list[str], rounds: int = 0) -> None:
+        """Check every offer once per round; *rounds* 0 runs until interrupted."""
+        base = self.spacing(len(offer_ids))
+        slot = time.monotonic()
+        done = 0
+        while not rounds or done < rounds:
+            for offer_id in offer_ids:
+                wait = slot - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                started = max(slot, time.monotonic())
+                try:
+                    self.check(offer_id)
+                    self._backoff = max(1, self._backoff // 2)
+                except RateLimitError:
+                    # Skip this offer until the next round and slow down
+                    self.rate_limited += 1
+                    self._backoff = min(self._backoff * 2, _MAX_BACKOFF)
+                except AuthenticationError:
+                    raise
+                except (AllegroCliError, *TRANSPORT_ERRORS) as e:
+                    code = e.code if isinstance(e, AllegroCliError) else type(e).__name__
+                    self.failed[code] = self.failed.get(code, 0) + 1
+                step = base * self._backoff * random.uniform(1 - self.jitter, 1 + self.jitter)
+                # Jitter may stretch a gap but never shrink it below the rate limit
+                slot = started + max(step, 60.0 / self.rate)
+            done += 1
+
+    def summary(self) -> str:
+        failed = sum(self.failed.values())
+        line = f"{self.checks} checked, {self.rate_limited} rate-limited, {failed} failed"
+        if self.failed:
+            line += " (" + ", ".join(f"{k}={v}" for k, v in self.failed.items()) + ")"
+        return line
+
+
+def history_rows(state: StateStore, offer_id: str) -> list[dict]:
+    return [
+        {"time": _stamp(p.at), "amount": p.amount, "currency": p.currency,
+         "availability": p.availability}
+        for p in state.price_history(offer_id)
+    ]
@@ -0,0 +1 @@
+"""Performance benchmarks for allegro-cli (run with ``python -m benchmarks``)."""
@@ -0,0 +1,46 @@
+"""Run the benchmark suite.
+
+    python -m benchmarks                              # run and print
+    python -m benchmarks -o results.json              # save results
+    python -m benchmarks --compare baseline.json      # fail on regressions
+    python -m benchmarks -k parse_offer --repeat 10   # subset
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from benchmarks import bench_models, bench_output, bench_parsers  # noqa: F401  (registers cases)
+from benchmarks.harness import compare, load, run, save
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default=None, help="Only run cases containing this substring")
+    parser.add_argument("--repeat", type=int, default=None, help="Override repetitions per case")
+    parser.add_argument("-o", "--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", default=None, help="Compare against a saved results file")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Allowed slowdown/memory growth as a fraction (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat, log=sys.stderr)
+    if args.output:
+        save(results, args.output)
+
+    if args.compare:
+        regressions = compare(results, load(args.compare), args.threshold)
+        json.dump({"regressions": regressions}, sys.stdout, indent=2)
+        print()
+        return 1 if regressions else 0
+
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Model serialization benchmarks (10k fully populated offers)."""
+from __future__ import annotations
+
+import dataclasses
+import io
+
+from allegro_cli.output import decode_msgpack, output_json, output_msgpack
+from benchmarks import generators
+from benchmarks.harness import case
+
+
+@case("serialize/asdict-offers-10k", repeat=3)
+def _asdict_10k():
+    offers = generators.offers(10_000)
+    return lambda: [dataclasses.asdict(o) for o in offers]
+
+
+@case("serialize/to_dict-offers-10k", repeat=3)
+def _to_dict_10k():
+    offers = generators.offers(10_000)
+    return lambda: [o.to_dict() for o in offers]
+
+
+@case("output_json/offers-10k", repeat=3)
+def _output_json_10k():
+    offers = generators.offers(10_000)
+
+    def run() -> str:
+        buf = io.StringIO()
+        output_json(offers, file=buf)
+        return buf.getvalue()
+    return run
+
+
+@case("output_msgpack/offers-10k", repeat=3)
+def _output_msgpack_10k():
+    offers = generators.offers(10_000)
+
+    def run() -> bytes:
+        buf = io.BytesIO()
+        output_msgpack(offers, file=buf)
+        return buf.getvalue()
+    return run
+
+
+@case("decode/json-offers-10k", repeat=3)
+def _decode_json_10k():
+    import json
+
+    buf = io.StringIO()
+    output_json(generators.offers(10_000), file=buf)
+    payload = buf.getvalue()
+    return lambda: json.loads(payload)
+
+
+@case("decode/msgpack-offers-10k", repeat=3)
+def _decode_msgpack_10k():
+    buf = io.BytesIO()
+    output_msgpack(generators.offers(10_000), file=buf)
+    payload = buf.getvalue()
+    return lambda: decode_msgpack(payload)
+
+
+def _listing_pages() -> list[str]:
+    return [
+        generators.next_data_listing_html(120, target_bytes=200_000, seed=i)
+        for i in range(20)
+    ]
+
+
+@case("memory/listing-offers-2400-list", repeat=3)
+def _offers_list():
+    from allegro_cli.scraper import parse_search_results
+
+    pages = _listing_pages()
+    return lambda: [o for html in pages for o in parse_search_results(html)]
+
+
+@case("memory/listing-offers-2400-batch", repeat=3)
+def _offers_batch():
+    from allegro_cli.api.models import OfferBatch
+    from allegro_cli.scraper import parse_search_results_into
+
+    pages = _listing_pages()
+
+    def fill() -> OfferBatch:
+        batch = OfferBatch()
+        for html in pages:
+            parse_search_results_into(html, batch)
+        return batch
+    return fill
@@ -0,0 +1,47 @@
+"""Output renderer throughput (TSV and text) on large result sets."""
+from __future__ import annotations
+
+import io
+
+from allegro_cli.api.models import OfferBatch
+from allegro_cli.output import output_text, output_tsv
+from benchmarks import generators
+from benchmarks.harness import case
+
+_COLUMNS = ["id", "name", "sellingMode.price.amount", "seller.name"]
+
+
+@case("output_tsv/dicts-50k", repeat=3)
+def _tsv_dicts():
+    rows = [o.to_dict() for o in generators.offers(50_000, n_params=5)]
+    return lambda: output_tsv(rows, _COLUMNS, file=io.StringIO())
+
+
+@case("output_tsv/models-50k", repeat=3)
+def _tsv_models():
+    offers = generators.offers(50_000, n_params=5)
+    return lambda: output_tsv(offers, _COLUMNS, file=io.StringIO())
+
+
+@case("output_tsv/batch-50k", repeat=3)
+def _tsv_batch():
+    batch = OfferBatch(generators.offers(50_000, n_params=5))
+    return lambda: output_tsv(batch, _COLUMNS, file=io.StringIO())
+
+
+@case("output_text/rich-2k", repeat=3)
+def _text_rich():
+    offers = generators.offers(2_000, n_params=5)
+    return lambda: output_text(offers, _COLUMNS, file=io.StringIO(), mode="rich")
+
+
+@case("output_text/plain-2k", repeat=3)
+def _text_plain():
+    offers = generators.offers(2_000, n_params=5)
+    return lambda: output_text(offers, _COLUMNS, file=io.StringIO(), mode="plain")
+
+
+@case("output_text/auto-50k", repeat=3)
+def _text_auto():
+    offers = generators.offers(50_000, n_params=5)
+    return lambda: output_text(offers, _COLUMNS, file=io.StringIO())
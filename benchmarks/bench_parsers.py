@@ -0,0 +1,57 @@
+"""Scraper and output benchmarks on synthetic, realistically sized pages."""
+from __future__ import annotations
+
+import dataclasses
+import io
+
+from allegro_cli.output import output_tsv
+from allegro_cli.scraper import (
+    _walk_for_params,
+    parse_offer_page,
+    parse_search_results,
+)
+from benchmarks import generators
+from benchmarks.harness import case
+
+
+@case("parse_search_results/html-60")
+def _search_html_60():
+    html = generators.listing_html(60)
+    return lambda: parse_search_results(html)
+
+
+@case("parse_search_results/html-120")
+def _search_html_120():
+    html = generators.listing_html(120)
+    return lambda: parse_search_results(html)
+
+
+@case("parse_search_results/next-data-120x3MB", repeat=3)
+def _search_next_data():
+    html = generators.next_data_listing_html(120, target_bytes=3_000_000)
+    return lambda: parse_search_results(html)
+
+
+@case("parse_offer_page/params-300")
+def _offer_300():
+    html = generators.offer_html(n_params=300)
+    return lambda: parse_offer_page(html, offer_id="10000000000")
+
+
+@case("parse_offer_page/params-1000", repeat=3)
+def _offer_1000():
+    html = generators.offer_html(n_params=1000)
+    return lambda: parse_offer_page(html, offer_id="10000000000")
+
+
+@case("_walk_for_params/depth-12-params-300")
+def _walk_deep():
+    tree = generators.opbox_tree(depth=12, breadth=3, n_params=300)
+    return lambda: _walk_for_params(tree, {})
+
+
+@case("output_tsv/rows-10k", repeat=3)
+def _tsv_10k():
+    rows = [dataclasses.asdict(o) for o in generators.offers(10_000)]
+    columns = ["id", "name", "sellingMode.price.amount", "seller.name"]
+    return lambda: output_tsv(rows, columns, file=io.StringIO())
@@ -0,0 +1,203 @@
+"""Synthetic Allegro pages shaped like the real ones, at realistic sizes.
+
+The fixtures in ``tests/fixtures`` are a few hundred bytes; real listing pages
+carry 60-120 articles and multi-MB ``__NEXT_DATA__`` blobs, and offer pages
+embed hundreds of parameters in deep opbox trees.  Everything here is
+deterministic for a given set of arguments so results stay comparable.
+"""
+from __future__ import annotations
+
+import json
+import random
+
+from allegro_cli.api.models import Category, Image, Offer, Price, Seller, SellingMode
+
+_WORDS = (
+    "laptop lenovo thinkpad dell xps hp elitebook asus zenbook acer swift "
+    "kawa ziarnista arabica robusta ekspres mlynek filtr czajnik kubek "
+    "nowy uzywany gwarancja faktura vat szybka wysylka smart okazja"
+).split()
+
+
+def _title(rng: random.Random, words: int = 8) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _price(rng: random.Random) -> str:
+    return f"{rng.randint(5, 9999)}.{rng.randint(0, 99):02d}"
+
+
+def _polish_price(amount: str) -> str:
+    whole, frac = amount.split(".")
+    if len(whole) > 3:
+        whole = whole[:-3] + "\xa0" + whole[-3:]
+    return f"{whole},{frac}\xa0zł"
+
+
+def _offer_id(i: int) -> str:
+    return str(10_000_000_000 + i)
+
+
+def listing_html(n_articles: int = 60, seed: int = 0) -> str:
+    """Listing page parsed through the HTML (BeautifulSoup) fallback path."""
+    rng = random.Random(seed)
+    parts = ["<html><head><title>Listing</title></head><body><main>"]
+    for i in range(n_articles):
+        oid = _offer_id(i)
+        amount = _price(rng)
+        parts.append(
+            "<article>"
+            f'<a href="https://allegro.pl/oferta/{_title(rng, 4).lower().replace(" ", "-")}-{oid}">'
+            f'<img src="https://a.allegroimg.com/s180/badge-{i}.png" width="16" height="16" />'
+            f'<img src="https://a.allegroimg.com/original/{oid}.jpg" width="200" height="200" />'
+            "</a>"
+            f"<h2>{_title(rng)}</h2>"
+            f'<div><span aria-label="{_polish_price(amount)} aktualna cena">'
+            f"{_polish_price(amount)}</span></div>"
+            f"<div><span>{rng.randint(1, 500)} osób kupiło</span>"
+            f"<span>dostawa pojutrze</span></div>"
+            "</article>"
+        )
+    parts.append('<a rel="next" href="https://allegro.pl/listing?string=x&p=2">next</a>')
+    parts.append("</main></body></html>")
+    return "".join(parts)
+
+
+def next_data_listing_html(
+    n_items: int = 120, target_bytes: int = 3_000_000, seed: int = 0,
+) -> str:
+    """Listing page whose offers live in a large ``__NEXT_DATA__`` blob.
+
+    Each item is padded with description/attribute noise so the embedded
+    JSON reaches roughly *target_bytes*, as it does on real listing pages.
+    """
+    rng = random.Random(seed)
+    pad_per_item = max(0, target_bytes // max(n_items, 1) - 400)
+    items = []
+    for i in range(n_items):
+        items.append({
+            "id": _offer_id(i),
+            "name": _title(rng),
+            "price": {"normal": {"amount": _price(rng), "currency": "PLN"}},
+            "images": [
+                {"url": f"https://a.allegroimg.com/original/{_offer_id(i)}-{k}.jpg"}
+                for k in range(4)
+            ],
+            "seller": {"id": str(rng.randint(1000, 99999)), "login": f"shop{i % 37}"},
+            "description": _title(rng, pad_per_item // 8 + 1)[:pad_per_item],
+        })
+    data = {"props": {"pageProps": {"items": items, "tracking": {"n": n_items}}}}
+    return (
+        "<html><head></head><body>"
+        '<script id="__NEXT_DATA__" type="application/json">'
+        + json.dumps(data, ensure_ascii=False)
+        + "</script></body></html>"
+    )
+
+
+def param_groups(n_params: int = 300, seed: int = 0) -> list[dict]:
+    """Opbox-style parameter groups (single- and multi-value params)."""
+    rng = random.Random(seed)
+    groups = []
+    per_group = 12
+    for g in range(0, n_params, per_group):
+        single, multi = [], []
+        for i in range(g, min(g + per_group, n_params)):
+            if i % 4 == 3:
+                multi.append({
+                    "name": f"Parametr {i}",
+                    "values": [{"name": rng.choice(_WORDS)} for _ in range(3)],
+                })
+            else:
+                single.append({
+                    "name": f"Parametr {i}",
+                    "value": {"name": _title(rng, 2)},
+                })
+        groups.append({
+            "label": f"Grupa {g // per_group}",
+            "singleValueParams": single,
+            "multiValueParams": multi,
+        })
+    return groups
+
+
+def opbox_tree(
+    depth: int = 12, breadth: int = 3, n_params: int = 300, seed: int = 0,
+) -> dict:
+    """A deep opbox subtree with parameter groups scattered at the leaves."""
+    groups = param_groups(n_params, seed=seed)
+    rng = random.Random(seed)
+    leaves: list[dict] = []
+
+    def build(level: int) -> dict:
+        node: dict = {
+            "type": f"box-{level}",
+            "props": {"id": rng.randint(0, 10**9), "visible": True},
+        }
+        if level >= depth:
+            leaves.append(node)
+            return node
+        node["slots"] = {f"slot{b}": [build(level + 1)] for b in range(breadth if level < 4 else 1)}
+        return node
+
+    root = build(0)
+    for i, group in enumerate(groups):
+        leaves[i % len(leaves)].setdefault("groups", []).append(group)
+    return root
+
+
+def offer_html(n_params: int = 300, n_lazy: int = 3, seed: int = 0) -> str:
+    """Offer page with parameters in serialized boxes plus lazy contexts."""
+    rng = random.Random(seed)
+    amount = _price(rng)
+    boxes = [
+        '<script type="application/json" data-serialize-box-id="box-params">'
+        + json.dumps({"groups": param_groups(n_params, seed=seed)}, ensure_ascii=False)
+        + "</script>"
+    ]
+    for i in range(n_lazy):
+        boxes.append(
+            f'<script type="application/json" data-serialize-box-id="box-lazy-{i}">'
+            + json.dumps({
+                "contextUrlParamName": "lazyContext",
+                "contextUrlParamValue": f"CTX-{i}-" + "x" * 200,
+                "cardinal": i,
+                "corellationId": "tab content" if i == 0 else f"box {i}",
+            })
+            + "</script>"
+        )
+    return (
+        "<html><head>"
+        f'<meta property="product:price:amount" content="{amount}" />'
+        '<meta property="og:image" content="https://a.allegroimg.com/original/main.jpg" />'
+        '<link rel="canonical" href="https://allegro.pl/oferta/synthetic-10000000000" />'
+        "</head><body>"
+        f"<h1>{_title(rng, 12)}</h1>"
+        '<script>{"sellerId":"424242","seller":{"id":"424242","login":"synthetic"}}</script>'
+        + "".join(boxes)
+        + "".join(
+            f"<section><h3>{_title(rng, 3)}</h3><p>{_title(rng, 40)}</p></section>"
+            for _ in range(50)
+        )
+        + "</body></html>"
+    )
+
+
+def offers(n: int = 10_000, n_params: int = 20, seed: int = 0) -> list[Offer]:
+    """Fully populated Offer models, as produced by the scraper."""
+    rng = random.Random(seed)
+    result = []
+    for i in range(n):
+        result.append(Offer(
+            id=_offer_id(i),
+            name=_title(rng),
+            seller=Seller(id=str(rng.randint(1000, 99999)), name=f"shop{i % 37}"),
+            sellingMode=SellingMode(
+                format="BUY_NOW",
+                price=Price(amount=_price(rng), currency="PLN"),
+            ),
+            category=Category(id=str(rng.randint(1, 999))),
+            images=[Image(url=f"https://a.allegroimg.com/original/{_offer_id(i)}.jpg")],
+            parameters={f"Parametr {k}": _title(rng, 2) for k in range(n_params)},
+        ))
+    return result
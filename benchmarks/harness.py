@@ -0,0 +1,135 @@
+"""Minimal benchmark harness: case registry, timing, peak memory, compare."""
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+# A case is a setup function returning the callable to measure, so that
+# building multi-MB inputs is never part of the timed region.
+Setup = Callable[[], Callable[[], Any]]
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Setup
+    repeat: int = 5
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, repeat: int = 5) -> Callable[[Setup], Setup]:
+    """Register *setup* as benchmark *name*."""
+    def decorator(setup: Setup) -> Setup:
+        CASES[name] = Case(name=name, setup=setup, repeat=repeat)
+        return setup
+    return decorator
+
+
+def measure(c: Case, repeat: int | None = None) -> dict:
+    """Time *c* ``repeat`` times, then trace one extra run for peak memory."""
+    fn = c.setup()
+    repeat = repeat or c.repeat
+    fn()  # warm-up (imports, regex compilation, lazy caches)
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    gc.collect()
+    tracemalloc.start()
+    out = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    res = {
+        "repeat": repeat,
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "max_s": max(times),
+        "peak_kib": round(peak / 1024, 1),
+    }
+    # Serializer cases return their payload so its size can be compared
+    if isinstance(out, str):
+        res["output_bytes"] = len(out.encode("utf-8"))
+    elif isinstance(out, bytes):
+        res["output_bytes"] = len(out)
+    return res
+
+
+def run(pattern: str | None = None, repeat: int | None = None, log=None) -> dict:
+    """Run every registered case whose name contains *pattern*."""
+    results = {}
+    for name, c in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        res = measure(c, repeat)
+        results[name] = res
+        if log:
+            size = f"   out {res['output_bytes'] / 1024:10.1f} KiB" if "output_bytes" in res else ""
+            print(
+                f"{name:<48} median {res['median_s'] * 1000:9.2f} ms   "
+                f"peak {res['peak_kib']:10.1f} KiB{size}",
+                file=log, flush=True,
+            )
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict, baseline: dict, threshold: float = 0.2,
+) -> list[dict]:
+    """Return the cases whose median time, peak memory or output size regressed.
+
+    A regression is an increase by more than *threshold* (a fraction) over
+    the baseline.  Cases missing from either side are ignored.
+    """
+    regressions = []
+    base_results = baseline.get("results", {})
+    for name, cur in current.get("results", {}).items():
+        base = base_results.get(name)
+        if not base:
+            continue
+        for metric in ("median_s", "peak_kib", "output_bytes"):
+            old, new = base.get(metric), cur.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "case": name,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "ratio": round(ratio, 3),
+                })
+    return regressions
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(data: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,279 @@
+"""Local stand-in for allegro.pl and edge.allegro.pl, served from fixtures.
+
+Unlike ``MockAllegroClient`` this is a real HTTP server, so the actual
+``AllegroClient`` (curl_cffi for pages, httpx for the edge API) talks to it
+over sockets.  That makes connection handling, concurrency, timeouts and
+rate-limit handling testable without the internet.
+
+Point the client at it with::
+
+    allegro config set --edge-base-url http://127.0.0.1:8765 \\
+                       --scrape-base-url http://127.0.0.1:8765
+
+and start it with ``python -m benchmarks.standin tests/fixtures``.
+
+Fixture layout (the same directory ``MockAllegroClient`` reads):
+
+- ``search_results.html`` -- served for ``/listing``, ``/kategoria/*`` and
+  ``/uzytkownik/*``
+- ``offer_page.html`` -- served for ``/oferta/*``
+- ``offer_lazy.json`` -- opbox subtree served for ``/oferta/*?lazyContext=``
+  (optional, an empty subtree otherwise)
+- ``<method>_<path>.json`` -- edge API responses as
+  ``{"status_code": ..., "body": ...}``, e.g. ``get_packages_summary.json``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+_PAGE_PREFIXES = ("/listing", "/kategoria/", "/uzytkownik/")
+
+# Edge mutations that should succeed even without a fixture file
+_DEFAULT_EDGE = {
+    ("POST", "/carts/changeQuantityCommand"): (200, {}),
+    ("DELETE", "/cart/items"): (204, None),
+}
+
+
+@dataclass
+class StandinOptions:
+    """Fault and latency injection knobs."""
+
+    latency: float = 0.0  # seconds added before every response
+    jitter: float = 0.0  # +/- uniform seconds on top of latency
+    burst_every: int = 0  # every N-th request starts an error burst (0 = off)
+    burst_length: int = 1  # consecutive requests answered with burst_status
+    burst_status: int = 429  # 403 (DataDome) or 429 (rate limit)
+    slow_body: float = 0.0  # seconds spent trickling each response body
+    chunk_size: int = 16 * 1024
+    seed: int | None = None
+
+
+@dataclass
+class StandinStats:
+    requests: int = 0
+    errors_injected: int = 0
+    by_route: dict[str, int] = field(default_factory=dict)
+    in_flight: int = 0
+    max_in_flight: int = 0  # most requests being answered at the same time
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        fixtures: str | Path,
+        options: StandinOptions | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.fixtures = Path(fixtures)
+        self.options = options or StandinOptions()
+        self.stats = StandinStats()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.options.seed)
+        self._burst_left = 0
+        self._thread: threading.Thread | None = None
+        super().__init__((host, port), _StandinHandler)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Serve from a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> StandinServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # --- Fault injection ---
+
+    def _next_fault(self, route: str) -> tuple[float, int | None]:
+        """Count the request and decide its delay and injected status."""
+        opts = self.options
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_route[route] = self.stats.by_route.get(route, 0) + 1
+            status = None
+            if self._burst_left:
+                self._burst_left -= 1
+                status = opts.burst_status
+            elif opts.burst_every and self.stats.requests % opts.burst_every == 0:
+                self._burst_left = opts.burst_length - 1
+                status = opts.burst_status
+            if status is not None:
+                self.stats.errors_injected += 1
+            delay = opts.latency
+            if opts.jitter:
+                delay += self._rng.uniform(-opts.jitter, opts.jitter)
+        return max(delay, 0.0), status
+
+    def _track(self, delta: int) -> None:
+        with self._lock:
+            self.stats.in_flight += delta
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+
+
+class _StandinHandler(BaseHTTPRequestHandler):
+    server: StandinServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY
+    # keep-alive clients stall ~40 ms per request on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("content-length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        parts = urlsplit(self.path)
+        status, content_type, body, route = self._route(method, parts.path, parts.query)
+
+        delay, injected = self.server._next_fault(route)
+        self.server._track(+1)
+        try:
+            if delay:
+                time.sleep(delay)
+            if injected is not None:
+                status, content_type = injected, "text/html"
+                body = f"<html><body>Injected {injected}</body></html>".encode()
+            self._send(status, content_type, body)
+        finally:
+            self.server._track(-1)
+
+    def _route(self, method: str, path: str, query: str) -> tuple[int, str, bytes, str]:
+        fixtures = self.server.fixtures
+        if method == "GET" and path.startswith(_PAGE_PREFIXES):
+            return self._file(fixtures / "search_results.html", "text/html", "listing")
+        if method == "GET" and path.startswith("/oferta/"):
+            if "lazyContext" in parse_qs(query):
+                lazy = fixtures / "offer_lazy.json"
+                if lazy.exists():
+                    return self._file(lazy, "application/json", "lazy")
+                return 200, "application/json", b'{"slots": {}}', "lazy"
+            return self._file(fixtures / "offer_page.html", "text/html", "offer")
+
+        # Edge API: same fixture naming as MockAllegroClient
+        route = f"{method} {path}"
+        name = f"{method.lower()}_{path.strip('/').replace('/', '_')}.json"
+        fixture = fixtures / name
+        if fixture.exists():
+            data = json.loads(fixture.read_text(encoding="utf-8"))
+            body = data.get("body")
+            payload = b"" if body is None else json.dumps(body, ensure_ascii=False).encode()
+            return data.get("status_code", 200), "application/json", payload, route
+        if (method, path) in _DEFAULT_EDGE:
+            status, body = _DEFAULT_EDGE[(method, path)]
+            payload = b"" if body is None else json.dumps(body).encode()
+            return status, "application/json", payload, route
+        return 404, "text/plain", b"Not Found", route
+
+    @staticmethod
+    def _file(path: Path, content_type: str, route: str) -> tuple[int, str, bytes, str]:
+        if not path.exists():
+            return 404, "text/plain", b"Not Found", route
+        return 200, content_type, path.read_bytes(), route
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("content-type", f"{content_type}; charset=utf-8")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        if status == 204 or not body:
+            return
+        opts = self.server.options
+        if not opts.slow_body:
+            self.wfile.write(body)
+            return
+        chunks = [body[i:i + opts.chunk_size] for i in range(0, len(body), opts.chunk_size)]
+        pause = opts.slow_body / len(chunks)
+        for chunk in chunks:
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            time.sleep(pause)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.standin",
+        description="Serve Allegro pages and edge API responses from fixtures",
+    )
+    parser.add_argument("fixtures", help="Fixture directory (e.g. tests/fixtures)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Added latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency jitter in seconds")
+    parser.add_argument("--burst-every", dest="burst_every", type=int, default=0,
+                        help="Start an error burst every N requests (0 = never)")
+    parser.add_argument("--burst-length", dest="burst_length", type=int, default=1,
+                        help="Requests per error burst")
+    parser.add_argument("--burst-status", dest="burst_status", type=int, choices=[403, 429],
+                        default=429, help="Status returned during bursts")
+    parser.add_argument("--slow-body", dest="slow_body", type=float, default=0.0,
+                        help="Seconds spent trickling each response body")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    options = StandinOptions(
+        latency=args.latency,
+        jitter=args.jitter,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        burst_status=args.burst_status,
+        slow_body=args.slow_body,
+        seed=args.seed,
+    )
+    server = StandinServer(args.fixtures, options, host=args.host, port=args.port)
+    url = server.base_url
+    print(f"Serving {args.fixtures} on {url}", file=sys.stderr)
+    print(
+        f"Point the CLI at it: allegro config set --edge-base-url {url} --scrape-base-url {url}",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import json
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+from allegro_cli import config
+from allegro_cli.api.capture import CapturedResponse
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.api.models import Category, Image, Offer, Price, Seller, SellingMode
+from allegro_cli.config import Config
+from allegro_cli.main import main
+
+
+@pytest.fixture(autouse=True)
+def _isolated_config_dir(tmp_path, monkeypatch):
+    """Keep the offer cache and config files of every test in tmp_path."""
+    config_dir = tmp_path / ".allegro-cli"
+    monkeypatch.setattr(config, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(config, "CONFIG_FILE", config_dir / "config.json")
+
+
+def make_offer(
+    offer_id: str = "1",
+    amount: str = "9.99",
+    name: str | None = None,
+    seller: str = "shop",
+    seller_id: str = "s1",
+    category: str = "c1",
+    images: tuple[str, ...] = ("a.jpg",),
+    parameters: dict[str, str] | None = None,
+) -> Offer:
+    return Offer(
+        id=offer_id,
+        name=name or f"Offer {offer_id}",
+        seller=Seller(id=seller_id, name=seller),
+        sellingMode=SellingMode(format="BUY_NOW", price=Price(amount=amount)),
+        category=Category(id=category),
+        images=[Image(url=url) for url in images],
+        parameters=dict(parameters or {}),
+    )
+
+
+def run_cli(argv: list[str], client=None, config: Config | None = None) -> int:
+    """Run ``allegro *argv`` with a test config, and *client* (when given)
+    standing in for the ``AllegroClient`` the CLI would build."""
+    with ExitStack() as stack:
+        stack.enter_context(patch(
+            "allegro_cli.main.load_config", return_value=config or Config(cookies="session=test"),
+        ))
+        stack.enter_context(patch("allegro_cli.main.ensure_dirs"))
+        if client is not None:
+            stack.enter_context(patch("allegro_cli.api.client.AllegroClient", return_value=client))
+        stack.enter_context(patch("sys.argv", ["allegro", *argv]))
+        return main()
+
+
+class PagedSearchClient:
+    """Serves scripted result pages lazily; records the search arguments and
+    counts the pages actually fetched."""
+
+    def __init__(self, pages=(), state=None):
+        self.pages = list(pages)
+        self.state = state
+        self.kwargs = None
+        self.fetched = 0
+
+    def iter_search_pages(self, pages=1, **kwargs):
+        self.kwargs = {"pages": pages, **kwargs}
+        for page in self.pages[:pages]:
+            self.fetched += 1
+            yield page
+
+    def iter_search(self, **kwargs):
+        for page in self.iter_search_pages(**kwargs):
+            yield from page
+
+
+class EdgeClient(AllegroClient):
+    """Answers edge calls from ``responses`` keyed by (method, path).
+
+    Records ``(method, path)`` per call and the ``If-None-Match`` it carried.
+    A path with an entry in ``etags`` is served with that ETag, and with a
+    304 when the request already names it.
+    """
+
+    def __init__(self, responses: dict | None = None, **kwargs):
+        super().__init__(Config(cookies="session=test"), **kwargs)
+        self.responses = dict(responses or {})
+        self.etags: dict[str, str] = {}
+        self.calls = []
+        self.sent_etags = []
+
+    def _edge_send(self, method, path, headers, **kwargs):
+        self.calls.append((method, path))
+        self.sent_etags.append(headers.get("if-none-match"))
+        etag = self.etags.get(path)
+        if etag and headers.get("if-none-match") == etag:
+            return CapturedResponse(304, "")
+        status, body = self.responses.get((method, path.split("?")[0]), (204, None))
+        return CapturedResponse(
+            status, "" if body is None else json.dumps(body),
+            headers={"etag": etag} if etag else {}, json_data=body,
+        )
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from allegro_cli.config import Config
+from allegro_cli.main import create_parser, main
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _run(argv: list[str]) -> int:
+    with (
+        patch("allegro_cli.main.load_config", return_value=Config()),
+        patch("allegro_cli.main.ensure_dirs"),
+        patch("sys.argv", ["allegro"] + argv),
+    ):
+        return main()
+
+
+def test_parser_bench():
+    args = create_parser().parse_args([
+        "bench", "--standin", "fx", "--concurrency", "8", "--duration", "5",
+        "--phrase", "kawa", "--phrase", "laptop", "--offer-id", "1",
+    ])
+    assert args.command == "bench"
+    assert args.standin == "fx"
+    assert args.concurrency == 8
+    assert args.phrase == ["kawa", "laptop"]
+    assert args.offer_id == ["1"]
+
+
+def test_bench_against_standin_reports_throughput(capsys):
+    result = _run([
+        "bench", "--standin", str(FIXTURES), "--requests", "20",
+        "--concurrency", "2", "--duration", "30", "--format", "json",
+    ])
+    assert result == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["requests"] == 20
+    assert report["search"]["count"] + report["offer"]["count"] == 20
+    assert report["throughputPerSecond"] > 0
+    assert report["all"]["p50_ms"] <= report["all"]["p99_ms"]
+    assert report["cpu"]["parseSeconds"] > 0
+    assert report["errors"] == {}
+
+
+def test_bench_requires_a_target(capsys):
+    result = _run(["bench", "--duration", "0.1"])
+    assert result == 1
+    err = json.loads(capsys.readouterr().err)
+    assert err["errors"][0]["code"] == "BenchConfigException"
+
+
+def test_bench_counts_transport_errors(capsys):
+    # Nothing listens on port 9: every request fails at connect
+    result = _run([
+        "bench", "--target", "http://127.0.0.1:9", "--requests", "4",
+        "--concurrency", "2", "--duration", "30", "--format", "json",
+    ])
+    assert result == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["requests"] == 0
+    assert sum(report["errors"].values()) == 4
@@ -0,0 +1,66 @@
+"""Sanity checks for the benchmark generators and harness (not the timings)."""
+from benchmarks import generators
+from benchmarks.harness import Case, compare, measure
+from allegro_cli.scraper import (
+    extract_lazy_contexts,
+    parse_offer_page,
+    parse_opbox_parameters,
+    parse_search_results,
+)
+
+
+def test_listing_generator_parses_all_articles():
+    offers = parse_search_results(generators.listing_html(60))
+    assert len(offers) == 60
+    assert all(o.sellingMode.price.amount for o in offers)
+    assert all(o.images for o in offers)
+
+
+def test_next_data_generator_reaches_target_size():
+    html = generators.next_data_listing_html(80, target_bytes=500_000)
+    assert len(html.encode()) > 400_000
+    offers = parse_search_results(html)
+    assert len(offers) == 80
+    assert offers[0].seller.id
+
+
+def test_offer_generator_parameters_and_lazy_contexts():
+    html = generators.offer_html(n_params=120, n_lazy=3)
+    offer = parse_offer_page(html, offer_id="10000000000")
+    assert len(offer.parameters) == 120
+    assert offer.seller.id == "424242"
+    contexts = extract_lazy_contexts(html)
+    assert len(contexts) == 3
+    assert contexts[0]["corellationId"] == "tab content"
+
+
+def test_opbox_tree_holds_every_parameter():
+    tree = generators.opbox_tree(depth=10, breadth=2, n_params=90)
+    assert len(parse_opbox_parameters(tree)) == 90
+
+
+def test_measure_reports_time_and_memory():
+    res = measure(Case("noop", lambda: (lambda: [0] * 1000)), repeat=2)
+    assert res["repeat"] == 2
+    assert res["median_s"] >= 0
+    assert res["peak_kib"] > 0
+    assert "output_bytes" not in res
+
+
+def test_measure_reports_payload_size():
+    res = measure(Case("payload", lambda: (lambda: "zażółć")), repeat=1)
+    assert res["output_bytes"] == len("zażółć".encode("utf-8"))
+
+
+def test_compare_flags_only_regressions():
+    baseline = {"results": {
+        "a": {"median_s": 1.0, "peak_kib": 100.0},
+        "b": {"median_s": 1.0, "peak_kib": 100.0},
+    }}
+    current = {"results": {
+        "a": {"median_s": 1.1, "peak_kib": 100.0},
+        "b": {"median_s": 1.5, "peak_kib": 90.0},
+        "c": {"median_s": 9.0, "peak_kib": 9.0},
+    }}
+    regressions = compare(current, baseline, threshold=0.2)
+    assert [(r["case"], r["metric"]) for r in regressions] == [("b", "median_s")]
@@ -0,0 +1,100 @@
+import argparse
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from allegro_cli.api.models import AllegroCliError
+from allegro_cli.budget import check_format, fit_records, shape, tabulate, trim_title
+from allegro_cli.main import create_parser
+from tests.conftest import run_cli
+
+
+def _records(n: int = 20) -> list[dict]:
+    return [
+        {
+            "id": str(i),
+            "name": f"Laptop {i} " + "bardzo długi tytuł oferty " * 6,
+            "price": "1999.00",
+            "parameters": {"Marka": "Dell", "Stan": "Nowy", f"Rzadki {i}": "x" * 40},
+        }
+        for i in range(n)
+    ]
+
+
+def _args(**kwargs) -> argparse.Namespace:
+    defaults = dict(max_bytes=None, max_tokens=None, tabular=False, param_keys=None, format="json")
+    return argparse.Namespace(**{**defaults, **kwargs})
+
+
+def _encoded_size(obj) -> int:
+    return len(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def test_trim_title_cuts_on_word_boundary():
+    assert trim_title("short", 40) == "short"
+    trimmed = trim_title("Laptop Dell Latitude 5440 i7-1365U 16GB 512GB", 30)
+    assert len(trimmed) <= 30
+    assert trimmed == "Laptop Dell Latitude 5440…"
+
+
+def test_tabulate_states_keys_once():
+    table = tabulate([{"id": "1", "name": "a"}, {"id": "2", "price": "3"}])
+    assert table == {
+        "columns": ["id", "name", "price"],
+        "rows": [["1", "a", None], ["2", None, "3"]],
+    }
+
+
+def test_fit_records_cuts_rare_parameters_then_titles_then_items():
+    records = _records()
+    fitted, report = fit_records(records, max_bytes=1500)
+    assert {k for k in report.parametersDropped[:20]} == {f"Rzadki {i}" for i in range(20)}
+    assert report.parametersDropped[20:] == ["Marka", "Stan"]
+    assert report.titlesTrimmed == report.itemsKept
+    assert all(len(r["name"]) <= 40 for r in fitted)
+    assert 1 <= report.itemsKept < 20
+    assert [r["id"] for r in fitted] == [str(i) for i in range(report.itemsKept)]
+    # Input records are left untouched
+    assert len(records[0]["parameters"]) == 3
+
+
+def test_fit_records_whitelist_keeps_only_named_parameters():
+    fitted, report = fit_records(_records(2), max_bytes=None, keep_params=["Marka"])
+    assert [r["parameters"] for r in fitted] == [{"Marka": "Dell"}] * 2
+    assert report.parametersDropped == ["Stan", "Rzadki 0", "Rzadki 1"]
+
+
+@pytest.mark.parametrize("tabular", [False, True])
+def test_shape_fits_envelope_in_budget(tabular):
+    envelope, report = shape(
+        _records(), _args(max_tokens=1000, tabular=tabular),
+        key="offers", extra={"summary": {"total": 20}},
+    )
+    assert report.bytes == _encoded_size(envelope) <= 4000
+    assert envelope["summary"] == {"total": 20}
+    assert envelope["budget"]["itemsDropped"] == 20 - report.itemsKept
+    if tabular:
+        assert envelope["offers"]["columns"] == ["id", "name", "price", "parameters"]
+
+
+def test_check_format_rejects_tables():
+    with pytest.raises(AllegroCliError) as exc:
+        check_format(_args(max_bytes=100, format="tsv"))
+    assert exc.value.code == "UnsupportedFormatException"
+    check_format(_args(format="tsv"))
+
+
+@pytest.mark.parametrize("flag", [["--tabular"], ["--max-tokens", "500"]])
+def test_budget_flags_default_to_json(flag, capsys):
+    client = MagicMock()
+    client.scrape_search.return_value = []
+    assert run_cli(["search", "x", *flag], client) == 0
+    assert "offers" in json.loads(capsys.readouterr().out)
+
+
+@pytest.mark.parametrize("flag", ["--max-tokens", "--max-bytes"])
+@pytest.mark.parametrize("value", ["0", "-100"])
+def test_budget_limits_must_be_positive(flag, value):
+    with pytest.raises(SystemExit):
+        create_parser().parse_args(["search", "x", flag, value])
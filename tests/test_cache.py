@@ -0,0 +1,159 @@
+import json
+from pathlib import Path
+
+from allegro_cli import config
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.cache import OfferCache, default_cache_path
+from allegro_cli.config import Config
+
+FIXTURES = Path(__file__).parent / "fixtures"
+OFFER_HTML = (FIXTURES / "offer_page.html").read_text(encoding="utf-8")
+
+
+class _CountingClient(AllegroClient):
+    def __init__(self, *args, pages=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pages = list(pages or [OFFER_HTML])
+        self.fetches = 0
+        self.lazy_fetches = 0
+
+    def _fetch_page(self, url):
+        self.fetches += 1
+        return self.pages[min(self.fetches, len(self.pages)) - 1]
+
+    def _fetch_lazy_parameters(self, offer_url, contexts):
+        self.lazy_fetches += 1
+        return {"Lazy": "yes"}
+
+
+def _client(cache, **kwargs) -> _CountingClient:
+    return _CountingClient(Config(cookies="session=test"), offer_cache=cache, **kwargs)
+
+
+def test_cache_path_follows_config_dir(tmp_path):
+    assert default_cache_path() == config.CONFIG_DIR / "offers.sqlite"
+    assert str(default_cache_path()).startswith(str(tmp_path))
+
+
+def test_fresh_offer_is_served_without_request():
+    cache = OfferCache()
+    client = _client(cache)
+    first = client.scrape_offer("12345678")
+    second = client.scrape_offer("12345678")
+    assert client.fetches == 1
+    assert second == first
+    assert second.seller.id == "99999"
+
+
+def test_stale_price_with_unchanged_page_skips_parsing(monkeypatch):
+    cache = OfferCache(price_ttl=0)
+    client = _client(cache)
+    client.scrape_offer("12345678")
+
+    import allegro_cli.scraper as scraper
+
+    def fail(*args, **kwargs):
+        raise AssertionError("page should not be parsed again")
+    monkeypatch.setattr(scraper, "parse_offer_page", fail)
+    offer = client.scrape_offer("12345678")
+    assert client.fetches == 2
+    assert offer.id == "12345678"
+
+
+def test_stale_price_refetches_the_page():
+    cache = OfferCache(price_ttl=0)
+    client = _client(cache)
+    client.scrape_offer("12345678")
+    client.scrape_offer("12345678")
+    assert client.fetches == 2
+
+
+def test_changed_page_reuses_fresh_lazy_parameters():
+    lazy_html = """\
+<html><head><meta property="product:price:amount" content="10.00" /></head><body>
+  <h1>Few params</h1>
+  <script>{"sellerId":"11111"}</script>
+  <script type="application/json" data-serialize-box-id="box-lazy-tab">
+  {"contextUrlParamName": "lazyContext", "contextUrlParamValue": "CTX",
+   "cardinal": 1, "corellationId": "tab content"}
+  </script>
+</body></html>
+"""
+    cache = OfferCache(price_ttl=0)
+    client = _client(cache, pages=[lazy_html, lazy_html.replace("Few", "Some")])
+    first = client.scrape_offer("1")
+    second = client.scrape_offer("1")
+    assert client.fetches == 2
+    assert client.lazy_fetches == 1
+    assert second.parameters["Lazy"] == "yes" == first.parameters["Lazy"]
+
+
+def test_cache_survives_reopening():
+    cache = OfferCache()
+    _client(cache).scrape_offer("12345678")
+    cache.close()
+    reopened = OfferCache()
+    entry = reopened.get("12345678")
+    assert entry is not None
+    assert entry.offer.sellingMode.price.amount == "4599.00"
+    assert reopened.is_fresh(entry)
+
+
+def _listing_html(n: int) -> str:
+    items = [
+        {"id": str(1000 + i), "name": f"Laptop {i}", "price": {"amount": "99.00"},
+         "seller": {"id": str(500 + i), "login": f"shop{i}"}}
+        for i in range(n)
+    ]
+    data = json.dumps({"props": {"pageProps": {"items": items}}})
+    return f'<html><script id="__NEXT_DATA__" type="application/json">{data}</script></html>'
+
+
+def test_search_results_fill_seller_index():
+    cache = OfferCache()
+    client = _client(cache, pages=[_listing_html(5)])
+    offers = client.scrape_search("laptop")
+    assert len(offers) == 5
+    for offer in offers:
+        assert offer.seller.id
+        assert cache.seller_of(offer.id) == (offer.seller.id, None)
+
+
+def test_search_batch_parses_pages_into_columns(monkeypatch):
+    import allegro_cli.scraper as scraper
+
+    def no_offers(html):
+        raise AssertionError("listing pages must not be parsed into Offer objects")
+
+    monkeypatch.setattr(scraper, "parse_search_results", no_offers)
+    cache = OfferCache()
+    client = _client(cache, pages=[_listing_html(3), _listing_html(2)])
+    batch = client.search_batch("laptop", pages=2)
+    assert batch.ids == ["1000", "1001", "1002", "1000", "1001"]
+    assert client.fetches == 2
+    assert cache.seller_of("1002") == ("502", None)
+
+
+def test_resolve_seller_uses_index_then_minimal_fetch(monkeypatch):
+    import allegro_cli.scraper as scraper
+
+    def fail(*args, **kwargs):
+        raise AssertionError("offer page must not be fully parsed")
+    monkeypatch.setattr(scraper, "parse_offer_page", fail)
+
+    cache = OfferCache()
+    cache.remember_seller("111", "555", "cat-1")
+    client = _client(cache)
+    assert client.resolve_seller("111") == ("555", "cat-1")
+    assert client.fetches == 0
+
+    assert client.resolve_seller("12345678") == ("99999", None)
+    assert client.fetches == 1
+    assert client.lazy_fetches == 0
+    assert cache.seller_of("12345678") == ("99999", None)
+
+
+def test_resolve_seller_without_cache_fetches():
+    client = _client(None)
+    assert client.resolve_seller("12345678") == ("99999", None)
+    assert client.fetches == 1
@@ -0,0 +1,112 @@
+import json
+import time
+from pathlib import Path
+
+from allegro_cli.api.capture import CapturedResponse, TrafficReplayer
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.cache import OfferCache
+from allegro_cli.config import Config
+from benchmarks.standin import StandinOptions, StandinServer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _record(tmp_path: Path, options: StandinOptions | None = None) -> Path:
+    capture = tmp_path / "capture"
+    with StandinServer(FIXTURES, options) as server:
+        url = server.base_url
+        client = AllegroClient(
+            Config(cookies="session=secret", edgeBaseUrl=url, scrapeBaseUrl=url),
+            record_dir=str(capture),
+        )
+        client.scrape_search("laptop")
+        client.scrape_offer("12345678")
+        client.get_packages_summary()
+    return capture
+
+
+def test_record_writes_exchanges_without_cookies(tmp_path):
+    capture = _record(tmp_path)
+    entries = [json.loads(p.read_text()) for p in sorted(capture.glob("*.json"))]
+    # listing, offer page, packages summary
+    assert [e["method"] for e in entries] == ["GET"] * 3
+    assert "/listing?string=laptop" in entries[0]["url"]
+    assert entries[1]["url"].endswith("/oferta/-12345678")
+    assert entries[-1]["url"].endswith("/packages/summary")
+    assert entries[-1]["response"]["status_code"] == 200
+    assert all(e["elapsed"] >= 0 for e in entries)
+    assert "secret" not in "".join(p.read_text() for p in capture.glob("*.json"))
+
+
+def test_replay_serves_recording_without_network_or_cookies(tmp_path):
+    capture = _record(tmp_path)
+    # Different base URL and no cookies: replay must not need either
+    client = AllegroClient(
+        Config(cookies=None, scrapeBaseUrl="https://elsewhere.example"),
+        replay_dir=str(capture),
+    )
+    offers = client.scrape_search("laptop")
+    assert [o.id for o in offers] == ["12345678", "87654321"]
+    assert client.scrape_offer("12345678").seller.id == "99999"
+    assert client.get_packages_summary()["total"] == 2
+
+
+def test_replay_realtime_honours_recorded_timing(tmp_path):
+    capture = _record(tmp_path, StandinOptions(latency=0.1))
+    client = AllegroClient(Config(cookies=None), replay_dir=str(capture), replay_realtime=True)
+    t0 = time.monotonic()
+    client.get_packages_summary()
+    assert time.monotonic() - t0 >= 0.1
+
+
+def test_replayer_falls_back_to_legacy_fixtures_and_404():
+    replayer = TrafficReplayer(FIXTURES)
+    resp = replayer.lookup("GET", "/packages/summary")
+    assert resp.status_code == 200
+    assert resp.json()["total"] == 2
+    assert replayer.lookup("GET", "/nope").status_code == 404
+
+
+def test_replayer_returns_repeated_responses_in_order(tmp_path):
+    for i, total in enumerate([1, 2]):
+        (tmp_path / f"{i:05d}-get.json").write_text(json.dumps({
+            "method": "GET",
+            "url": "https://edge.allegro.pl/packages/summary",
+            "response": {"status_code": 200, "headers": {}, "body": json.dumps({"total": total})},
+            "elapsed": 0.0,
+        }))
+    replayer = TrafficReplayer(tmp_path)
+    totals = [replayer.lookup("GET", "/packages/summary").json()["total"] for _ in range(3)]
+    assert totals == [1, 2, 2]
+    assert isinstance(replayer.lookup("GET", "/x"), CapturedResponse)
+
+
+def test_replayer_keeps_exact_and_path_positions_apart(tmp_path):
+    for i, url in enumerate(["/listing", "/listing", "/listing?p=2"]):
+        (tmp_path / f"{i:05d}-get.json").write_text(json.dumps({
+            "method": "GET",
+            "url": f"https://allegro.pl{url}",
+            "response": {"status_code": 200, "headers": {}, "body": str(i)},
+            "elapsed": 0.0,
+        }))
+    replayer = TrafficReplayer(tmp_path)
+    assert replayer.lookup("GET", "/listing").text == "0"
+    # Unrecorded query: the by-path fallback starts at its own first response
+    assert replayer.lookup("GET", "/listing?p=3").text == "0"
+    assert replayer.lookup("GET", "/listing").text == "1"
+
+
+def test_replay_of_legacy_fixtures_only_stays_offline():
+    client = AllegroClient(Config(cookies=None), replay_dir=str(FIXTURES))
+    assert client.get_packages_summary()["total"] == 2
+
+
+def test_record_fetches_offers_the_cache_already_holds(tmp_path):
+    capture = tmp_path / "capture"
+    cache = OfferCache()
+    with StandinServer(FIXTURES) as server:
+        config = Config(cookies="session=test", scrapeBaseUrl=server.base_url)
+        AllegroClient(config, offer_cache=cache).scrape_offer("12345678")
+        AllegroClient(config, offer_cache=cache, record_dir=str(capture)).scrape_offer("12345678")
+    urls = [json.loads(p.read_text())["url"] for p in capture.glob("*.json")]
+    assert any(u.endswith("/oferta/-12345678") for u in urls)
@@ -0,0 +1,106 @@
+import argparse
+import json
+from pathlib import Path
+
+import pytest
+
+from allegro_cli.api.models import CartError
+from allegro_cli.cache import OfferCache
+from allegro_cli.commands.cart import _cart_adds
+from allegro_cli.config import Config
+from benchmarks.standin import StandinServer
+from tests.conftest import EdgeClient, run_cli
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _add_args(**kwargs) -> argparse.Namespace:
+    defaults = dict(offer_id=None, seller_id=None, quantity=1, category=None, from_file=None)
+    return argparse.Namespace(**{**defaults, **kwargs})
+
+
+def test_cart_adds_merges_ids_and_file(tmp_path):
+    path = tmp_path / "items.json"
+    path.write_text(json.dumps([
+        {"offerId": "3", "sellerId": "s3", "quantity": 2},
+        {"offer_id": "1", "qty": "4"},
+    ]))
+    changes = _cart_adds(_add_args(offer_id="1,2", from_file=str(path)))
+    assert [(c.itemId, c.delta, c.sellerId) for c in changes] == [
+        ("1", 5, ""), ("2", 1, ""), ("3", 2, "s3"),
+    ]
+
+
+@pytest.mark.parametrize("quantity", ["lots", "0", "-2"])
+def test_cart_adds_rejects_bad_quantity(tmp_path, quantity):
+    path = tmp_path / "items.csv"
+    path.write_text(f"offer_id,quantity\n1,{quantity}\n")
+    with pytest.raises(CartError) as exc:
+        _cart_adds(_add_args(from_file=str(path)))
+    assert exc.value.code == "CartFileException"
+    with pytest.raises(CartError):
+        _cart_adds(_add_args(offer_id="1", quantity=quantity))
+
+
+def test_cart_adds_rejects_one_seller_for_many_offers():
+    assert _cart_adds(_add_args(offer_id="1", seller_id="s1"))[0].sellerId == "s1"
+    with pytest.raises(CartError) as exc:
+        _cart_adds(_add_args(offer_id="1,2", seller_id="s1"))
+    assert exc.value.code == "InvalidArgumentException"
+
+
+def test_bulk_add_uses_few_requests(tmp_path, capsys):
+    path = tmp_path / "items.csv"
+    lines = ["offer_id,seller_id,quantity"]
+    lines += [f"{1000 + i},{'s1' if i % 2 else ''},1" for i in range(40)]
+    path.write_text("\n".join(lines) + "\n")
+
+    with StandinServer(FIXTURES) as server:
+        config = Config(
+            cookies="session=test",
+            edgeBaseUrl=server.base_url,
+            scrapeBaseUrl=server.base_url,
+        )
+        assert run_cli(["cart", "add", "--from", str(path), "--format", "json"], config=config) == 0
+
+    routes = server.stats.by_route
+    assert routes["POST /carts/changeQuantityCommand"] == 2
+    assert routes["GET /carts"] == 1
+    assert routes["offer"] == 20  # only the rows without a seller ID
+    assert json.loads(capsys.readouterr().out)["carts"][0]["id"] == "cart-1"
+
+
+_CART = {"cart": {"groups": [{
+    "seller": {"login": "shop"},
+    "items": [
+        {"id": "uuid-1", "offers": [{"id": "111", "name": "A"}], "quantity": {"selected": 1}},
+        {"id": "uuid-2", "offers": [{"id": "222", "name": "B"}], "quantity": {"selected": 2}},
+    ],
+}]}}
+
+
+def test_remove_uses_saved_item_ids_and_one_delete(capsys):
+    client = EdgeClient({("GET", "/carts"): (200, _CART)}, offer_cache=OfferCache())
+    client.get_cart()
+    client.calls.clear()
+
+    assert run_cli(["cart", "remove", "111,222", "--no-refresh", "--format", "json"], client) == 0
+    assert client.calls == [("DELETE", "/cart/items?ids=uuid-1,uuid-2")]
+    assert json.loads(capsys.readouterr().out)["removed"] == {"111": "uuid-1", "222": "uuid-2"}
+
+
+def test_remove_fetches_cart_only_on_miss():
+    client = EdgeClient({("GET", "/carts"): (200, _CART)}, offer_cache=OfferCache())
+    assert client.resolve_cart_items(["222"]) == {"222": "uuid-2"}
+    assert client.resolve_cart_items(["111"]) == {"111": "uuid-1"}
+    assert client.calls == [("GET", "/carts")]
+    with pytest.raises(CartError) as exc:
+        client.resolve_cart_items(["999"])
+    assert exc.value.code == "CartItemNotFoundException"
+
+
+def test_add_uses_cart_state_from_mutation_response(capsys):
+    client = EdgeClient({("POST", "/carts/changeQuantityCommand"): (200, _CART)})
+    assert run_cli(["cart", "add", "111", "s1", "--format", "json"], client) == 0
+    assert client.calls == [("POST", "/carts/changeQuantityCommand")]
+    assert json.loads(capsys.readouterr().out) == _CART
@@ -1,6 +1,8 @@
 import json
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from allegro_cli.main import create_parser, main
 from allegro_cli.api.models import (
     Offer, Seller, SellingMode, Price, Category,
@@ -115,6 +117,31 @@ def test_parser_offer():
     assert args.offer_id == "some-id"
 
 
+def test_parser_offer_batch():
+    parser = create_parser()
+    args = parser.parse_args(["offer", "1", "2", "3", "--format", "ndjson"])
+    assert args.offer_id == "1"
+    assert args.more_offer_ids == ["2", "3"]
+    assert args.format == "ndjson"
+
+
+def test_parser_search_pages():
+    parser = create_parser()
+    args = parser.parse_args(["search", "laptop", "--pages", "4"])
+    assert args.pages == 4
+
+
+@pytest.mark.parametrize("argv", [
+    ["search", "laptop", "--pages", "0"],
+    ["search", "laptop", "--pages", "-2"],
+    ["saved", "add", "s", "laptop", "--pages", "0"],
+    ["saved", "run", "s", "--pages", "0"],
+])
+def test_parser_rejects_non_positive_pages(argv):
+    with pytest.raises(SystemExit):
+        create_parser().parse_args(argv)
+
+
 def test_parser_offer_with_format():
     parser = create_parser()
     args = parser.parse_args(["offer", "12345", "--format", "json"])
@@ -164,6 +191,23 @@ def test_parser_packages():
     assert args.command == "packages"
 
 
+def test_parser_profile_flags():
+    parser = create_parser()
+    args = parser.parse_args([
+        "offer", "12345", "--profile", "prof", "--profile-memory", "--profile-top", "5",
+    ])
+    assert args.profile == "prof"
+    assert args.profile_memory is True
+    assert args.profile_top == 5
+
+
+def test_parser_profile_defaults():
+    parser = create_parser()
+    args = parser.parse_args(["search", "laptop"])
+    assert args.profile is None
+    assert args.profile_memory is False
+
+
 def test_search_command_outputs_json(capsys):
     mock_client = MagicMock()
     mock_client.scrape_search.return_value = [_make_offer()]
@@ -177,6 +221,10 @@ def test_search_command_outputs_json(capsys):
         mock_load.return_value = MagicMock(
             cookies="session=x",
             edgeBaseUrl="https://edge.allegro.pl",
+            scrapeBaseUrl="https://allegro.pl",
+            offerPriceTtl=900,
+            offerParamsTtl=604800,
+            localStore=False,
             outputFormat="text",
             flareSolverrUrl=None,
         )
@@ -246,3 +294,36 @@ def test_missing_cookies_returns_auth_error_for_search(capsys):
     captured = capsys.readouterr()
     data = json.loads(captured.err)
     assert data["errors"][0]["code"] == "AuthenticationException"
+
+
+def test_profile_writes_pstats_and_alloc_report(capsys, tmp_path):
+    import pstats
+
+    mock_client = MagicMock()
+    mock_client.scrape_search.return_value = [_make_offer()]
+    prof_dir = tmp_path / "prof"
+
+    with (
+        patch("allegro_cli.main.load_config") as mock_load,
+        patch("allegro_cli.main.ensure_dirs"),
+        patch("allegro_cli.api.client.AllegroClient", return_value=mock_client),
+        patch("sys.argv", [
+            "allegro", "search", "laptop", "--format", "json",
+            "--profile", str(prof_dir), "--profile-memory",
+        ]),
+    ):
+        mock_load.return_value = MagicMock(outputFormat="text")
+        result = main()
+
+    assert result == 0
+    captured = capsys.readouterr()
+    # Command output is untouched, profile report goes to stderr
+    assert json.loads(captured.out)[0]["name"] == "Test Offer"
+    assert "Profile written to" in captured.err
+
+    dumps = list(prof_dir.glob("allegro-search-*.pstats"))
+    assert len(dumps) == 1
+    assert pstats.Stats(str(dumps[0])).total_calls > 0
+    allocs = list(prof_dir.glob("allegro-search-*-alloc.txt"))
+    assert len(allocs) == 1
+    assert "Peak traced memory" in allocs[0].read_text()
@@ -10,6 +10,8 @@ def test_load_default_config(tmp_path: Path):
     assert config.edgeBaseUrl == "https://edge.allegro.pl"
     assert config.outputFormat == "text"
     assert config.flareSolverrUrl is None
+    assert config.offerPriceTtl == 900
+    assert config.offerParamsTtl == 7 * 24 * 3600
 
 
 def test_save_and_load_config(tmp_path: Path):
@@ -0,0 +1,201 @@
+import json
+from unittest.mock import patch
+
+import httpx
+
+from allegro_cli.api.models import AllegroCliError, AuthenticationError
+from allegro_cli.cache import OfferCache
+from allegro_cli.delta import diff_rows, package_rows, package_transitions
+from tests.conftest import EdgeClient, run_cli
+
+
+def _cart(*lines):
+    return {"cart": {"groups": [{
+        "seller": {"login": "shop"},
+        "items": [
+            {"id": f"uuid-{oid}", "offers": [{"id": oid, "name": f"Item {oid}"}],
+             "quantity": {"selected": qty}}
+            for oid, qty in lines
+        ],
+    }]}}
+
+
+def _packages(*parcels):
+    return {"packages": [
+        {"content": {"description": f"Parcel {w}"}, "delivery": {"waybill": w, "status": s}}
+        for w, s in parcels
+    ]}
+
+
+def _run(argv, client, capsys):
+    """Exit code and the NDJSON events printed."""
+    result = run_cli(argv, client)
+    return result, [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_diff_rows():
+    old = [{"id": "1", "qty": 1}, {"id": "2", "qty": 1}]
+    new = [{"id": "1", "qty": 3}, {"id": "3", "qty": 1}]
+    events = diff_rows(old, new, key="id")
+    assert [(e["change"], e["id"]) for e in events] == [
+        ("changed", "1"), ("added", "3"), ("removed", "2"),
+    ]
+    assert events[0]["before"] == {"qty": 1}
+
+
+def test_package_transitions_report_status_moves():
+    old = [{"parcel": "A", "status": "SENT"}, {"parcel": "B", "status": "SENT"}]
+    new = [{"parcel": "A", "status": "DELIVERED"}, {"parcel": "B", "status": "SENT"}]
+    assert package_transitions(old, new) == [{
+        "change": "status", "parcel": "A", "from": "SENT", "to": "DELIVERED",
+        "row": {"parcel": "A", "status": "DELIVERED"},
+    }]
+
+
+def test_parcels_without_waybill_are_told_apart():
+    unshipped = [
+        {"content": {"description": "Kubek"}, "delivery": {"status": "NEW"}},
+        {"content": {"description": "Kubek"}, "delivery": {"status": "NEW"}},
+        {"id": "p-3", "content": {"description": "Kubek"}, "delivery": {"status": "NEW"}},
+    ]
+    rows = package_rows(unshipped)
+    assert [r["parcel"] for r in rows] == ["Kubek#1", "Kubek#2", "p-3"]
+    events = package_transitions([], rows)
+    assert [e["change"] for e in events] == ["added"] * 3
+
+    # Once one ships it is keyed by its waybill; the rest keep one key each
+    shipped = [dict(unshipped[0], delivery={"waybill": "W9", "status": "SENT"}), *unshipped[1:]]
+    events = package_transitions(rows, package_rows(shipped))
+    assert [(e["change"], e["parcel"]) for e in events] == [("added", "W9"), ("removed", "Kubek#2")]
+
+
+def test_cart_changes_only(capsys):
+    client = EdgeClient(offer_cache=OfferCache())
+    client.responses["GET", "/carts"] = (200, _cart(("111", 1), ("222", 1)))
+    argv = ["cart", "list", "--changes-only", "--format", "ndjson"]
+
+    result, events = _run(argv, client, capsys)
+    assert result == 0
+    assert [e["change"] for e in events] == ["added", "added"]
+
+    # Unchanged body: nothing to report
+    assert _run(argv, client, capsys)[1] == []
+
+    client.responses["GET", "/carts"] = (200, _cart(("111", 2), ("333", 1)))
+    events = _run(argv, client, capsys)[1]
+    assert [(e["change"], e["offer_id"]) for e in events] == [
+        ("changed", "111"), ("added", "333"), ("removed", "222"),
+    ]
+    assert events[0]["before"] == {"qty": "1"}
+
+
+def test_packages_changes_only_skips_summary(capsys):
+    client = EdgeClient(offer_cache=OfferCache())
+    client.responses["GET", "/packages"] = (200, _packages(("W1", "SENT")))
+    argv = ["packages", "--changes-only", "--format", "ndjson"]
+
+    assert [e["change"] for e in _run(argv, client, capsys)[1]] == ["added"]
+    client.responses["GET", "/packages"] = (200, _packages(("W1", "DELIVERED")))
+    events = _run(argv, client, capsys)[1]
+    assert [(e["change"], e["from"], e["to"]) for e in events] == [("status", "SENT", "DELIVERED")]
+    assert {path for _, path in client.calls} == {"/packages"}
+
+
+def test_not_modified_serves_stored_body():
+    client = EdgeClient(offer_cache=OfferCache())
+    client.responses["GET", "/carts"] = (200, _cart(("111", 1)))
+    client.etags["/carts"] = '"v1"'
+    first = client.get_cart()
+    digest = client.body_hash("/carts")
+
+    client.responses["GET", "/carts"] = (200, _cart(("222", 1)))  # only served on a 200
+    assert client.get_cart() == first
+    assert client.calls[-1] == ("GET", "/carts") and client.sent_etags[-1] == '"v1"'
+    assert client.get_cart(since=digest) is None
+
+
+def test_changes_only_survives_no_cache(capsys):
+    client = EdgeClient()
+    client.responses["GET", "/carts"] = (200, _cart(("111", 1)))
+    client.etags["/carts"] = '"v1"'
+    argv = ["cart", "list", "--changes-only", "--no-cache", "--format", "ndjson"]
+
+    assert [e["change"] for e in _run(argv, client, capsys)[1]] == ["added"]
+    assert _run(argv, client, capsys)[1] == []
+    # No validators are kept, so every poll is a plain GET
+    assert client.sent_etags == [None, None]
+
+
+def test_changes_only_refuses_replay(tmp_path, capsys):
+    assert run_cli(["cart", "list", "--changes-only", "--replay", str(tmp_path)]) == 1
+    err = json.loads(capsys.readouterr().err)
+    assert err["errors"][0]["code"] == "StateRequiredException"
+
+
+class _WatchClient:
+    """Plays back one (summary, packages) pair per poll."""
+
+    def __init__(self, rounds):
+        self.rounds = rounds
+        self.poll = -1
+        self.lists = 0
+
+    def get_packages_summary(self):
+        self.poll += 1
+        if isinstance(self.rounds[self.poll], Exception):
+            raise self.rounds[self.poll]
+        return self.rounds[self.poll][0]
+
+    def get_packages_list(self):
+        self.lists += 1
+        return self.rounds[self.poll][1]["packages"]
+
+
+def test_packages_watch_fetches_list_on_summary_change(capsys):
+    in_transit = ({"total": 1, "parcelsForPickup": 0}, _packages(("W1", "IN_TRANSIT")))
+    pickup = ({"total": 1, "parcelsForPickup": 1}, _packages(("W1", "READY_FOR_PICKUP")))
+    client = _WatchClient([in_transit, in_transit, pickup, pickup])
+    sleeps = []
+
+    with patch("allegro_cli.commands.packages.time.sleep", sleeps.append):
+        result, events = _run(["packages", "watch", "--polls", "4"], client, capsys)
+
+    assert result == 0
+    assert client.lists == 2
+    assert [(e["change"], e["parcel"]) for e in events] == [("added", "W1"), ("status", "W1")]
+    assert events[1]["to"] == "READY_FOR_PICKUP" and "time" in events[1]
+    assert sleeps == [300.0, 300.0, 60.0]
+
+
+def test_packages_watch_backs_off_when_idle(capsys):
+    done = ({"total": 1, "parcelsForPickup": 0}, _packages(("W1", "DELIVERED")))
+    client = _WatchClient([done] * 5)
+    sleeps = []
+
+    with patch("allegro_cli.commands.packages.time.sleep", sleeps.append):
+        _run(["packages", "watch", "--polls", "5", "--max-interval", "1000"], client, capsys)
+
+    assert client.lists == 1
+    assert sleeps == [600.0, 1000.0, 1000.0, 1000.0]
+
+
+def test_packages_watch_retries_after_errors(capsys):
+    in_transit = ({"total": 1, "parcelsForPickup": 0}, _packages(("W1", "IN_TRANSIT")))
+    pickup = ({"total": 1, "parcelsForPickup": 1}, _packages(("W1", "READY_FOR_PICKUP")))
+    bad_gateway = AllegroCliError("API returned 502", code="ApiException")
+    client = _WatchClient([in_transit, bad_gateway, httpx.ConnectError("reset"), pickup])
+    sleeps = []
+
+    with patch("allegro_cli.commands.packages.time.sleep", sleeps.append):
+        result, events = _run(["packages", "watch", "--polls", "4"], client, capsys)
+
+    assert result == 0
+    assert [e["change"] for e in events] == ["added", "status"]
+    assert sleeps == [300.0, 600.0, 1200.0]
+
+
+def test_packages_watch_stops_on_expired_session(capsys):
+    client = _WatchClient([AuthenticationError()])
+    with patch("allegro_cli.commands.packages.time.sleep"):
+        result, _ = _run(["packages", "watch", "--polls", "3"], client, capsys)
+    assert result == 2
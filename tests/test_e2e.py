@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from allegro_cli.main import main
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -14,6 +16,10 @@ def _mock_config():
     return MagicMock(
         cookies="session=test",
         edgeBaseUrl="https://edge.allegro.pl",
+        scrapeBaseUrl="https://allegro.pl",
+        offerPriceTtl=900,
+        offerParamsTtl=604800,
+        localStore=False,
         outputFormat="text",
         flareSolverrUrl=None,
     )
@@ -393,6 +399,10 @@ def test_e2e_missing_cookies(capsys):
     no_cookies_config = MagicMock(
         cookies=None,
         edgeBaseUrl="https://edge.allegro.pl",
+        scrapeBaseUrl="https://allegro.pl",
+        offerPriceTtl=900,
+        offerParamsTtl=604800,
+        localStore=False,
         outputFormat="text",
         flareSolverrUrl=None,
     )
@@ -408,3 +418,151 @@ def test_e2e_missing_cookies(capsys):
     err = capsys.readouterr().err
     data = json.loads(err)
     assert data["errors"][0]["code"] == "AuthenticationException"
+
+
+# --- NDJSON streaming ---
+
+
+def test_e2e_search_ndjson_streams_pages(capsys):
+    """Offers from page 1 are written before page 2 is fetched."""
+    html = (FIXTURES / "search_results.html").read_text(encoding="utf-8")
+    seen_before_fetch = []
+
+    def capture_fetch(self, url):
+        seen_before_fetch.append(capsys.readouterr().out)
+        return html
+
+    with (
+        patch("allegro_cli.main.load_config", return_value=_mock_config()),
+        patch("allegro_cli.main.ensure_dirs"),
+        patch("sys.argv", ["allegro", "search", "laptop", "--pages", "2", "--format", "ndjson"]),
+        patch("allegro_cli.api.client.AllegroClient._fetch_page", capture_fetch),
+    ):
+        result = main()
+
+    assert result == 0
+    assert seen_before_fetch[0] == ""
+    first_page = [json.loads(line) for line in seen_before_fetch[1].splitlines()]
+    assert [o["name"] for o in first_page] == ["Laptop Lenovo ThinkPad", "Laptop Dell XPS 15"]
+    second_page = capsys.readouterr().out.splitlines()
+    assert len(second_page) == 2
+
+
+def test_e2e_search_ndjson_compact(capsys):
+    result = _run_cli(
+        ["search", "laptop", "--format", "ndjson", "--compact"],
+        fixture="search_results.html",
+    )
+    assert result == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0]) == {
+        "id": "12345678",
+        "name": "Laptop Lenovo ThinkPad",
+        "price": "3499.00",
+        "seller": "",
+        "image": "https://a.allegroimg.com/original/thinkpad.jpg",
+    }
+
+
+def test_e2e_search_pages_stop_on_empty_page(capsys):
+    pages = [
+        (FIXTURES / "search_results.html").read_text(encoding="utf-8"),
+        (FIXTURES / "search_empty.html").read_text(encoding="utf-8"),
+    ]
+    fetched_urls = []
+
+    def capture_fetch(self, url):
+        fetched_urls.append(url)
+        return pages[len(fetched_urls) - 1]
+
+    with (
+        patch("allegro_cli.main.load_config", return_value=_mock_config()),
+        patch("allegro_cli.main.ensure_dirs"),
+        patch("sys.argv", ["allegro", "search", "laptop", "--pages", "5", "--format", "json"]),
+        patch("allegro_cli.api.client.AllegroClient._fetch_page", capture_fetch),
+    ):
+        result = main()
+
+    assert result == 0
+    assert len(json.loads(capsys.readouterr().out)) == 2
+    assert len(fetched_urls) == 2
+    assert "p=2" in fetched_urls[1]
+
+
+def test_e2e_offer_batch_ndjson(capsys):
+    result = _run_cli(
+        ["offer", "12345678", "87654321", "--format", "ndjson"],
+        fixture="offer_page.html",
+    )
+    assert result == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [o["id"] for o in lines] == ["12345678", "87654321"]
+    assert lines[0]["parameters"]["Procesor"] == "Intel Core i7-1365U"
+
+
+def test_e2e_search_csv_export(tmp_path, capsys):
+    target = tmp_path / "offers.csv"
+    result = _run_cli(
+        ["search", "laptop", "--format", "csv", "--output", str(target)],
+        fixture="search_results.html",
+    )
+    assert result == 0
+    assert "Wrote 2 offers" in capsys.readouterr().err
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("id,name,seller_id")
+    assert lines[1].startswith("12345678,Laptop Lenovo ThinkPad")
+
+
+def test_e2e_export_format_rejected_for_cart(capsys):
+    result = _run_cli(["cart", "list", "--format", "parquet"])
+    assert result == 1
+    err = json.loads(capsys.readouterr().err)
+    assert err["errors"][0]["code"] == "UnsupportedFormatException"
+
+
+def test_e2e_search_msgpack_compact(capsysbinary):
+    pytest.importorskip("msgpack")
+    from allegro_cli.output import decode_msgpack
+
+    result = _run_cli(
+        ["search", "laptop", "--format", "msgpack", "--compact"],
+        fixture="search_results.html",
+    )
+    assert result == 0
+    offers = decode_msgpack(capsysbinary.readouterr().out)
+    assert [o["id"] for o in offers] == ["12345678", "87654321"]
+    assert offers[0]["price"] == "3499.00"
+
+
+def test_e2e_search_max_tokens_defaults_to_json(capsys):
+    result = _run_cli(
+        ["search", "laptop", "--compact", "--max-tokens", "60"],
+        fixture="search_results.html",
+    )
+    assert result == 0
+    out = json.loads(capsys.readouterr().out)
+    assert [o["id"] for o in out["offers"]] == ["12345678"]
+    assert out["budget"]["itemsDropped"] == 1
+
+
+def test_e2e_search_tabular(capsys):
+    result = _run_cli(
+        ["search", "laptop", "--compact", "--tabular", "--format", "json"],
+        fixture="search_results.html",
+    )
+    assert result == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["offers"]["columns"] == ["id", "name", "price", "seller", "image"]
+    assert out["offers"]["rows"][1][:3] == ["87654321", "Laptop Dell XPS 15", "5999.99"]
+
+
+def test_e2e_offer_compact_keeps_parameters(capsys):
+    result = _run_cli(
+        ["offer", "12345678", "--format", "json", "--compact"],
+        fixture="offer_page.html",
+    )
+    assert result == 0
+    out = json.loads(capsys.readouterr().out)
+    assert set(out) == {"id", "name", "price", "seller", "image", "parameters"}
+    assert out["parameters"]["Procesor"] == "Intel Core i7-1365U"
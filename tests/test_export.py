@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from allegro_cli.api.models import AllegroCliError
+from allegro_cli.export import CsvOfferWriter, OfferWriter, open_writer
+from allegro_cli.main import create_parser
+from tests.conftest import make_offer, run_cli
+
+DELL = {"Marka": "Dell"}
+
+
+class _CountingFile(io.StringIO):
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def test_csv_writer_flushes_in_batches():
+    out = _CountingFile()
+    with CsvOfferWriter(out, batch_rows=2) as writer:
+        writer.write_all(make_offer(str(i), parameters=DELL) for i in range(5))
+    assert out.flushes == 3
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == [
+        "id", "name", "seller_id", "seller_name", "selling_format",
+        "price_amount", "price_currency", "category_id", "image_url", "parameters",
+    ]
+    assert [r[0] for r in rows[1:]] == ["0", "1", "2", "3", "4"]
+    assert json.loads(rows[1][-1]) == {"Marka": "Dell"}
+
+
+def test_csv_writer_param_keys_become_columns():
+    out = io.StringIO()
+    with CsvOfferWriter(out, param_keys=["Marka", "Stan"]) as writer:
+        writer.write(make_offer("1", parameters=DELL))
+        writer.write(make_offer("2"))
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0][-2:] == ["param.Marka", "param.Stan"]
+    assert rows[1][-2:] == ["Dell", ""]
+    assert rows[2][-2:] == ["", ""]
+
+
+def test_binary_formats_require_output():
+    with pytest.raises(AllegroCliError) as exc:
+        open_writer("parquet")
+    assert exc.value.code == "MissingOutputException"
+
+
+def test_parquet_and_arrow_round_trip(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    from decimal import Decimal
+
+    offers = [make_offer(str(i), parameters=DELL) for i in range(3)]
+    with open_writer("parquet", str(tmp_path / "o.parquet"), ["Marka"]) as writer:
+        writer.batch_rows = 2
+        writer.write_all(offers)
+    pf = pq.ParquetFile(tmp_path / "o.parquet")
+    assert pf.num_row_groups == 2
+    table = pf.read()
+    assert table.column("id").to_pylist() == ["0", "1", "2"]
+    assert table.schema.field("price_amount").type == pa.decimal128(12, 2)
+    assert table.column("price_amount")[0].as_py() == Decimal("9.99")
+    assert table.column("param.Marka").to_pylist() == ["Dell"] * 3
+
+    with open_writer("arrow", str(tmp_path / "o.arrow")) as writer:
+        writer.write_all(offers)
+    with pa.OSFile(str(tmp_path / "o.arrow"), "rb") as source:
+        table = pa.ipc.open_file(source).read_all()
+    assert table.num_rows == 3
+    assert table.column("parameters").to_pylist()[0] == [("Marka", "Dell")]
+
+
+def test_offer_writer_is_abstract():
+    with pytest.raises(TypeError):
+        OfferWriter()
+
+
+def test_output_only_on_offer_listing_commands():
+    parser = create_parser()
+    assert parser.parse_args(["search", "x", "-o", "f.csv"]).output == "f.csv"
+    assert parser.parse_args(["local", "search", "-o", "f.csv"]).output == "f.csv"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["cart", "list", "-o", "f"])
+
+
+def test_output_rejected_for_non_export_formats(capsys):
+    client = MagicMock()
+    assert run_cli(["search", "x", "--format", "json", "-o", "out.json"], client) == 1
+    assert json.loads(capsys.readouterr().err)["errors"][0]["code"] == "InvalidArgumentException"
+    client.scrape_search.assert_not_called()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet", "arrow"])
+def test_export_formats_cannot_be_the_default(fmt):
+    parser = create_parser()
+    assert parser.parse_args(["config", "set", "--output-format", "ndjson"]).output_format == "ndjson"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["config", "set", "--output-format", fmt])
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from allegro_cli.api.models import AllegroCliError
+from allegro_cli.config import Config
+from allegro_cli.local_store import LocalStore, parse_since
+from benchmarks.standin import StandinServer
+from tests.conftest import make_offer, run_cli
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalStore(tmp_path / "local.sqlite")
+    store.upsert_offers([
+        make_offer(
+            "1", "49.99", name="Kawa ziarnista Arabica 1 kg",
+            parameters={"Waga produktu": "1 kg", "Rodzaj": "Arabica"},
+        ),
+        make_offer("2", "19.50", name="Kawa mielona Robusta 250 g", parameters={"Waga produktu": "250 g"}),
+        make_offer("3", "89.00", name="Młynek do kawy ręczny"),
+    ], seen_at=1000.0)
+    return store
+
+
+def _ids(offers):
+    return [o.id for o in offers]
+
+
+def test_phrase_matches_folded_prefixes(store):
+    assert _ids(store.search("kawa ziarnistą")) == ["1"]
+    assert _ids(store.search("mlynek")) == ["3"]
+    assert _ids(store.search("arabica")) == ["1"]  # parameter value
+
+
+def test_price_param_and_time_filters(store):
+    assert sorted(_ids(store.search("kawa", price_max="50"))) == ["1", "2"]
+    assert _ids(store.search(price_min="20", price_max="50")) == ["1"]
+    assert _ids(store.search(params={"Waga produktu": "250 G"})) == ["2"]
+    store.upsert_offers([make_offer("3", "89.00", name="Młynek do kawy ręczny")], seen_at=2000.0)
+    assert _ids(store.search(since=1500.0)) == ["3"]
+
+
+def test_search_page_keeps_parameters_and_tracks_prices(store):
+    store.upsert_offers([make_offer("1", "44.99", name="Kawa ziarnista Arabica 1 kg")], seen_at=2000.0)
+    store.upsert_offers([make_offer("1", "44.99", name="Kawa ziarnista Arabica 1 kg")], seen_at=3000.0)
+
+    [offer] = store.search("arabica")
+    assert offer.sellingMode.price.amount == "44.99"
+    assert offer.parameters["Rodzaj"] == "Arabica"
+    assert store.price_history("1") == [(1000.0, "49.99"), (2000.0, "44.99")]
+
+
+def test_parse_since():
+    assert parse_since("24h", now=100_000.0) == 100_000.0 - 86_400
+    assert parse_since("30m", now=10_000.0) == 10_000.0 - 1_800
+    with pytest.raises(AllegroCliError):
+        parse_since("yesterday")
+
+
+def test_search_results_are_queryable_offline(capsys):
+    with StandinServer(FIXTURES) as server:
+        config = Config(
+            cookies="session=test", edgeBaseUrl=server.base_url,
+            scrapeBaseUrl=server.base_url, localStore=True,
+        )
+        assert run_cli(["search", "laptop", "--format", "json"], config=config) == 0
+    capsys.readouterr()
+    requests = server.stats.requests
+
+    assert run_cli(["local", "search", "thinkpad", "--format", "json", "--compact"], config=config) == 0
+    offers = json.loads(capsys.readouterr().out)
+    assert [o["name"] for o in offers] == ["Laptop Lenovo ThinkPad"]
+    assert server.stats.requests == requests
@@ -0,0 +1,90 @@
+import dataclasses
+
+from allegro_cli.api.models import (
+    Category,
+    DeliveryInfo,
+    Image,
+    Offer,
+    Price,
+    Seller,
+    SellingMode,
+    Stock,
+)
+from allegro_cli.output import _to_serializable
+
+
+def _full_offer() -> Offer:
+    return Offer(
+        id="12345678",
+        name="Laptop",
+        seller=Seller(id="99", name="shop"),
+        sellingMode=SellingMode(format="BUY_NOW", price=Price(amount="10.00"), popularity=5),
+        category=Category(id="491", name="Laptopy"),
+        images=[Image(url="a.jpg"), Image(url="b.jpg")],
+        delivery=DeliveryInfo(lowestPrice=Price(amount="0.00"), availableForFree=True),
+        stock=Stock(available=3),
+        parameters={"Procesor": "i7", "RAM": "16 GB"},
+    )
+
+
+def test_to_dict_matches_asdict():
+    offer = _full_offer()
+    assert offer.to_dict() == dataclasses.asdict(offer)
+
+    minimal = Offer(
+        id="1", name="x", seller=Seller(id="", name=""),
+        sellingMode=SellingMode(format="BUY_NOW", price=Price(amount="")),
+        category=Category(id=""),
+    )
+    assert minimal.to_dict() == dataclasses.asdict(minimal)
+
+
+def test_to_dict_does_not_share_parameters():
+    offer = _full_offer()
+    data = offer.to_dict()
+    data["parameters"]["RAM"] = "32 GB"
+    assert offer.parameters["RAM"] == "16 GB"
+
+
+def test_to_serializable_handles_models_and_lists():
+    offer = _full_offer()
+    assert _to_serializable(offer) == offer.to_dict()
+    assert _to_serializable([offer]) == [offer.to_dict()]
+    assert _to_serializable({"a": 1}) == {"a": 1}
+
+
+def test_models_are_slotted():
+    offer = _full_offer()
+    assert not hasattr(offer, "__dict__")
+    assert not hasattr(offer.sellingMode.price, "__dict__")
+
+
+def test_offer_batch_round_trip_and_columns():
+    from allegro_cli.api.models import OfferBatch
+
+    offer = _full_offer()
+    bare = Offer(
+        id="2", name="Bare", seller=Seller(id="", name=""),
+        sellingMode=SellingMode(format="BUY_NOW", price=Price(amount="1.50")),
+        category=Category(id=""),
+    )
+    batch = OfferBatch([offer, bare])
+    assert len(batch) == 2
+    assert batch.column("sellingMode.price.amount") == ["10.00", "1.50"]
+    assert batch.column("parameters.RAM") == ["16 GB", ""]
+
+    first, second = list(batch)
+    assert first.id == offer.id
+    assert first.images == offer.images
+    assert first.category == offer.category
+    assert batch.image_urls == ["a.jpg", ""]
+    assert first.parameters == offer.parameters
+    assert second.images == []
+    assert second.parameters == {}
+
+    try:
+        batch.column("delivery.availableForFree")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected KeyError for a non-columnar field")
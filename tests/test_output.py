@@ -0,0 +1,123 @@
+import io
+import json
+
+import pytest
+
+from allegro_cli.api.models import Image, OfferBatch
+from allegro_cli.output import compile_columns, output_json, output_tsv
+from tests.conftest import make_offer
+
+DELL = {"Marka": "Dell"}
+
+
+_COLUMNS = [
+    "id", "sellingMode.price.amount", "seller", "parameters.Marka",
+    "images", "category.name", "missing", "id.deeper",
+]
+
+
+def test_compiled_columns_same_for_dicts_and_models():
+    offer = make_offer(parameters=DELL)
+    cells = compile_columns(_COLUMNS)
+    assert cells(offer) == cells(offer.to_dict())
+    assert cells(offer) == [
+        "1", "9.99", '{"id": "s1", "name": "shop"}', "Dell",
+        "[{'url': 'a.jpg'}]", "", "", "",
+    ]
+
+
+def test_output_tsv_models_dicts_and_batch_agree():
+    offers = [make_offer(str(i), parameters=DELL) for i in range(5)]
+    offers[0].images.append(Image(url="b.jpg"))
+    offers[0].category.name = "Laptopy"
+    columns = ["id", "name", "sellingMode.price.amount", "parameters.Marka", "images", "category.name"]
+    outputs = []
+    for rows in (offers, [o.to_dict() for o in offers], OfferBatch(offers), iter(offers)):
+        buf = io.StringIO()
+        output_tsv(rows, columns, file=buf)
+        outputs.append(buf.getvalue())
+    assert len(set(outputs)) == 1
+    lines = outputs[0].splitlines()
+    assert lines[0] == "id\tname\tsellingMode.price.amount\tparameters.Marka\timages\tcategory.name"
+    assert lines[1] == "0\tOffer 0\t9.99\tDell\t[{'url': 'a.jpg'}, {'url': 'b.jpg'}]\tLaptopy"
+    assert len(lines) == 6
+
+
+def test_output_tsv_writes_in_chunks(monkeypatch):
+    import allegro_cli.output as output
+
+    monkeypatch.setattr(output, "_TSV_CHUNK_ROWS", 3)
+    writes = []
+
+    class Recorder(io.StringIO):
+        def write(self, s):
+            writes.append(s)
+            return super().write(s)
+
+    output_tsv([make_offer(str(i), parameters=DELL) for i in range(7)], ["id"], file=Recorder())
+    # header + 7 rows in chunks of 3 lines
+    assert len(writes) == 3
+    assert "".join(writes).splitlines() == ["id"] + [str(i) for i in range(7)]
+
+
+def test_output_tsv_empty_iterable_writes_nothing():
+    buf = io.StringIO()
+    output_tsv(iter([]), ["id"], file=buf)
+    output_tsv(OfferBatch(), ["id"], file=buf)
+    assert buf.getvalue() == ""
+
+
+def test_output_text_small_result_keeps_rich_table():
+    from allegro_cli.output import output_text
+
+    buf = io.StringIO()
+    output_text([make_offer("1", parameters=DELL), make_offer("2", parameters=DELL)], ["id", "name"], file=buf)
+    assert "┃" in buf.getvalue()
+    assert "Offer 2" in buf.getvalue()
+
+
+def test_output_text_large_piped_result_streams_plain():
+    from allegro_cli.output import output_text
+
+    buf = io.StringIO()
+    written_before = []
+
+    def rows():
+        for i in range(1000):
+            if i == 500:
+                written_before.append(buf.getvalue().count("\n"))
+            yield make_offer(str(i), parameters=DELL)
+
+    output_text(rows(), ["id", "name"], file=buf)
+    lines = buf.getvalue().splitlines()
+    assert "┃" not in buf.getvalue()
+    assert lines[0].split() == ["id", "name"]
+    assert lines[1].startswith("---")
+    assert len(lines) == 1002
+    assert lines[-1].split() == ["999", "Offer", "999"]
+    # Sampled rows were already written while the rest was still being produced
+    assert written_before[0] >= 200
+
+
+def test_output_text_plain_truncates_wide_cells():
+    from allegro_cli.output import output_text
+
+    offer = make_offer("1", parameters=DELL)
+    offer.name = "x" * 200
+    buf = io.StringIO()
+    output_text([offer], ["id", "name"], file=buf, mode="plain")
+    row = buf.getvalue().splitlines()[2]
+    assert row.endswith("…")
+    assert len(row) < 80
+
+
+def test_output_msgpack_matches_json_layout():
+    pytest.importorskip("msgpack")
+    from allegro_cli.output import decode_msgpack, output_msgpack
+
+    offers = [make_offer("1", parameters=DELL), make_offer("2", parameters=DELL)]
+    text, binary = io.StringIO(), io.BytesIO()
+    output_json(offers, file=text)
+    output_msgpack(offers, file=binary)
+    assert decode_msgpack(binary.getvalue()) == json.loads(text.getvalue())
+    assert len(binary.getvalue()) < len(text.getvalue().encode())
@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+from allegro_cli.api.models import AllegroCliError, Price
+from allegro_cli.query import compile_query
+from tests.conftest import PagedSearchClient, make_offer, run_cli
+
+
+def _ids(offers):
+    return [o.id for o in offers]
+
+
+OFFERS = [
+    make_offer("a", "1299.00", seller="Komputronik", parameters={"Marka": "Dell"}),
+    make_offer("b", "99.90", seller="x-kom", name="Dysk SSD NVMe", parameters={"Marka": "Samsung"}),
+    make_offer("c", "250.00", seller="komputronik"),
+    make_offer("d", "", seller="x-kom", parameters={"Marka": "dell"}),
+]
+
+
+def test_price_is_parsed_once_into_minor_units():
+    assert Price(amount="1299.00").amountMinor == 129900
+    assert Price(amount="99.9").amountMinor == 9990
+    assert Price(amount="").amountMinor is None
+    assert Price(amount="12.50").to_dict()["amountMinor"] == 1250
+
+
+def test_price_bounds_compare_numerically():
+    assert _ids(compile_query(["price<=250"]).apply(OFFERS)) == ["b", "c"]
+    # "1299.00" < "250" as strings; Polish notation is accepted in bounds
+    assert _ids(compile_query(["price>250"]).apply(OFFERS)) == ["a"]
+    assert _ids(compile_query(["price>=1 299,00"]).apply(OFFERS)) == ["a"]
+
+
+def test_text_conditions_ignore_case():
+    assert _ids(compile_query(["seller=KOMPUTRONIK"]).apply(OFFERS)) == ["a", "c"]
+    assert _ids(compile_query(["param.Marka=dell"]).apply(OFFERS)) == ["a", "d"]
+    assert _ids(compile_query(["param.Marka!=dell"]).apply(OFFERS)) == ["b", "c"]
+    assert _ids(compile_query(["name~ssd|hdd"]).apply(OFFERS)) == ["b"]
+
+
+def test_conditions_are_anded():
+    query = compile_query(["seller=x-kom", "price<100"])
+    assert _ids(query.apply(OFFERS)) == ["b"]
+
+
+def test_order_by_puts_missing_values_last():
+    assert _ids(compile_query(order_by="price").apply(OFFERS)) == ["b", "c", "a", "d"]
+    assert _ids(compile_query(order_by="-price").apply(OFFERS)) == ["a", "c", "b", "d"]
+    # Ties on seller (case-insensitive) fall back to the second key
+    assert _ids(compile_query(order_by="seller,-price").apply(OFFERS)) == ["a", "c", "b", "d"]
+
+
+@pytest.mark.parametrize("where, order_by", [
+    (["colour=red"], None),
+    (["price<cheap"], None),
+    (["price~9"], None),
+    (["seller<abc"], None),
+    (["name~("], None),
+    (["no operator"], None),
+    (None, "-nope"),
+])
+def test_bad_expressions_raise(where, order_by):
+    with pytest.raises(AllegroCliError) as exc:
+        compile_query(where, order_by)
+    assert exc.value.code == "InvalidQueryException"
+
+
+def _search(argv, client):
+    return run_cli(["search", "x", *argv], client)
+
+
+def test_search_where_and_order_by(capsys):
+    client = PagedSearchClient([OFFERS[:2], OFFERS[2:]])
+    argv = ["--pages", "2", "--where", "price<1000", "--order-by=-price", "--format", "json", "--compact"]
+    assert _search(argv, client) == 0
+    assert [o["id"] for o in json.loads(capsys.readouterr().out)] == ["c", "b"]
+    assert client.fetched == 2
+
+
+def test_search_bad_where_fetches_nothing(capsys):
+    client = PagedSearchClient([OFFERS])
+    assert _search(["--where", "price<cheap"], client) == 1
+    assert "InvalidQueryException" in capsys.readouterr().err
+    assert client.fetched == 0
+
+
+def test_search_top_applies_where_first(capsys):
+    client = PagedSearchClient([OFFERS])
+    argv = ["--top", "1", "--where", "seller=komputronik", "--format", "json", "--compact"]
+    assert _search(argv, client) == 0
+    assert [o["id"] for o in json.loads(capsys.readouterr().out)] == ["c"]
+
+
+def test_search_top_order_by_keeps_early_stopping(capsys):
+    pages = [
+        [make_offer("a", "10"), make_offer("b", "20"), make_offer("c", "30")],
+        [make_offer("d", "40")],
+        [make_offer("e", "50")],
+    ]
+    client = PagedSearchClient(pages)
+    argv = ["--sort", "p", "--pages", "3", "--top", "2", "--order-by=-price", "--format", "json", "--compact"]
+    assert _search(argv, client) == 0
+    captured = capsys.readouterr()
+    assert [o["id"] for o in json.loads(captured.out)] == ["b", "a"]
+    assert "(stopped early)" in captured.err and client.fetched == 1
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from allegro_cli.api.models import RateLimitError
+from allegro_cli.saved import SEEN_RUN_STOP, run_saved
+from allegro_cli.state import StateStore
+from tests.conftest import PagedSearchClient, make_offer, run_cli
+
+
+def _events(argv, client, capsys):
+    assert run_cli(argv, client) == 0
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_add_stores_every_filter(capsys):
+    state = StateStore()
+    client = PagedSearchClient(state=state)
+    argv = ["saved", "add", "gpu", "rtx 4070", "--sort", "n", "--price-max", "2500",
+            "--condition", "used", "--filter", "pamiec=12 GB", "--pages", "3"]
+    assert run_cli(argv, client) == 0
+    assert capsys.readouterr().out.startswith("Saved gpu: rtx 4070")
+
+    params = state.saved_search("gpu")
+    assert params["phrase"] == "rtx 4070"
+    assert (params["sort"], params["price_max"], params["pages"]) == ("n", "2500", 3)
+    assert params["condition"] == ["used"] and params["filters"] == ["pamiec=12 GB"]
+
+    assert run_cli(["saved", "list", "--format", "json"], client) == 0
+    assert list(json.loads(capsys.readouterr().out)) == ["gpu"]
+
+
+def test_run_reports_new_and_repriced_only(capsys):
+    state = StateStore()
+    state.save_search("s", {"phrase": "x", "pages": 1})
+    client = PagedSearchClient([[make_offer("1"), make_offer("2")]], state=state)
+    argv = ["saved", "run", "s", "--format", "ndjson", "--compact"]
+
+    events = _events(argv, client, capsys)
+    assert [(e["change"], e["id"]) for e in events] == [("new", "1"), ("new", "2")]
+
+    assert _events(argv, client, capsys) == []
+
+    client.pages = [[make_offer("3"), make_offer("1", "8.00"), make_offer("2")]]
+    events = _events(argv, client, capsys)
+    assert [(e["change"], e["id"], e.get("before")) for e in events] == [
+        ("new", "3", None), ("price", "1", "9.99"),
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["json", "tsv", "ndjson"])
+def test_failed_run_marks_nothing_seen(fmt, capsys):
+    state = StateStore()
+    state.save_search("s", {"phrase": "x", "pages": 2})
+
+    class _Failing(PagedSearchClient):
+        def iter_search(self, **kwargs):
+            yield from [make_offer("1"), make_offer("2")]
+            raise RateLimitError("Too many requests (429)")
+
+    assert run_cli(["saved", "run", "s", "--format", fmt], _Failing(state=state)) == 1
+    assert state.seen_price("s", "1") is None and state.seen_price("s", "2") is None
+
+    client = PagedSearchClient([[make_offer("1"), make_offer("2")]], state=state)
+    events = list(run_saved(client, state, "s"))
+    assert [(change, offer.id) for change, offer, _ in events] == [("new", "1"), ("new", "2")]
+
+
+def test_closed_run_marks_what_was_yielded():
+    state = StateStore()
+    state.save_search("s", {"phrase": "x", "pages": 1})
+    client = PagedSearchClient([[make_offer("1"), make_offer("2")]], state=state)
+    events = run_saved(client, state, "s")
+    next(events)
+    events.close()
+    assert state.seen_price("s", "1") == "9.99"
+    assert state.seen_price("s", "2") is None
+
+
+def test_newest_first_stops_at_seen_offers():
+    state = StateStore()
+    state.save_search("s", {"phrase": "x", "sort": "n", "pages": 3})
+    old = [make_offer(str(i)) for i in range(100, 100 + SEEN_RUN_STOP + 2)]
+    client = PagedSearchClient([old], state=state)
+    list(run_saved(client, state, "s"))
+
+    # Two fresh offers, then the known ones: page 2 and 3 are never requested
+    client.pages = [[make_offer("1"), make_offer("2"), *old], [make_offer("900")], [make_offer("901")]]
+    client.fetched = 0
+    events = list(run_saved(client, state, "s"))
+    assert [offer.id for _, offer, _ in events] == ["1", "2"]
+    assert client.fetched == 1
+
+
+def test_unknown_saved_search(capsys):
+    client = PagedSearchClient(state=StateStore())
+    assert run_cli(["saved", "run", "nope"], client) == 1
+    assert json.loads(capsys.readouterr().err)["errors"][0]["code"] == "SavedSearchNotFoundException"
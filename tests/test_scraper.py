@@ -1,9 +1,14 @@
+import json
+
 from allegro_cli.scraper import (
     extract_lazy_contexts,
+    extract_price,
+    extract_seller_id,
     parse_next_page_url,
     parse_offer_page,
     parse_opbox_parameters,
     parse_search_results,
+    parse_search_results_into,
 )
 
 SAMPLE_HTML = """\
@@ -188,6 +193,22 @@ def test_parse_offer_page_with_explicit_id():
     assert offer.parameters == {}
 
 
+def test_extract_seller_id_from_embedded_json():
+    assert extract_seller_id('<script>{"sellerId":"4242"}</script>') == "4242"
+    assert extract_seller_id('{"seller":{"id":"77","login":"shop"}}') == "77"
+    assert extract_seller_id("<html></html>") == ""
+
+
+def test_extract_price_from_meta_tags():
+    html = (
+        '<meta content="PLN" property="product:price:currency">'
+        '<meta property="product:price:amount" content="19.99" />'
+        '<meta property="product:availability" content="in stock">'
+    )
+    assert extract_price(html) == {"amount": "19.99", "currency": "PLN", "availability": "in stock"}
+    assert extract_price("<html></html>") == {"amount": "", "currency": "", "availability": ""}
+
+
 def test_parse_offer_page_extracts_parameters_json():
     html = """\
 <html><head></head><body>
@@ -471,3 +492,42 @@ def test_parse_opbox_parameters_nested():
 def test_parse_opbox_parameters_empty():
     assert parse_opbox_parameters({}) == {}
     assert parse_opbox_parameters({"foo": "bar"}) == {}
+
+
+def test_parsed_parameter_keys_and_prices_are_interned():
+    html = """<html><head><meta property="product:price:amount" content="10.00" /></head>
+<body><h1>Item</h1>
+<script type="application/json" data-serialize-box-id="b">
+{"groups": [{"singleValueParams": [{"name": "Stan", "value": {"name": "Nowy"}}]}]}
+</script></body></html>"""
+    # Build the second page from fresh string objects
+    a = parse_offer_page(html, offer_id="1")
+    b = parse_offer_page("".join(list(html)), offer_id="2")
+    key_a = next(iter(a.parameters))
+    key_b = next(iter(b.parameters))
+    assert key_a == key_b == "Stan"
+    assert key_a is key_b
+    assert a.parameters["Stan"] is b.parameters["Stan"]
+    assert a.sellingMode.price.amount is b.sellingMode.price.amount
+
+
+def test_parse_search_results_into_fills_batch_from_embedded_json():
+    from allegro_cli.api.models import OfferBatch
+
+    data = {"props": {"pageProps": {"items": [
+        {"id": 1, "name": "A", "price": {"normal": {"amount": "9.99"}},
+         "images": [{"url": "a1.jpg"}, {"url": "a2.jpg"}], "seller": {"id": 7, "login": "shop"}},
+        {"id": 2, "title": "B", "price": "5"},
+        {"id": 3},
+    ]}}}
+    html = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data)}</script>'
+    batch = OfferBatch()
+    assert parse_search_results_into(html, batch) == 2
+    assert list(batch) == parse_search_results(html)
+    assert batch.images == [("a1.jpg", "a2.jpg"), ()]
+    assert batch.column("sellingMode.price.amountMinor") == [999, 500]
+
+    # Pages without embedded JSON use the HTML parser
+    html_batch = OfferBatch()
+    assert parse_search_results_into(SAMPLE_HTML, html_batch) == 3
+    assert html_batch.ids == ["12345678", "87654321", "11111111"]
@@ -0,0 +1,80 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.api.models import AllegroCliError, RateLimitError
+from allegro_cli.config import Config
+from benchmarks.standin import StandinOptions, StandinServer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _client(url: str) -> AllegroClient:
+    return AllegroClient(Config(cookies="session=test", edgeBaseUrl=url, scrapeBaseUrl=url))
+
+
+def test_standin_serves_pages_and_edge_api():
+    with StandinServer(FIXTURES) as server:
+        client = _client(server.base_url)
+
+        offers = client.scrape_search("laptop")
+        assert [o.name for o in offers] == ["Laptop Lenovo ThinkPad", "Laptop Dell XPS 15"]
+
+        offer = client.scrape_offer("12345678")
+        assert offer.sellingMode.price.amount == "4599.00"
+        assert offer.parameters["Procesor"] == "Intel Core i7-1365U"
+
+        assert client.get_packages_summary()["total"] == 2
+        assert client.get_packages_list()[0]["delivery"]["waybill"] == "123"
+        assert client.get_cart()["carts"][0]["id"] == "cart-1"
+        client.change_cart_quantity("12345678", 1, "99999")
+        client.remove_cart_item("uuid-1")
+
+    assert server.stats.by_route["listing"] == 1
+    assert server.stats.by_route["offer"] == 1
+    assert server.stats.by_route["GET /packages/summary"] == 1
+
+
+def test_standin_error_bursts_surface_as_rate_limit():
+    options = StandinOptions(burst_every=3, burst_length=2, burst_status=429)
+    with StandinServer(FIXTURES, options) as server:
+        client = _client(server.base_url)
+        client.get_packages_summary()  # requests 1-2: ok
+        client.get_packages_summary()
+        with pytest.raises(RateLimitError):
+            client.get_packages_summary()  # request 3: burst starts
+        with pytest.raises(RateLimitError):
+            client.scrape_search("laptop")  # request 4: still in burst
+        assert client.get_packages_summary()["total"] == 2
+
+    assert server.stats.errors_injected == 2
+
+
+def test_standin_injects_latency():
+    with StandinServer(FIXTURES, StandinOptions(latency=0.2)) as server:
+        client = _client(server.base_url)
+        t0 = time.monotonic()
+        client.get_packages_summary()
+        assert time.monotonic() - t0 >= 0.2
+
+
+def test_standin_unknown_edge_path_is_404():
+    with StandinServer(FIXTURES) as server:
+        client = _client(server.base_url)
+        with pytest.raises(AllegroCliError) as exc:
+            client._request("GET", "/non-existent")
+    assert exc.value.code == "ApiException"
+    assert "404" in exc.value.message
+
+
+def test_packages_summary_and_list_overlap():
+    with StandinServer(FIXTURES, StandinOptions(latency=0.3)) as server:
+        client = _client(server.base_url)
+        summary, packages = client.get_packages()
+
+    assert summary["total"] == 2
+    assert packages[0]["delivery"]["waybill"] == "123"
+    # Both requests were being answered at once: one round trip, not two
+    assert server.stats.max_in_flight == 2
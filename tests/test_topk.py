@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from allegro_cli.main import create_parser
+from allegro_cli.topk import top_k
+from tests.conftest import PagedSearchClient, make_offer, run_cli
+
+
+class _Pages:
+    """Lazily yields scripted pages and counts how many were fetched."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = 0
+
+    def __iter__(self):
+        for page in self.pages:
+            self.fetched += 1
+            yield page
+
+
+def _ids(offers):
+    return [o.id for o in offers]
+
+
+def test_sorted_listing_stops_once_nothing_better_can_follow():
+    pages = _Pages([
+        [make_offer("promo", "999.00"), make_offer("a", "9.00"), make_offer("b", "10.00")],
+        [make_offer("c", "10.00"), make_offer("d", "11.50")],
+        [make_offer("e", "12.00")],
+    ])
+    offers, report = top_k(pages, 3, sort="p")
+    # As strings "9.00" would sort after "10.00"
+    assert _ids(offers) == ["a", "b", "c"]
+    assert pages.fetched == 2
+    assert report.pagesFetched == 2 and report.stoppedEarly
+
+
+def test_descending_keeps_dearest():
+    pages = _Pages([[make_offer("a", "100.00"), make_offer("b", "90.00")], [make_offer("c", "80.00")]])
+    offers, report = top_k(pages, 2, sort="pd")
+    assert _ids(offers) == ["a", "b"]
+    assert pages.fetched == 1
+
+
+def test_unsorted_listing_scans_up_to_the_cap():
+    pages = _Pages([[make_offer(str(i), f"{100 - i}.00")] for i in range(10)])
+    offers, report = top_k(pages, 2, sort="m", page_cap=4)
+    assert _ids(offers) == ["3", "2"]
+    assert pages.fetched == 4
+    assert not report.stoppedEarly
+
+
+def test_skips_unpriced_and_duplicate_offers():
+    pages = _Pages([[make_offer("a", "5.00"), make_offer("x", "")], [make_offer("a", "5.00"), make_offer("b", "6.00")]])
+    offers, report = top_k(pages, 5, sort="m", page_cap=2)
+    assert _ids(offers) == ["a", "b"]
+    assert (report.unpriced, report.offersScanned) == (1, 2)
+
+
+def test_search_top_reports_pages(capsys):
+    client = PagedSearchClient([[make_offer("a", "20.00"), make_offer("b", "30.00")], [make_offer("c", "40.00")]])
+    assert run_cli(["search", "x", "--sort", "p", "--top", "1", "--format", "json"], client) == 0
+    captured = capsys.readouterr()
+    # Same document shape as a plain search; the report goes to stderr
+    assert [o["id"] for o in json.loads(captured.out)] == ["a"]
+    assert captured.err.strip() == "Top 1 of 2 offers from 1/5 pages (stopped early)"
+    assert client.kwargs["sort"] == "p"
+
+
+def test_search_top_honours_explicit_single_page(capsys):
+    client = PagedSearchClient([[make_offer("a", "20.00")], [make_offer("b", "10.00")]])
+    argv = ["search", "x", "--pages", "1", "--top", "1", "--format", "json", "--compact"]
+    assert run_cli(argv, client) == 0
+    captured = capsys.readouterr()
+    assert [o["id"] for o in json.loads(captured.out)] == ["a"]
+    assert client.kwargs["pages"] == 1 and "from 1/1 pages" in captured.err
+
+
+@pytest.mark.parametrize("k", ["0", "-1", "ten"])
+def test_top_must_be_positive(k, capsys):
+    with pytest.raises(SystemExit):
+        create_parser().parse_args(["search", "x", "--top", k])
+    assert "--top" in capsys.readouterr().err
@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from allegro_cli.api.client import AllegroClient
+from allegro_cli.api.models import (
+    AllegroCliError, AuthenticationError, OfferNotFoundError, RateLimitError, ScraperError,
+)
+from allegro_cli.config import Config
+from allegro_cli.state import StateStore
+from allegro_cli.watch import PriceWatch, history_rows, read_offer_ids
+from benchmarks.standin import StandinServer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class _PriceClient:
+    """check_price answers from a mutable table; a value may be an exception."""
+
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = []
+
+    def check_price(self, offer_id):
+        self.calls.append(offer_id)
+        value = self.prices[offer_id]
+        if isinstance(value, Exception):
+            raise value
+        amount, availability = value
+        return {"amount": amount, "currency": "PLN", "availability": availability}
+
+
+def test_read_offer_ids(tmp_path):
+    text = tmp_path / "ids.txt"
+    text.write_text("offer_id\n111, 222\n# paused: 333\n111\n")
+    assert read_offer_ids(str(text)) == ["111", "222"]
+
+    listing = tmp_path / "ids.json"
+    listing.write_text(json.dumps([{"offerId": "5"}, 6]))
+    assert read_offer_ids(str(listing)) == ["5", "6"]
+
+    with pytest.raises(AllegroCliError) as exc:
+        read_offer_ids(str(tmp_path / "missing.txt"))
+    assert exc.value.code == "WatchFileException"
+
+
+def test_events_only_on_change():
+    client = _PriceClient({"1": ("10.00", "in stock")})
+    events = []
+    watch = PriceWatch(client, StateStore(), emit=events.append)
+
+    watch.check("1")
+    watch.check("1")
+    client.prices["1"] = ("9.50", "in stock")
+    watch.check("1")
+    client.prices["1"] = OfferNotFoundError("1")
+    watch.check("1")
+
+    assert [e["change"] for e in events] == ["added", "changed", "changed"]
+    assert events[1]["before"] == {"amount": "10.00"}
+    assert events[2]["row"]["availability"] == "not found"
+    assert [r["amount"] for r in history_rows(watch.state, "1")] == ["10.00", "9.50", ""]
+
+
+def test_schedule_spreads_checks_and_backs_off():
+    client = _PriceClient({"1": ("1", ""), "2": ("2", ""), "3": RateLimitError("429"), "4": ("4", "")})
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(round(seconds, 6))
+        clock[0] += seconds
+
+    watch = PriceWatch(client, StateStore(), interval=60, rate=6, jitter=0)
+    with (
+        patch("allegro_cli.watch.time.monotonic", lambda: clock[0]),
+        patch("allegro_cli.watch.time.sleep", sleep),
+    ):
+        watch.run(["1", "2", "3", "4"], rounds=1)
+
+    # 4 offers spread over 60 s; the gap after the 429 doubles
+    assert sleeps == [15, 15, 30]
+    # The rate budget wins when it is the tighter limit
+    assert PriceWatch(client, watch.state, interval=60, rate=2).spacing(4) == 30
+    assert watch.rate_limited == 1
+    assert client.calls == ["1", "2", "3", "4"]
+
+
+def test_jitter_never_beats_the_rate_limit():
+    ids = [str(i) for i in range(50)]
+    client = _PriceClient({i: ("1", "") for i in ids})
+    clock = [0.0]
+    starts = []
+
+    def check_price(offer_id):
+        starts.append(clock[0])
+        return {"amount": "1", "currency": "PLN", "availability": ""}
+    client.check_price = check_price
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    # The rate (one check per 10 s) is the binding limit, jitter is +/-50 %
+    watch = PriceWatch(client, StateStore(), interval=60, rate=6, jitter=0.5)
+    with (
+        patch("allegro_cli.watch.time.monotonic", lambda: clock[0]),
+        patch("allegro_cli.watch.time.sleep", sleep),
+        patch("allegro_cli.watch.random.uniform", side_effect=[0.5, 1.5] * 25),
+    ):
+        watch.run(ids, rounds=1)
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 10
+    assert max(gaps) == 15
+
+
+def test_failed_checks_are_counted_and_the_watch_goes_on():
+    client = _PriceClient({
+        "1": AllegroCliError("API returned 502", code="ScrapeException"),
+        "2": ScraperError("no price"),
+        "3": httpx.ConnectError("connection reset"),
+        "4": ("4", ""),
+    })
+    events = []
+    watch = PriceWatch(client, StateStore(), interval=4, rate=600, jitter=0, emit=events.append)
+    with patch("allegro_cli.watch.time.sleep"):
+        watch.run(["1", "2", "3", "4"], rounds=2)
+
+    assert client.calls == ["1", "2", "3", "4"] * 2
+    assert [e["offer_id"] for e in events] == ["4"]
+    assert watch.failed == {"ScrapeException": 2, "ScraperException": 2, "ConnectError": 2}
+    assert watch.summary() == (
+        "2 checked, 0 rate-limited, 6 failed "
+        "(ScrapeException=2, ScraperException=2, ConnectError=2)"
+    )
+
+    # An expired session cannot recover by waiting
+    client.prices["1"] = AuthenticationError()
+    with pytest.raises(AuthenticationError), patch("allegro_cli.watch.time.sleep"):
+        watch.run(["1", "4"], rounds=1)
+
+
+def test_check_price_reads_only_the_offer_page():
+    with StandinServer(FIXTURES) as server:
+        client = AllegroClient(
+            Config(cookies="session=test", edgeBaseUrl=server.base_url, scrapeBaseUrl=server.base_url),
+        )
+        price = client.check_price("12345678")
+
+    assert price == {"amount": "4599.00", "currency": "PLN", "availability": ""}
+    assert server.stats.by_route == {"offer": 1}